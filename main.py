@@ -1,5 +1,13 @@
 import asyncio
 from src.bot import main as bot_main
 
+try:
+    import uvloop  # Optional faster event loop, not available on Windows
+except ImportError:
+    uvloop = None
+
 if __name__ == "__main__":
-    asyncio.run(bot_main())
+    if uvloop is not None:
+        uvloop.run(bot_main())
+    else:
+        asyncio.run(bot_main())
@@ -6,6 +6,7 @@ import matplotlib.patches as patches
 import seaborn as sns
 import pandas as pd
 import numpy as np
+import asyncio
 import tempfile
 import os
 from typing import Optional, Dict, List
@@ -73,7 +74,7 @@ class ChartGenerator:
             plt.tight_layout()
 
             # Save to temporary file
-            chart_path = self._save_chart(fig, "correlation_heatmap")
+            chart_path = await self._save_chart(fig, "correlation_heatmap")
 
             return chart_path
 
@@ -132,7 +133,7 @@ class ChartGenerator:
             plt.tight_layout()
 
             # Save to temporary file
-            chart_path = self._save_chart(fig, "pnl_chart")
+            chart_path = await self._save_chart(fig, "pnl_chart")
 
             return chart_path
 
@@ -195,7 +196,7 @@ class ChartGenerator:
             plt.tight_layout()
 
             # Save to temporary file
-            chart_path = self._save_chart(fig, "stress_test_chart")
+            chart_path = await self._save_chart(fig, "stress_test_chart")
 
             return chart_path
 
@@ -259,7 +260,7 @@ class ChartGenerator:
             plt.tight_layout()
 
             # Save to temporary file
-            chart_path = self._save_chart(fig, "risk_metrics_chart")
+            chart_path = await self._save_chart(fig, "risk_metrics_chart")
 
             return chart_path
 
@@ -372,7 +373,7 @@ class ChartGenerator:
                 )
 
             plt.tight_layout()
-            chart_path = self._save_chart(fig, "stress_test_comparison")
+            chart_path = await self._save_chart(fig, "stress_test_comparison")
             return chart_path
 
         except Exception as e:
@@ -461,7 +462,7 @@ class ChartGenerator:
                 ax.tick_params(axis="x", rotation=45)
 
             plt.tight_layout()
-            chart_path = self._save_chart(fig, "portfolio_performance")
+            chart_path = await self._save_chart(fig, "portfolio_performance")
             return chart_path
 
         except Exception as e:
@@ -535,16 +536,19 @@ class ChartGenerator:
             ax.legend()
 
             plt.tight_layout()
-            chart_path = self._save_chart(fig, "hedge_effectiveness")
+            chart_path = await self._save_chart(fig, "hedge_effectiveness")
             return chart_path
 
         except Exception as e:
             logger.error(f"Error generating hedge effectiveness chart: {e}")
             return None
 
-    def _save_chart(self, fig: plt.Figure, chart_type: str) -> str:
+    async def _save_chart(self, fig: plt.Figure, chart_type: str) -> str:
         """Save a matplotlib figure to a temporary file.
 
+        Rendering at 300 dpi is slow, so it runs in a worker thread to keep
+        the event loop responsive. Only this figure is used by that thread.
+
         Args:
             fig: Matplotlib figure to save
             chart_type: Type of chart for filename
@@ -559,8 +563,7 @@ class ChartGenerator:
             filepath = os.path.join(self.temp_dir, filename)
 
             # Save the figure
-            fig.savefig(filepath, dpi=300, bbox_inches="tight")
-            plt.close(fig)  # Close the figure to free memory
+            await asyncio.to_thread(fig.savefig, filepath, dpi=300, bbox_inches="tight")
 
             logger.info(f"Chart saved to: {filepath}")
             return filepath
@@ -568,6 +571,8 @@ class ChartGenerator:
         except Exception as e:
             logger.error(f"Error saving chart: {e}")
             return ""
+        finally:
+            plt.close(fig)  # Close the figure to free memory
 
     def cleanup_temp_files(self):
         """Clean up temporary chart files."""
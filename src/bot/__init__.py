@@ -1,7 +1,11 @@
 import os
 import asyncio
+import bisect
+import csv
+import io
 import aiohttp
-from telegram import Update
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
+from telegram.error import RetryAfter, TelegramError
 from telegram.ext import (
     Application,
     CommandHandler,
@@ -11,10 +15,18 @@ from telegram.ext import (
     filters,
 )
 from loguru import logger
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import heapq
+import itertools
 import json
 import logging
+import random
+import signal
 import time
+from types import SimpleNamespace
+from typing import Awaitable, BinaryIO, Callable, Literal, Optional
+from urllib.parse import urlparse
 
 from .keyboards import (
     get_main_menu,
@@ -26,12 +38,244 @@ from .keyboards import (
     get_hedge_menu,
 )
 from ..portfolio.state import Portfolio
-from ..util.env import get_telegram_token, validate_environment
+from ..util.env import (
+    get_telegram_token,
+    get_webhook_port,
+    get_webhook_secret,
+    get_webhook_url,
+    validate_environment,
+)
 from ..services.costing import costing_service
 from ..services.hedge import hedge_service
 from ..market_bus import MarketBus
 from ..exchanges.okx import OKXExchange
 from ..exchanges.deribit import DeribitExchange
+from ..exchanges.deribit_options import deribit_options
+
+# Row layout for the transaction history view
+_TX_ROW_TEMPLATE = "{i}. {emoji} {symbol} {qty} @ {price}{pnl}\n   {ts} | {ttype}\n\n"
+_TX_TYPE_EMOJI = {
+    "buy": "🟢",
+    "sell": "🔴",
+    "add": "➕",
+    "remove": "➖",
+    "hedge": "🛡️",
+}
+
+# Invariant "Back" rows of the option selection wizards
+_PROTECTIVE_PUT_BACK_ROW = [
+    InlineKeyboardButton("⬅️ Back", callback_data="hedge|protective_put|{}")
+]
+_PROTECTIVE_PUT_SELECT_BACK_ROW = [
+    InlineKeyboardButton("⬅️ Back", callback_data="hedge|protective_put_select|{}")
+]
+_COVERED_CALL_BACK_ROW = [
+    InlineKeyboardButton("⬅️ Back", callback_data="hedge|covered_call|{}")
+]
+_COVERED_CALL_SELECT_BACK_ROW = [
+    InlineKeyboardButton("⬅️ Back", callback_data="hedge|covered_call_select|{}")
+]
+_COLLAR_SELECT_BACK_ROW = [
+    InlineKeyboardButton("⬅️ Back", callback_data="hedge|collar_select|{}")
+]
+
+# Per-kind parameters of the shared "Select" strike/confirm steps
+_OPTION_SELECT_FLOWS = {
+    "P": {
+        "name": "protective_put",
+        "plural": "puts",
+        "back_row": _PROTECTIVE_PUT_SELECT_BACK_ROW,
+        "title": "🛡️ *Protective Put Hedge*",
+        "label": "Put",
+        "premium_label": "Cost",
+        "outcome": "This will protect your long position from downside risk.",
+        "target_ratio": 0.5,
+        "fallback_pct": 0.05,
+        "risk_factor": 0.15,
+    },
+    "C": {
+        "name": "covered_call",
+        "plural": "calls",
+        "back_row": _COVERED_CALL_SELECT_BACK_ROW,
+        "title": "📈 *Covered Call Hedge*",
+        "label": "Call",
+        "premium_label": "Income",
+        "outcome": "This will generate income while limiting upside potential.",
+        "target_ratio": 0.7,
+        "fallback_pct": 0.03,
+        "risk_factor": 0.08,
+    },
+}
+
+# Static "Select / Automatic" menus of the option hedge wizards
+_PROTECTIVE_PUT_MENU_MARKUP = InlineKeyboardMarkup(
+    [
+        [
+            InlineKeyboardButton(
+                "🔍 Select", callback_data="hedge|protective_put_select|{}"
+            ),
+            InlineKeyboardButton(
+                "⚡ Automatic", callback_data="hedge|protective_put_auto|{}"
+            ),
+        ],
+        [InlineKeyboardButton("⬅️ Back", callback_data="back")],
+    ]
+)
+_COVERED_CALL_MENU_MARKUP = InlineKeyboardMarkup(
+    [
+        [
+            InlineKeyboardButton(
+                "🔍 Select", callback_data="hedge|covered_call_select|{}"
+            ),
+            InlineKeyboardButton(
+                "⚡ Automatic", callback_data="hedge|covered_call_auto|{}"
+            ),
+        ],
+        [InlineKeyboardButton("⬅️ Back", callback_data="back")],
+    ]
+)
+_COLLAR_MENU_MARKUP = InlineKeyboardMarkup(
+    [
+        [
+            InlineKeyboardButton("🔍 Select", callback_data="hedge|collar_select|{}"),
+            InlineKeyboardButton("⚡ Automatic", callback_data="hedge|collar_auto|{}"),
+        ],
+        [InlineKeyboardButton("⬅️ Back", callback_data="back")],
+    ]
+)
+
+# Long/short picker of the Add Future wizard
+_FUTURE_DIRECTION_MARKUP = InlineKeyboardMarkup(
+    [
+        [
+            InlineKeyboardButton(
+                "🟢 Long",
+                callback_data=encode_callback_data(
+                    "portfolio", "direction", {"direction": "long"}
+                ),
+            ),
+            InlineKeyboardButton(
+                "🔴 Short",
+                callback_data=encode_callback_data(
+                    "portfolio", "direction", {"direction": "short"}
+                ),
+            ),
+        ],
+        [InlineKeyboardButton("🔙 Back", callback_data="back")],
+    ]
+)
+
+# Editable risk metrics: callback metric -> risk_config key, and input prompts
+_RISK_CONFIG_KEYS = {
+    "delta": "abs_delta",
+    "var": "var_95",
+    "drawdown": "max_drawdown",
+}
+_RISK_CONFIG_PROMPTS = {
+    "delta": "Enter new *absolute delta* threshold (BTC):",
+    "var": "Enter new *95% VaR* threshold (USD):",
+    "drawdown": "Enter new *max drawdown* (as decimal, e.g. 0.15 for 15%):",
+}
+
+# Characters that legacy Markdown treats as entity markers
+_MARKDOWN_ESCAPES = str.maketrans({c: "\\" + c for c in "_*`["})
+
+
+def _escape_markdown(text: str) -> str:
+    """Escape user-facing values interpolated into Markdown messages."""
+    return text.translate(_MARKDOWN_ESCAPES)
+
+
+@dataclass(slots=True)
+class PendingTrade:
+    """A previewed portfolio trade awaiting the user's confirmation."""
+
+    action_type: Literal["add", "remove"]
+    symbol: str
+    qty: float
+    price: float
+    instrument_type: str
+    exchange: str
+
+
+def _as_posview(pos):
+    """Give a position attribute access whether it is an object or a dict.
+
+    Args:
+        pos: Position object, or a dict with the same fields
+
+    Returns:
+        The position itself, or a namespace over the dict's fields
+    """
+    if isinstance(pos, dict):
+        return SimpleNamespace(
+            symbol=pos.get("symbol"),
+            qty=pos.get("qty"),
+            avg_px=pos.get("avg_px"),
+            instrument_type=pos.get("instrument_type"),
+        )
+    return pos
+
+
+def _nearest_first(strikes, center, lo, hi):
+    """Yield ``strikes[lo:hi]`` ordered by distance from ``center``.
+
+    Walks outwards from the insertion point of ``center``, so only the
+    strikes actually consumed are visited.
+
+    Args:
+        strikes: Strikes sorted from lowest to highest
+        center: Reference price
+        lo: First index of the range to walk
+        hi: Index past the end of the range to walk
+
+    Yields:
+        Strikes, nearest first; ties go to the lower strike
+    """
+    right = min(max(bisect.bisect_left(strikes, center), lo), hi)
+    left = right - 1
+    while left >= lo or right < hi:
+        if right >= hi or (
+            left >= lo and center - strikes[left] <= strikes[right] - center
+        ):
+            yield strikes[left]
+            left -= 1
+        else:
+            yield strikes[right]
+            right += 1
+
+
+def _pick_strikes(strikes, center, lo_off, hi_off, n=5):
+    """Pick the strikes nearest a reference price, preferring a band.
+
+    Args:
+        strikes: Strikes sorted from lowest to highest
+        center: Reference price, usually the current BTC price
+        lo_off: Offset of the band's lower edge from ``center``
+        hi_off: Offset of the band's upper edge from ``center``
+        n: Number of strikes to pick
+
+    Returns:
+        Up to ``n`` strikes sorted from lowest to highest: the ones nearest
+        ``center`` within ``[center + lo_off, center + hi_off]``, topped up
+        with the nearest strikes outside the band
+    """
+    lo = bisect.bisect_left(strikes, center + lo_off)
+    hi = bisect.bisect_right(strikes, center + hi_off)
+    picked = list(itertools.islice(_nearest_first(strikes, center, lo, hi), n))
+
+    # If we don't have enough strikes, add the nearest ones outside the band
+    if len(picked) < n:
+        seen = set(picked)
+        for strike in _nearest_first(strikes, center, 0, len(strikes)):
+            if len(picked) >= n:
+                break
+            if strike not in seen:
+                seen.add(strike)
+                picked.append(strike)
+
+    picked.sort()
+    return picked
 
 
 class SpotHedgerBot:
@@ -40,6 +284,8 @@ class SpotHedgerBot:
     def __init__(self):
         self.application = None
         self.token = get_telegram_token()
+        self.webhook_url = get_webhook_url()  # None means long polling
+        self.http = None  # Shared aiohttp session, see _get_http
         self.portfolio = Portfolio()  # Add portfolio instance
         self.market_bus = MarketBus()  # Add market data bus
 
@@ -47,8 +293,12 @@ class SpotHedgerBot:
         self.okx_fetcher = OKXExchange()
         self.deribit_fetcher = DeribitExchange()
 
-        # Track active hedges
-        self.active_hedges = []
+        # Track active hedges, plus their identity keys for duplicate checks.
+        # Hedges are keyed by a monotonically increasing id, so removal is
+        # O(1) and button payloads stay valid after other removals
+        self.active_hedges = {}
+        self._next_hedge_id = 0
+        self._active_hedge_keys = set()
 
         # Add risk config state (in-memory for now)
         self.risk_config = {
@@ -62,24 +312,93 @@ class SpotHedgerBot:
             "var_95": False,
             "max_drawdown": False,
         }
+        self.last_user_id = None  # Alert recipient fallback, set by /start
         self.risk_watcher_task = None
         self.risk_watcher_interval = 20  # seconds
+        self.risk_watcher_idle_interval = 60  # seconds; no open positions
+        self.risk_watcher_alert_interval = 5  # seconds; a threshold is breached
+
+        # Recently fetched prices: symbol -> (monotonic timestamp, price)
+        self.price_cache = {}
+        self.price_cache_ttl = 3.0  # seconds; spans a wizard step transition
+        self._price_locks = {}  # symbol -> asyncio.Lock for concurrent misses
+        # Prices prefetched when a wizard asks for a quantity
+        self.wizard_price_ttl = 5.0  # seconds
+
+        # Bound concurrent Deribit ticker requests and their latency
+        self.ticker_semaphore = asyncio.Semaphore(8)
+        self.ticker_timeout = 3.0  # seconds
+
+        # Retries of a message edit after Telegram flood control (HTTP 429)
+        self.max_flood_retries = 3
+
+        # Callback routing tables: plain menu buttons and encoded flows
+        self._menu_routes = {
+            "portfolio": self.show_portfolio,
+            "hedge": self.show_hedge_menu,
+            "analytics": self.show_analytics,
+            "transactions": self.show_transactions,
+            "risk_config": self.show_risk_config,
+            "back": self.show_main_menu,
+        }
+        self._flow_routes = {
+            "portfolio": self.handle_portfolio_callback,
+            "hedge": self.handle_hedge_callback,
+            "analytics": self.handle_analytics_callback,
+            "risk_config": self.handle_risk_config_callback,
+        }
 
         if not self.token:
             raise ValueError("Telegram token not found in environment")
 
     async def get_current_price(self, symbol: str) -> float:
-        """Get current price for a symbol from market data."""
+        """Get current price for a symbol from market data.
+
+        Live prices are reused for ``price_cache_ttl`` seconds; fallback
+        prices are never cached. Concurrent misses for the same symbol share
+        a single upstream request.
+        """
+        cached = self.price_cache.get(symbol)
+        if cached and time.monotonic() - cached[0] < self.price_cache_ttl:
+            return cached[1]
+
+        lock = self._price_locks.setdefault(symbol, asyncio.Lock())
+        async with lock:
+            # Another caller may have refreshed the price while we waited
+            cached = self.price_cache.get(symbol)
+            if cached and time.monotonic() - cached[0] < self.price_cache_ttl:
+                return cached[1]
+            return await self._fetch_current_price(symbol)
+
+    async def get_current_prices(self, symbols: list) -> dict:
+        """Get current prices for several symbols at once.
+
+        Unique symbols are fetched concurrently through ``get_current_price``,
+        so cached prices are reused and the results warm the cache for the
+        single-symbol handlers.
+
+        Args:
+            symbols: Symbols to price
+
+        Returns:
+            Mapping of symbol to current price
+        """
+        unique = list(dict.fromkeys(symbols))
+        prices = await asyncio.gather(*(self.get_current_price(s) for s in unique))
+        return dict(zip(unique, prices))
+
+    async def _fetch_current_price(self, symbol: str) -> float:
+        """Fetch the current price for a symbol, caching live prices."""
         try:
             # Map symbols to exchange and instrument
-            if "SPOT" in symbol:
-                # Use OKX for spot
+            if "SPOT" in symbol or "PERP" in symbol:
+                # Use OKX for spot and perpetuals
                 ticker = await self.okx_fetcher.get_ticker(symbol)
-                return float(ticker.last_price) if ticker else 108000.0
-            elif "PERP" in symbol:
-                # Use OKX for perpetuals
-                ticker = await self.okx_fetcher.get_ticker(symbol)
-                return float(ticker.last_price) if ticker else 107950.0
+                if not ticker:
+                    return 108000.0 if "SPOT" in symbol else 107950.0
+                price = float(ticker.last_price)
+                self.price_cache[symbol] = (time.monotonic(), price)
+                return price
             else:
                 # Default fallback
                 return 108000.0
@@ -93,6 +412,144 @@ class SpotHedgerBot:
             else:
                 return 108000.0
 
+    def _get_http(self) -> aiohttp.ClientSession:
+        """Get the HTTP session shared by all direct API calls.
+
+        Reusing one session keeps connections alive between callbacks
+        instead of paying a new TCP and TLS handshake for every request.
+        """
+        if self.http is None or self.http.closed:
+            self.http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300)
+            )
+        return self.http
+
+    async def _safe_edit(self, query, *args, **kwargs):
+        """Edit a callback query's message, backing off on flood control.
+
+        When Telegram answers with ``RetryAfter``, wait the requested time
+        plus a little jitter and try again, up to ``max_flood_retries`` times.
+        """
+        for attempt in range(self.max_flood_retries + 1):
+            try:
+                return await query.edit_message_text(*args, **kwargs)
+            except RetryAfter as e:
+                if attempt == self.max_flood_retries:
+                    raise
+                delay = e.retry_after
+                if isinstance(delay, timedelta):
+                    delay = delay.total_seconds()
+                logger.warning("Flood control hit, retrying message edit in {}s", delay)
+                await asyncio.sleep(delay + random.uniform(0, 0.5))
+
+    def _prefetch_wizard_price(self, wizard: dict) -> None:
+        """Start fetching the wizard symbol's price while the user types.
+
+        Args:
+            wizard: Wizard state from ``context.user_data``
+        """
+        data = wizard["data"]
+        data["price_task"] = asyncio.create_task(self.get_current_price(data["symbol"]))
+        data["fetched_at"] = time.monotonic()
+
+    async def _wizard_price(self, wizard: dict) -> float:
+        """Get the wizard symbol's price, reusing a fresh prefetched quote.
+
+        Args:
+            wizard: Wizard state from ``context.user_data``
+
+        Returns:
+            Current price of the wizard's symbol
+        """
+        data = wizard["data"]
+        task = data.get("price_task")
+        if task and time.monotonic() - data["fetched_at"] < self.wizard_price_ttl:
+            return await task
+        return await self.get_current_price(data["symbol"])
+
+    async def fetch_option_tickers(
+        self,
+        symbols: list,
+        on_progress: Optional[Callable[[int, int], Awaitable[None]]] = None,
+    ) -> list:
+        """Fetch Deribit option tickers concurrently.
+
+        Requests that take longer than ``ticker_timeout`` are dropped, so one
+        slow response cannot stall the whole batch.
+
+        Args:
+            symbols: Options symbols to fetch
+            on_progress: Optional coroutine called with (completed, total)
+                once the requests are started and after each one finishes
+
+        Returns:
+            List of OptionContract objects that were fetched successfully,
+            in the order of ``symbols``
+        """
+
+        async def fetch(index, symbol):
+            try:
+                async with self.ticker_semaphore:
+                    return index, await asyncio.wait_for(
+                        deribit_options.get_option_ticker(symbol),
+                        self.ticker_timeout,
+                    )
+            except Exception:
+                return index, None
+
+        tickers = [None] * len(symbols)
+        pending = [
+            asyncio.create_task(fetch(index, symbol))
+            for index, symbol in enumerate(symbols)
+        ]
+        try:
+            if on_progress:
+                await on_progress(0, len(symbols))
+            for completed, next_done in enumerate(asyncio.as_completed(pending), 1):
+                index, ticker = await next_done
+                tickers[index] = ticker
+                if on_progress:
+                    await on_progress(completed, len(symbols))
+        finally:
+            for task in pending:
+                task.cancel()
+        return [t for t in tickers if t]
+
+    @staticmethod
+    def _hedge_key(hedge: dict) -> tuple:
+        """Get the identity of a hedge used to reject duplicates.
+
+        Args:
+            hedge: Pending or active hedge entry
+
+        Returns:
+            Tuple of the hedge's type, symbol, quantity, price and exchange
+        """
+        return (
+            hedge.get("type"),
+            hedge.get("symbol"),
+            hedge.get("qty"),
+            hedge.get("price"),
+            hedge.get("exchange"),
+        )
+
+    @staticmethod
+    def _effective_price(ticker, fallback_pct: float) -> float:
+        """Get the price to trade an option at.
+
+        Uses the mid price, then the last price when bid/ask are 0, and
+        finally a fixed share of the strike when neither is available.
+
+        Args:
+            ticker: OptionContract to price
+            fallback_pct: Share of the strike used as a last resort
+
+        Returns:
+            Option price
+        """
+        price = ticker.mid_price if ticker.mid_price > 0 else ticker.last_price
+        return price if price > 0 else ticker.strike * fallback_pct
+
     async def start(self):
         """Start the bot application."""
         logger.info("Starting Spot Hedger Bot...")
@@ -100,9 +557,15 @@ class SpotHedgerBot:
         # Initialize exchange sessions
         await self.okx_fetcher.__aenter__()
         await self.deribit_fetcher.__aenter__()
-
-        # Create application
-        self.application = Application.builder().token(self.token).build()
+        # Keep the options client's session open between callbacks
+        await deribit_options.__aenter__()
+
+        # Create application. Updates are handled concurrently so one user's
+        # slow exchange call does not queue everyone else's callbacks. Shared
+        # state (portfolio, active_hedges) is only mutated between awaits
+        self.application = (
+            Application.builder().token(self.token).concurrent_updates(True).build()
+        )
 
         # Add handlers
         self.application.add_handler(CommandHandler("start", self.start_command))
@@ -115,7 +578,25 @@ class SpotHedgerBot:
         # Start the bot
         await self.application.initialize()
         await self.application.start()
-        await self.application.updater.start_polling()
+        # Only subscribe to the update types the handlers above consume
+        allowed_updates = [Update.MESSAGE, Update.CALLBACK_QUERY]
+        if self.webhook_url:
+            # Telegram pushes each update to us; no getUpdates long poll.
+            # Requests without the secret token header are rejected
+            await self.application.updater.start_webhook(
+                listen="0.0.0.0",
+                port=get_webhook_port(),
+                url_path=urlparse(self.webhook_url).path,
+                webhook_url=self.webhook_url,
+                secret_token=get_webhook_secret(),
+                allowed_updates=allowed_updates,
+            )
+        else:
+            # The updater acknowledges the last offset on stop(), so a
+            # restart does not receive already handled updates again
+            await self.application.updater.start_polling(
+                allowed_updates=allowed_updates
+            )
 
         logger.info("Bot started successfully!")
 
@@ -126,12 +607,17 @@ class SpotHedgerBot:
         """Stop the bot application."""
         if self.application:
             await self.application.updater.stop()
+            if self.webhook_url:
+                await self.application.bot.delete_webhook()
             await self.application.stop()
             await self.application.shutdown()
 
             # Close exchange sessions
             await self.okx_fetcher.__aexit__(None, None, None)
             await self.deribit_fetcher.__aexit__(None, None, None)
+            await deribit_options.__aexit__(None, None, None)
+            if self.http:
+                await self.http.close()
 
             logger.info("Bot stopped.")
 
@@ -147,7 +633,7 @@ class SpotHedgerBot:
         """Background task: periodically check risk metrics and alert if breached."""
         while True:
             try:
-                await asyncio.sleep(self.risk_watcher_interval)
+                await asyncio.sleep(self._next_risk_interval())
                 await self.check_risk_metrics_and_alert()
             except asyncio.CancelledError:
                 break
@@ -155,45 +641,42 @@ class SpotHedgerBot:
                 logger = logging.getLogger(__name__)
                 logger.error(f"[risk_watcher] Error: {e}")
 
+    def _next_risk_interval(self) -> float:
+        """Pick the risk watcher's next sleep from the current portfolio state.
+
+        Polls rarely while there is nothing to watch and quickly while a
+        threshold is breached, so recoveries and new breaches show up fast.
+        """
+        if not self.portfolio.positions:
+            return self.risk_watcher_idle_interval
+        if any(self.risk_alert_state.values()):
+            return self.risk_watcher_alert_interval
+        return self.risk_watcher_interval
+
     async def check_risk_metrics_and_alert(self):
         """Check risk metrics and send Telegram alerts if thresholds are breached."""
+        # Nothing is exposed without positions; re-arm alerts for the next ones
+        if not self.portfolio.positions:
+            for metric in self.risk_alert_state:
+                self.risk_alert_state[metric] = False
+            return
+
         # Only alert the main user (first user who started the bot)
         # You can expand this to multi-user if needed
-        user_id = None
-        if (
-            hasattr(self, "application")
-            and self.application
-            and self.application.bot_data.get("main_user_id")
-        ):
-            user_id = self.application.bot_data["main_user_id"]
-        elif hasattr(self, "last_user_id"):
-            user_id = self.last_user_id
-        # Fallback: try to get from portfolio or context
-        if (
-            not user_id
-            and hasattr(self, "portfolio")
-            and hasattr(self.portfolio, "user_id")
-        ):
-            user_id = self.portfolio.user_id
+        bot_data = self.application.bot_data if self.application else {}
+        user_id = (
+            bot_data.get("main_user_id")
+            or self.last_user_id
+            # Fallback: try to get from portfolio
+            or getattr(self.portfolio, "user_id", None)
+        )
         if not user_id:
             return  # No user to alert
 
         # Get current risk metrics
-        delta = (
-            self.portfolio.get_total_delta()
-            if hasattr(self.portfolio, "get_total_delta")
-            else 0.0
-        )
-        var_95 = (
-            self.portfolio.get_var_95()
-            if hasattr(self.portfolio, "get_var_95")
-            else 0.0
-        )
-        drawdown = (
-            self.portfolio.get_max_drawdown()
-            if hasattr(self.portfolio, "get_max_drawdown")
-            else 0.0
-        )
+        delta = self.portfolio.get_total_delta()
+        var_95 = self.portfolio.get_var_95()
+        drawdown = self.portfolio.get_max_drawdown()
         cfg = self.risk_config
         alerts = []
         # Check delta
@@ -237,7 +720,7 @@ class SpotHedgerBot:
     async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /start command."""
         user = update.effective_user
-        logger.info(f"User {user.id} started the bot")
+        logger.info("User {} started the bot", user.id)
 
         welcome_text = (
             f"🤖 Welcome to Spot Hedger Bot, {user.first_name}!\n\n"
@@ -247,30 +730,26 @@ class SpotHedgerBot:
 
         await update.message.reply_text(welcome_text, reply_markup=get_main_menu())
 
-        if hasattr(self, "application") and self.application:
+        if self.application:
             self.application.bot_data["main_user_id"] = user.id
         self.last_user_id = user.id
 
     async def report_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /report command - generate and send CSV report."""
         user = update.effective_user
-        logger.info(f"User {user.id} requested report")
+        logger.info("User {} requested report", user.id)
 
         try:
             # Generate CSV report
-            csv_data = await self.generate_transaction_report()
+            csv_file = await self.generate_transaction_report()
 
-            if not csv_data:
+            if csv_file is None:
                 await update.message.reply_text(
                     "❌ No transaction data available to generate report.",
                     parse_mode="Markdown",
                 )
                 return
 
-            # Create CSV file
-            import io
-
-            csv_file = io.BytesIO(csv_data.encode("utf-8"))
             csv_file.name = (
                 f"transaction_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
             )
@@ -284,29 +763,32 @@ class SpotHedgerBot:
             )
 
         except Exception as e:
-            logger.error(f"Error generating report: {e}")
+            logger.error("Error generating report: {}", e)
             await update.message.reply_text(
                 "❌ Failed to generate report. Please try again later.",
                 parse_mode="Markdown",
             )
 
-    async def generate_transaction_report(self) -> str:
+    async def generate_transaction_report(self) -> Optional[BinaryIO]:
         """Generate CSV report of transaction history.
 
+        The CSV is encoded straight into a bytes buffer that can be sent as
+        a document without another copy.
+
         Returns:
-            CSV string with transaction data
+            UTF-8 CSV file positioned at its start, or None without transactions
         """
-        import csv
-        import io
-
         # Get transaction history
         transactions = self.portfolio.get_transaction_history()
 
         if not transactions:
-            return ""
+            return None
 
         # Create CSV output
-        output = io.StringIO()
+        report = io.BytesIO()
+        output = io.TextIOWrapper(
+            report, encoding="utf-8", newline="", write_through=True
+        )
         writer = csv.writer(output)
 
         # Write header
@@ -334,7 +816,7 @@ class SpotHedgerBot:
             writer.writerow(
                 [
                     tx.id,
-                    tx.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
+                    tx.timestamp.isoformat(sep=" ", timespec="seconds"),
                     tx.symbol,
                     tx.transaction_type.upper(),
                     f"{tx.qty:+.6f}",
@@ -368,34 +850,45 @@ class SpotHedgerBot:
         if self.portfolio.positions:
             output.write(f"\nCURRENT POSITIONS\n")
             output.write("=" * 50 + "\n")
-            output.write("Symbol,Quantity,Avg Price,Notional,Direction\n")
+            writer.writerow(
+                ["Symbol", "Quantity", "Avg Price", "Notional", "Direction"]
+            )
 
-            for symbol, pos in self.portfolio.positions.items():
-                direction = "LONG" if pos.is_long else "SHORT"
-                notional = abs(pos.qty * pos.avg_px)
-                output.write(
-                    f"{pos.symbol},{pos.qty:+.6f},${pos.avg_px:.4f},${notional:,.2f},{direction}\n"
+            for pos in self.portfolio.positions.values():
+                writer.writerow(
+                    [
+                        pos.symbol,
+                        f"{pos.qty:+.6f}",
+                        f"${pos.avg_px:.4f}",
+                        f"${abs(pos.qty * pos.avg_px):,.2f}",
+                        "LONG" if pos.is_long else "SHORT",
+                    ]
                 )
 
         # Add active hedges if any
         if hasattr(self, "active_hedges") and self.active_hedges:
             output.write(f"\nACTIVE HEDGES\n")
             output.write("=" * 50 + "\n")
-            output.write("Type,Symbol,Quantity,Price,Cost,Timestamp\n")
-
-            for hedge in self.active_hedges:
-                hedge_type = hedge.get("type", "unknown")
-                symbol = hedge.get("symbol", "")
-                qty = hedge.get("qty", 0)
-                price = hedge.get("price", 0)
-                cost = hedge.get("cost", 0)
-                timestamp = hedge.get("timestamp", "")
+            writer.writerow(
+                ["Type", "Symbol", "Quantity", "Price", "Cost", "Timestamp"]
+            )
 
-                output.write(
-                    f"{hedge_type},{symbol},{qty:+.6f},${price:.4f},${cost:.2f},{timestamp}\n"
+            for hedge in self.active_hedges.values():
+                writer.writerow(
+                    [
+                        hedge.get("type", "unknown"),
+                        hedge.get("symbol", ""),
+                        f"{hedge.get('qty', 0):+.6f}",
+                        f"${hedge.get('price', 0):.4f}",
+                        f"${hedge.get('cost', 0):.2f}",
+                        hedge.get("timestamp", ""),
+                    ]
                 )
 
-        return output.getvalue()
+        # Detach so closing the text wrapper cannot close the buffer
+        output.detach()
+        report.seek(0)
+        return report
 
     async def handle_callback(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle callback queries from inline keyboards."""
@@ -403,21 +896,12 @@ class SpotHedgerBot:
         await query.answer()
 
         data = query.data
-        logger.info(f"Callback received: {data}")
+        logger.info("Callback received: {}", data)
 
-        # Parse callback data
-        if data == "portfolio":
-            await self.show_portfolio(update, context)
-        elif data == "hedge":
-            await self.show_hedge_menu(update, context)
-        elif data == "analytics":
-            await self.show_analytics(update, context)
-        elif data == "transactions":
-            await self.show_transactions(update, context)
-        elif data == "risk_config":
-            await self.show_risk_config(update, context)
-        elif data == "back":
-            await self.show_main_menu(update, context)
+        # Plain menu buttons map straight to a handler
+        handler = self._menu_routes.get(data)
+        if handler:
+            await handler(update, context)
         else:
             # Handle encoded callback data
             flow, step, callback_data = decode_callback_data(data)
@@ -434,16 +918,11 @@ class SpotHedgerBot:
         data: dict,
     ):
         """Handle encoded callback data."""
-        if flow == "portfolio":
-            await self.handle_portfolio_callback(update, context, step, data)
-        elif flow == "hedge":
-            await self.handle_hedge_callback(update, context, step, data)
-        elif flow == "analytics":
-            await self.handle_analytics_callback(update, context, step, data)
-        elif flow == "risk_config":
-            await self.handle_risk_config_callback(update, context, step, data)
+        handler = self._flow_routes.get(flow)
+        if handler:
+            await handler(update, context, step, data)
         else:
-            await update.callback_query.edit_message_text("Unknown flow.")
+            await self._safe_edit(update.callback_query, "Unknown flow.")
 
     async def handle_portfolio_callback(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE, step: str, data: dict
@@ -454,7 +933,7 @@ class SpotHedgerBot:
         elif step == "remove_spot":
             # Check if we have data (specific position selected) or not (initial menu)
             if data.get("symbol"):
-                await self.handle_remove_spot(update, context, data)
+                await self.handle_remove_position(update, context, data)
             else:
                 await self.start_remove_spot_wizard(update, context)
         elif step == "add_future":
@@ -462,7 +941,7 @@ class SpotHedgerBot:
         elif step == "remove_future":
             # Check if we have data (specific position selected) or not (initial menu)
             if data.get("symbol"):
-                await self.handle_remove_future(update, context, data)
+                await self.handle_remove_position(update, context, data)
             else:
                 await self.start_remove_future_wizard(update, context)
         elif step == "refresh":
@@ -474,7 +953,7 @@ class SpotHedgerBot:
         elif step == "direction":
             await self.handle_future_direction(update, context, data)
         else:
-            await update.callback_query.edit_message_text("Unknown portfolio action.")
+            await self._safe_edit(update.callback_query, "Unknown portfolio action.")
 
     async def start_add_spot_wizard(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
@@ -492,6 +971,7 @@ class SpotHedgerBot:
                 "exchange": "OKX",
             },
         }
+        self._prefetch_wizard_price(context.user_data["wizard"])
 
         text = (
             "➕ *Add Spot Position*\n\n"
@@ -500,8 +980,8 @@ class SpotHedgerBot:
             "Example: `5.0` for 5 BTC"
         )
 
-        await query.edit_message_text(
-            text, reply_markup=get_back_button(), parse_mode="Markdown"
+        await self._safe_edit(
+            query, text, reply_markup=get_back_button(), parse_mode="Markdown"
         )
 
     async def start_add_future_wizard(
@@ -530,30 +1010,8 @@ class SpotHedgerBot:
             "Example: `5.0` for 5 BTC"
         )
 
-        keyboard = [
-            [
-                {
-                    "text": "🟢 Long",
-                    "callback_data": encode_callback_data(
-                        "portfolio", "direction", {"direction": "long"}
-                    ),
-                },
-                {
-                    "text": "🔴 Short",
-                    "callback_data": encode_callback_data(
-                        "portfolio", "direction", {"direction": "short"}
-                    ),
-                },
-            ],
-            [{"text": "🔙 Back", "callback_data": "back"}],
-        ]
-
-        from telegram import InlineKeyboardButton, InlineKeyboardMarkup
-
-        reply_markup = InlineKeyboardMarkup(keyboard)
-
-        await query.edit_message_text(
-            text, reply_markup=reply_markup, parse_mode="Markdown"
+        await self._safe_edit(
+            query, text, reply_markup=_FUTURE_DIRECTION_MARKUP, parse_mode="Markdown"
         )
 
     async def start_remove_spot_wizard(
@@ -573,8 +1031,8 @@ class SpotHedgerBot:
             text = (
                 "❌ *No Spot Positions*\n\nYou don't have any spot positions to remove."
             )
-            await query.edit_message_text(
-                text, reply_markup=get_back_button(), parse_mode="Markdown"
+            await self._safe_edit(
+                query, text, reply_markup=get_back_button(), parse_mode="Markdown"
             )
             return
 
@@ -598,15 +1056,13 @@ class SpotHedgerBot:
 
         keyboard.append([{"text": "🔙 Back", "callback_data": "back"}])
 
-        from telegram import InlineKeyboardButton, InlineKeyboardMarkup
-
         reply_markup = InlineKeyboardMarkup(keyboard)
 
         # Add timestamp to prevent "Message is not modified" error
         text += f"\n_Updated at {datetime.now().strftime('%H:%M:%S')}_"
 
-        await query.edit_message_text(
-            text, reply_markup=reply_markup, parse_mode="Markdown"
+        await self._safe_edit(
+            query, text, reply_markup=reply_markup, parse_mode="Markdown"
         )
 
     async def start_remove_future_wizard(
@@ -624,8 +1080,8 @@ class SpotHedgerBot:
 
         if not future_positions:
             text = "❌ *No Future Positions*\n\nYou don't have any future positions to remove."
-            await query.edit_message_text(
-                text, reply_markup=get_back_button(), parse_mode="Markdown"
+            await self._safe_edit(
+                query, text, reply_markup=get_back_button(), parse_mode="Markdown"
             )
             return
 
@@ -649,15 +1105,13 @@ class SpotHedgerBot:
 
         keyboard.append([{"text": "🔙 Back", "callback_data": "back"}])
 
-        from telegram import InlineKeyboardButton, InlineKeyboardMarkup
-
         reply_markup = InlineKeyboardMarkup(keyboard)
 
         # Add timestamp to prevent "Message is not modified" error
         text += f"\n_Updated at {datetime.now().strftime('%H:%M:%S')}_"
 
-        await query.edit_message_text(
-            text, reply_markup=reply_markup, parse_mode="Markdown"
+        await self._safe_edit(
+            query, text, reply_markup=reply_markup, parse_mode="Markdown"
         )
 
     async def confirm_portfolio_action(
@@ -668,21 +1122,22 @@ class SpotHedgerBot:
 
         trade = context.user_data.get("pending_trade")
         if not trade:
-            await query.edit_message_text(
+            await self._safe_edit(
+                query,
                 "No pending trade found.",
                 reply_markup=get_back_button(),
                 parse_mode="Markdown",
             )
             return
-        action_type = trade.get("action_type")
-        symbol = trade.get("symbol")
-        qty = trade.get("qty")
-        price = trade.get("price")
+        action_type = trade.action_type
+        symbol = trade.symbol
+        qty = trade.qty
+        price = trade.price
         if action_type == "add":
             self.portfolio.update_fill(
-                symbol, qty, price, trade.get("instrument_type"), trade.get("exchange")
+                symbol, qty, price, trade.instrument_type, trade.exchange
             )
-            text = f"✅ *Position Added*\n\n{symbol}: {qty:+.4f} @ ${price:.2f}"
+            text = f"✅ *Position Added*\n\n{_escape_markdown(symbol)}: {qty:+.4f} @ ${price:.2f}"
         elif action_type == "remove":
             position = self.portfolio.get_position(symbol)
             if position:
@@ -693,7 +1148,7 @@ class SpotHedgerBot:
                     position.instrument_type,
                     position.exchange,
                 )
-                text = f"✅ *Position Removed*\n\n{symbol}: {position.qty:+.4f} @ ${position.avg_px:.2f}"
+                text = f"✅ *Position Removed*\n\n{_escape_markdown(symbol)}: {position.qty:+.4f} @ ${position.avg_px:.2f}"
             else:
                 text = "❌ Position not found."
         else:
@@ -701,8 +1156,8 @@ class SpotHedgerBot:
         # Clear pending trade after confirmation
         context.user_data.pop("pending_trade", None)
 
-        await query.edit_message_text(
-            text, reply_markup=get_back_button(), parse_mode="Markdown"
+        await self._safe_edit(
+            query, text, reply_markup=get_back_button(), parse_mode="Markdown"
         )
 
     async def show_main_menu(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -710,7 +1165,7 @@ class SpotHedgerBot:
         query = update.callback_query
         welcome_text = "🤖 Spot Hedger Bot\n\nSelect an option:"
 
-        await query.edit_message_text(welcome_text, reply_markup=get_main_menu())
+        await self._safe_edit(query, welcome_text, reply_markup=get_main_menu())
 
     async def show_portfolio(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show portfolio overview."""
@@ -722,69 +1177,76 @@ class SpotHedgerBot:
 
         # Calculate real-time P&L
         total_pnl = 0.0
-        positions_text = ""
-
-        for position in self.portfolio.positions.values():
-            try:
-                direction = "🟢 LONG" if position.is_long else "🔴 SHORT"
+        positions_parts = []
+
+        # Fetch every position's current price concurrently; options are
+        # priced from Deribit, spot/futures in one batch through the cache
+        positions = list(self.portfolio.positions.values())
+        option_symbols = [p.symbol for p in positions if p.instrument_type == "option"]
+        market_prices, *option_prices = await asyncio.gather(
+            self.get_current_prices(
+                [p.symbol for p in positions if p.instrument_type != "option"]
+            ),
+            *(self._get_option_price(symbol) for symbol in option_symbols),
+            return_exceptions=True,
+        )
+        option_prices = dict(zip(option_symbols, option_prices))
 
-                # Handle different instrument types
-                if position.instrument_type == "option":
-                    # For options, use the stored price and show option-specific info
-                    option_price = position.avg_px
-                    # Try to get current option price from Deribit
-                    try:
-                        from ..exchanges.deribit_options import deribit_options
-
-                        async with deribit_options as options:
-                            ticker = await options.get_option_ticker(position.symbol)
-                            if ticker and ticker.last_price > 0:
-                                current_price = ticker.last_price
-                                unrealized_pnl = (
-                                    current_price - option_price
-                                ) * position.qty
-                                total_pnl += unrealized_pnl
-                                pnl_color = "🟢" if unrealized_pnl >= 0 else "🔴"
-                                positions_text += (
-                                    f"• {position.symbol}: {position.qty:+.4f} @ ${option_price:.4f} "
-                                    f"({direction})\n"
-                                    f"  Current: ${current_price:.4f} | P&L: {pnl_color}${unrealized_pnl:+.2f}\n\n"
-                                )
-                            else:
-                                # Fallback for options without current price
-                                positions_text += (
-                                    f"• {position.symbol}: {position.qty:+.4f} @ ${option_price:.4f} "
-                                    f"({direction})\n"
-                                    f"  Option Price: ${option_price:.4f}\n\n"
-                                )
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to get option price for {position.symbol}: {e}"
-                        )
-                        positions_text += (
-                            f"• {position.symbol}: {position.qty:+.4f} @ ${option_price:.4f} "
-                            f"({direction})\n"
-                            f"  Option Price: ${option_price:.4f}\n\n"
-                        )
-                else:
-                    # For spot/futures, get current price normally
-                    current_price = await self.get_current_price(position.symbol)
-                    unrealized_pnl = (current_price - position.avg_px) * position.qty
+        for position in positions:
+            direction = "🟢 LONG" if position.is_long else "🔴 SHORT"
+            if position.instrument_type == "option":
+                current_price = option_prices[position.symbol]
+            elif isinstance(market_prices, Exception):
+                current_price = market_prices
+            else:
+                current_price = market_prices[position.symbol]
+
+            # Handle different instrument types
+            if position.instrument_type == "option":
+                # For options, use the stored price and show option-specific info
+                option_price = position.avg_px
+                if isinstance(current_price, Exception):
+                    logger.warning(
+                        f"Failed to get option price for {position.symbol}: {current_price}"
+                    )
+                    current_price = None
+                if current_price is not None:
+                    unrealized_pnl = (current_price - option_price) * position.qty
                     total_pnl += unrealized_pnl
-
                     pnl_color = "🟢" if unrealized_pnl >= 0 else "🔴"
-                    positions_text += (
-                        f"• {position.symbol}: {position.qty:+.4f} @ ${position.avg_px:.2f} "
+                    positions_parts.append(
+                        f"• {position.symbol}: {position.qty:+.4f} @ ${option_price:.4f} "
                         f"({direction})\n"
-                        f"  Current: ${current_price:.2f} | P&L: {pnl_color}${unrealized_pnl:+.2f}\n\n"
+                        f"  Current: ${current_price:.4f} | P&L: {pnl_color}${unrealized_pnl:+.2f}\n\n"
                     )
-            except Exception as e:
-                logger.warning(f"Failed to get price for {position.symbol}: {e}")
-                direction = "🟢 LONG" if position.is_long else "🔴 SHORT"
-                positions_text += (
+                else:
+                    # Fallback for options without current price
+                    positions_parts.append(
+                        f"• {position.symbol}: {position.qty:+.4f} @ ${option_price:.4f} "
+                        f"({direction})\n"
+                        f"  Option Price: ${option_price:.4f}\n\n"
+                    )
+            elif isinstance(current_price, Exception):
+                logger.warning(
+                    f"Failed to get price for {position.symbol}: {current_price}"
+                )
+                positions_parts.append(
                     f"• {position.symbol}: {position.qty:+.4f} @ ${position.avg_px:.2f} "
                     f"({direction})\n\n"
                 )
+            else:
+                # For spot/futures, use the fetched price
+                unrealized_pnl = (current_price - position.avg_px) * position.qty
+                total_pnl += unrealized_pnl
+
+                pnl_color = "🟢" if unrealized_pnl >= 0 else "🔴"
+                positions_parts.append(
+                    f"• {position.symbol}: {position.qty:+.4f} @ ${position.avg_px:.2f} "
+                    f"({direction})\n"
+                    f"  Current: ${current_price:.2f} | P&L: {pnl_color}${unrealized_pnl:+.2f}\n\n"
+                )
+
+        positions_text = "".join(positions_parts)
 
         # Format portfolio text
         if not self.portfolio.positions:
@@ -802,10 +1264,27 @@ class SpotHedgerBot:
         # Add timestamp
         portfolio_text += f"\n_Updated at {datetime.now().strftime('%H:%M:%S')}_"
 
-        await query.edit_message_text(
-            portfolio_text, reply_markup=get_portfolio_menu(), parse_mode="Markdown"
+        await self._safe_edit(
+            query,
+            portfolio_text,
+            reply_markup=get_portfolio_menu(),
+            parse_mode="Markdown",
         )
 
+    async def _get_option_price(self, symbol: str) -> Optional[float]:
+        """Get the last traded price of an option from Deribit.
+
+        Uses the options client session that start() keeps open for the
+        bot's lifetime.
+
+        Returns:
+            Last price, or None when the option has not traded
+        """
+        ticker = await deribit_options.get_option_ticker(symbol)
+        if ticker and ticker.last_price > 0:
+            return ticker.last_price
+        return None
+
     async def show_hedge_menu(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show hedge menu."""
         query = update.callback_query
@@ -816,8 +1295,6 @@ class SpotHedgerBot:
         # Get hedge recommendations with options
         try:
             # Get option chain for hedging
-            from ..exchanges.deribit_options import deribit_options
-
             option_chain = await deribit_options.get_option_chain()
 
             recommendations = await hedge_service.calculate_hedge_recommendations(
@@ -860,14 +1337,13 @@ class SpotHedgerBot:
         else:
             hedge_text += "\n\n⚠️ *Options Status:* Using perpetual-only hedging"
 
-        await query.edit_message_text(
-            hedge_text, reply_markup=get_hedge_menu(), parse_mode="Markdown"
+        await self._safe_edit(
+            query, hedge_text, reply_markup=get_hedge_menu(), parse_mode="Markdown"
         )
 
     async def show_analytics(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show analytics summary and drill-down options."""
         query = update.callback_query
-        from loguru import logger
 
         try:
             logger.info("show_analytics called")
@@ -878,14 +1354,12 @@ class SpotHedgerBot:
                 try:
                     if position.instrument_type == "option":
                         # For options, try to get current price from Deribit
-                        from ..exchanges.deribit_options import deribit_options
-
-                        async with deribit_options as options:
-                            ticker = await options.get_option_ticker(position.symbol)
-                            if ticker and ticker.last_price > 0:
-                                current_prices[position.symbol] = ticker.last_price
-                            else:
-                                current_prices[position.symbol] = position.avg_px
+                        option_price = await self._get_option_price(position.symbol)
+                        current_prices[position.symbol] = (
+                            option_price
+                            if option_price is not None
+                            else position.avg_px
+                        )
                     else:
                         # For spot/perpetual, get current price
                         current_prices[position.symbol] = await self.get_current_price(
@@ -914,7 +1388,7 @@ class SpotHedgerBot:
 
             # Calculate hedge delta from active hedges
             hedge_delta = 0.0
-            for hedge in self.active_hedges:
+            for hedge in self.active_hedges.values():
                 hedge_type = hedge.get("type", "")
                 if hedge_type in [
                     "protective_put",
@@ -980,8 +1454,6 @@ class SpotHedgerBot:
             if greeks_text:
                 text += f"\n*Option Greeks:*\n{greeks_text}"
 
-            from telegram import InlineKeyboardMarkup, InlineKeyboardButton
-
             # Create analytics menu with drill-down options
             keyboard = [
                 [
@@ -1020,14 +1492,17 @@ class SpotHedgerBot:
                 ],
                 [InlineKeyboardButton("🔙 Back", callback_data="back")],
             ]
-            await query.edit_message_text(
-                text, reply_markup=InlineKeyboardMarkup(keyboard), parse_mode="Markdown"
+            await self._safe_edit(
+                query,
+                text,
+                reply_markup=InlineKeyboardMarkup(keyboard),
+                parse_mode="Markdown",
             )
         except Exception as e:
             logger.error(f"Error in show_analytics: {e}")
-            from telegram import InlineKeyboardMarkup, InlineKeyboardButton
 
-            await query.edit_message_text(
+            await self._safe_edit(
+                query,
                 "❌ Failed to load analytics. Please try again later.",
                 reply_markup=InlineKeyboardMarkup(
                     [[InlineKeyboardButton("🔙 Back", callback_data="back")]]
@@ -1064,37 +1539,27 @@ class SpotHedgerBot:
             )
 
             # Recent transactions
-            text += "📝 *Recent Transactions:*\n"
+            parts = ["📝 *Recent Transactions:*\n"]
             for i, tx in enumerate(transactions[:10], 1):  # Show last 10
-                # Format timestamp
-                timestamp = tx.timestamp.strftime("%m/%d %H:%M")
-
-                # Format quantity and price
-                qty_str = (
-                    f"{tx.qty:+.4f}" if abs(tx.qty) >= 0.0001 else f"{tx.qty:+.6f}"
+                qty = tx.qty
+                pnl_str = (
+                    ""
+                    if tx.pnl is None
+                    else f" | P&L: {'🟢' if tx.pnl >= 0 else '🔴'}${tx.pnl:+,.2f}"
                 )
-                price_str = f"${tx.price:.2f}"
-
-                # Transaction type emoji
-                type_emoji = {
-                    "buy": "🟢",
-                    "sell": "🔴",
-                    "add": "➕",
-                    "remove": "➖",
-                    "hedge": "🛡️",
-                }.get(tx.transaction_type, "📊")
-
-                # P&L if available
-                pnl_str = ""
-                if tx.pnl is not None:
-                    pnl_color = "🟢" if tx.pnl >= 0 else "🔴"
-                    pnl_str = f" | P&L: {pnl_color}${tx.pnl:+,.2f}"
-
-                text += (
-                    f"{i}. {type_emoji} {tx.symbol} {qty_str} @ {price_str}"
-                    f"{pnl_str}\n"
-                    f"   {timestamp} | {tx.transaction_type.title()}\n\n"
+                parts.append(
+                    _TX_ROW_TEMPLATE.format(
+                        i=i,
+                        emoji=_TX_TYPE_EMOJI.get(tx.transaction_type, "📊"),
+                        symbol=tx.symbol,
+                        qty=format(qty, "+.4f" if abs(qty) >= 0.0001 else "+.6f"),
+                        price="$" + format(tx.price, ".2f"),
+                        pnl=pnl_str,
+                        ts=tx.timestamp.strftime("%m/%d %H:%M"),
+                        ttype=tx.transaction_type.title(),
+                    )
                 )
+            text += "".join(parts)
 
             if len(transactions) > 10:
                 text += f"... and {len(transactions) - 10} more transactions\n\n"
@@ -1103,24 +1568,24 @@ class SpotHedgerBot:
         text += f"_Updated at {datetime.now().strftime('%H:%M:%S')}_"
 
         # Create back button
-        from telegram import InlineKeyboardMarkup, InlineKeyboardButton
-
         keyboard = [[InlineKeyboardButton("🔙 Back", callback_data="back")]]
 
-        await query.edit_message_text(
-            text, reply_markup=InlineKeyboardMarkup(keyboard), parse_mode="Markdown"
+        await self._safe_edit(
+            query,
+            text,
+            reply_markup=InlineKeyboardMarkup(keyboard),
+            parse_mode="Markdown",
         )
 
     async def handle_analytics_callback(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE, step: str, data: dict
     ):
         query = update.callback_query
+        positions_map = getattr(self.portfolio, "positions", None) or {}
         if step == "by_position":
-            # List all positions
-            positions = list(getattr(self.portfolio, "positions", {}).values())
             # Filter only valid positions (dict/object with symbol)
             valid_positions = []
-            for pos in positions:
+            for pos in positions_map.values():
                 if isinstance(pos, str):
                     continue
                 if hasattr(pos, "symbol") or (
@@ -1128,33 +1593,34 @@ class SpotHedgerBot:
                 ):
                     valid_positions.append(pos)
             if not valid_positions:
-                await query.edit_message_text(
-                    "No positions.", reply_markup=get_back_button()
+                await self._safe_edit(
+                    query, "No positions.", reply_markup=get_back_button()
                 )
                 return
-            text = "*Positions:*\n\n"
-            buttons = []
-            for i, pos in enumerate(valid_positions):
-                symbol = pos.symbol if hasattr(pos, "symbol") else pos.get("symbol")
-                qty = pos.qty if hasattr(pos, "qty") else pos.get("qty")
-                text += f"{i+1}. `{symbol}` qty: `{qty}`\n"
-                buttons.append(
+            lines = []
+            keyboard = []
+            # Remember which symbol each button index refers to, so the
+            # detail view is a direct lookup that survives later fills
+            listed_symbols = []
+            for i, view in enumerate(map(_as_posview, valid_positions)):
+                symbol, qty = view.symbol, view.qty
+                listed_symbols.append(symbol)
+                lines.append(f"{i+1}. `{symbol}` qty: `{qty}`\n")
+                keyboard.append(
                     [
-                        {
-                            "text": f"{symbol}",
-                            "callback_data": f"analytics|position_detail|{i}",
-                        }
+                        InlineKeyboardButton(
+                            f"{symbol}", callback_data=f"analytics|position_detail|{i}"
+                        )
                     ]
                 )
-            from telegram import InlineKeyboardMarkup, InlineKeyboardButton
-
-            keyboard = [
-                [InlineKeyboardButton(b["text"], callback_data=b["callback_data"])]
-                for b in sum(buttons, [])
-            ]
             keyboard.append([InlineKeyboardButton("⬅️ Back", callback_data="analytics")])
-            await query.edit_message_text(
-                text, reply_markup=InlineKeyboardMarkup(keyboard), parse_mode="Markdown"
+            context.user_data["analytics_positions"] = listed_symbols
+            text = "*Positions:*\n\n" + "".join(lines)
+            await self._safe_edit(
+                query,
+                text,
+                reply_markup=InlineKeyboardMarkup(keyboard),
+                parse_mode="Markdown",
             )
         elif step == "position_detail":
             if isinstance(data, int):
@@ -1168,30 +1634,22 @@ class SpotHedgerBot:
                 idx = int(data.get("idx", 0))
             else:
                 idx = 0
-            positions = list(getattr(self.portfolio, "positions", {}).values())
-            # Filter only valid positions (dict/object with symbol)
-            valid_positions = []
-            for pos in positions:
-                if isinstance(pos, str):
-                    continue
-                if hasattr(pos, "symbol") or (
-                    isinstance(pos, dict) and "symbol" in pos
-                ):
-                    valid_positions.append(pos)
-            if idx < 0 or idx >= len(valid_positions):
-                await query.edit_message_text(
-                    "Invalid position.", reply_markup=get_back_button()
+            # Resolve the symbol listed under this index; a position closed
+            # since the list was shown is no longer in the portfolio
+            listed_symbols = context.user_data.get("analytics_positions", [])
+            pos = (
+                positions_map.get(listed_symbols[idx])
+                if 0 <= idx < len(listed_symbols)
+                else None
+            )
+            if pos is None or isinstance(pos, str):
+                await self._safe_edit(
+                    query, "Invalid position.", reply_markup=get_back_button()
                 )
                 return
-            pos = valid_positions[idx]
-            symbol = pos.symbol if hasattr(pos, "symbol") else pos.get("symbol")
-            qty = pos.qty if hasattr(pos, "qty") else pos.get("qty")
-            avg_px = pos.avg_px if hasattr(pos, "avg_px") else pos.get("avg_px")
-            instrument_type = (
-                pos.instrument_type
-                if hasattr(pos, "instrument_type")
-                else pos.get("instrument_type")
-            )
+            view = _as_posview(pos)
+            symbol, qty, avg_px = view.symbol, view.qty, view.avg_px
+            instrument_type = view.instrument_type
             current_price = await self.get_current_price(symbol)
             pnl = (current_price - avg_px) * qty
             text = (
@@ -1203,7 +1661,6 @@ class SpotHedgerBot:
                 f"Unrealized P&L: `${pnl:,.2f}`\n"
                 f"Type: `{instrument_type}`\n"
             )
-            from telegram import InlineKeyboardMarkup, InlineKeyboardButton
 
             keyboard = [
                 [
@@ -1212,19 +1669,22 @@ class SpotHedgerBot:
                     )
                 ]
             ]
-            await query.edit_message_text(
-                text, reply_markup=InlineKeyboardMarkup(keyboard), parse_mode="Markdown"
+            await self._safe_edit(
+                query,
+                text,
+                reply_markup=InlineKeyboardMarkup(keyboard),
+                parse_mode="Markdown",
             )
         elif step == "by_hedge":
-            hedges = getattr(self, "active_hedges", [])
+            hedges = self.active_hedges
             if not hedges:
-                await query.edit_message_text(
-                    "No active hedges.", reply_markup=get_back_button()
+                await self._safe_edit(
+                    query, "No active hedges.", reply_markup=get_back_button()
                 )
                 return
-            text = "*Active Hedges:*\n\n"
-            buttons = []
-            for i, hedge in enumerate(hedges):
+            parts = ["*Active Hedges:*\n\n"]
+            keyboard = []
+            for i, (hedge_id, hedge) in enumerate(hedges.items()):
                 hedge_type = hedge.get("type", "unknown")
                 symbol = hedge.get("symbol", "")
                 qty = hedge.get("qty", 0.0)
@@ -1245,7 +1705,7 @@ class SpotHedgerBot:
                 }
                 desc = type_names.get(hedge_type, hedge_type.replace("_", " ").title())
 
-                text += (
+                parts.append(
                     f"{i+1}. {desc}\n"
                     f"   Symbol: `{symbol}`\n"
                     f"   Qty: `{qty:+.4f}`\n"
@@ -1259,20 +1719,24 @@ class SpotHedgerBot:
                     straddle_data = hedge["straddle_data"]
                     strike = straddle_data.get("strike", 0)
                     put_symbol = straddle_data.get("put_symbol", "")
-                    text += f"\n*Strategy Details:*\n"
-                    text += f"• Strike: `${strike:,.0f}`\n"
-                    text += f"• Call: `{symbol}`\n"
-                    text += f"• Put: `{put_symbol}`\n"
+                    parts.append(
+                        f"\n*Strategy Details:*\n"
+                        f"• Strike: `${strike:,.0f}`\n"
+                        f"• Call: `{symbol}`\n"
+                        f"• Put: `{put_symbol}`\n"
+                    )
 
                 elif hedge_type == "butterfly" and "butterfly_data" in hedge:
                     butterfly_data = hedge["butterfly_data"]
                     lower_strike = butterfly_data.get("lower_strike", 0)
                     middle_strike = butterfly_data.get("middle_strike", 0)
                     upper_strike = butterfly_data.get("upper_strike", 0)
-                    text += f"\n*Strategy Details:*\n"
-                    text += f"• Lower Strike: `${lower_strike:,.0f}`\n"
-                    text += f"• Middle Strike: `${middle_strike:,.0f}`\n"
-                    text += f"• Upper Strike: `${upper_strike:,.0f}`\n"
+                    parts.append(
+                        f"\n*Strategy Details:*\n"
+                        f"• Lower Strike: `${lower_strike:,.0f}`\n"
+                        f"• Middle Strike: `${middle_strike:,.0f}`\n"
+                        f"• Upper Strike: `${upper_strike:,.0f}`\n"
+                    )
 
                 elif hedge_type == "iron_condor" and "iron_condor_data" in hedge:
                     iron_condor_data = hedge["iron_condor_data"]
@@ -1280,9 +1744,9 @@ class SpotHedgerBot:
                     put_upper = iron_condor_data.get("put_upper", 0)
                     call_lower = iron_condor_data.get("call_lower", 0)
                     call_upper = iron_condor_data.get("call_upper", 0)
-                    text += f"\n*Strategy Details:*\n"
-                    text += f"• Put Spread: `${put_lower:,.0f}` - `${put_upper:,.0f}`\n"
-                    text += (
+                    parts.append(
+                        f"\n*Strategy Details:*\n"
+                        f"• Put Spread: `${put_lower:,.0f}` - `${put_upper:,.0f}`\n"
                         f"• Call Spread: `${call_lower:,.0f}` - `${call_upper:,.0f}`\n"
                     )
 
@@ -1290,26 +1754,26 @@ class SpotHedgerBot:
                     collar_data = hedge["collar_data"]
                     put_strike = collar_data.get("put_strike", 0)
                     call_strike = collar_data.get("call_strike", 0)
-                    text += f"\n*Strategy Details:*\n"
-                    text += f"• Put Strike: `${put_strike:,.0f}`\n"
-                    text += f"• Call Strike: `${call_strike:,.0f}`\n"
-                buttons.append(
+                    parts.append(
+                        f"\n*Strategy Details:*\n"
+                        f"• Put Strike: `${put_strike:,.0f}`\n"
+                        f"• Call Strike: `${call_strike:,.0f}`\n"
+                    )
+                keyboard.append(
                     [
-                        {
-                            "text": f"{desc}",
-                            "callback_data": f"analytics|hedge_detail|{i}",
-                        }
+                        InlineKeyboardButton(
+                            f"{desc}",
+                            callback_data=f"analytics|hedge_detail|{hedge_id}",
+                        )
                     ]
                 )
-            from telegram import InlineKeyboardMarkup, InlineKeyboardButton
-
-            keyboard = [
-                [InlineKeyboardButton(b["text"], callback_data=b["callback_data"])]
-                for b in sum(buttons, [])
-            ]
             keyboard.append([InlineKeyboardButton("⬅️ Back", callback_data="analytics")])
-            await query.edit_message_text(
-                text, reply_markup=InlineKeyboardMarkup(keyboard), parse_mode="Markdown"
+            text = "".join(parts)
+            await self._safe_edit(
+                query,
+                text,
+                reply_markup=InlineKeyboardMarkup(keyboard),
+                parse_mode="Markdown",
             )
         elif step == "hedge_detail":
             if isinstance(data, int):
@@ -1323,13 +1787,12 @@ class SpotHedgerBot:
                 idx = int(data.get("idx", 0))
             else:
                 idx = 0
-            hedges = getattr(self, "active_hedges", [])
-            if idx < 0 or idx >= len(hedges):
-                await query.edit_message_text(
-                    "Invalid hedge.", reply_markup=get_back_button()
+            hedge = self.active_hedges.get(idx)
+            if hedge is None:
+                await self._safe_edit(
+                    query, "Invalid hedge.", reply_markup=get_back_button()
                 )
                 return
-            hedge = hedges[idx]
             hedge_type = hedge.get("type", "unknown")
             symbol = hedge.get("symbol", "")
             qty = hedge.get("qty", 0.0)
@@ -1397,13 +1860,15 @@ class SpotHedgerBot:
                 text += f"\n*Strategy Details:*\n"
                 text += f"• Put Strike: `${put_strike:,.0f}`\n"
                 text += f"• Call Strike: `${call_strike:,.0f}`\n"
-            from telegram import InlineKeyboardMarkup, InlineKeyboardButton
 
             keyboard = [
                 [InlineKeyboardButton("⬅️ Back", callback_data="analytics|by_hedge|{}")]
             ]
-            await query.edit_message_text(
-                text, reply_markup=InlineKeyboardMarkup(keyboard), parse_mode="Markdown"
+            await self._safe_edit(
+                query,
+                text,
+                reply_markup=InlineKeyboardMarkup(keyboard),
+                parse_mode="Markdown",
             )
         elif step == "performance":
             await self.show_performance_attribution(update, context)
@@ -1422,8 +1887,8 @@ class SpotHedgerBot:
             scenario_name = data.get("scenario", "market_crash_20")
             await self.show_stress_test_chart(update, context, scenario_name)
         else:
-            await query.edit_message_text(
-                "Unknown analytics action.", reply_markup=get_back_button()
+            await self._safe_edit(
+                query, "Unknown analytics action.", reply_markup=get_back_button()
             )
 
     async def show_risk_config(
@@ -1439,7 +1904,6 @@ class SpotHedgerBot:
             f"• Max Drawdown: `{cfg['max_drawdown']:.2%}`  [✏️ Edit](drawdown)\n\n"
             f"Select a metric to edit, or go back."
         )
-        from telegram import InlineKeyboardMarkup, InlineKeyboardButton
 
         keyboard = [
             [
@@ -1455,7 +1919,8 @@ class SpotHedgerBot:
             ],
             [InlineKeyboardButton("⬅️ Back", callback_data="back")],
         ]
-        await query.edit_message_text(
+        await self._safe_edit(
+            query,
             text,
             reply_markup=InlineKeyboardMarkup(keyboard),
             parse_mode="Markdown",
@@ -1465,7 +1930,7 @@ class SpotHedgerBot:
         self, update: Update, context: ContextTypes.DEFAULT_TYPE, step: str, data: dict
     ):
         """Handle hedge-related callbacks."""
-        logger.info(f"[handle_hedge_callback] step={step} data={data}")
+        logger.info("[handle_hedge_callback] step={} data={}", step, data)
         # Parse compact callback data for select flow
         if step == "protective_put_select_strike" and isinstance(data, str):
             data = {"expiry": data}
@@ -1510,7 +1975,6 @@ class SpotHedgerBot:
                 data = {"idx": int(data)}
             elif isinstance(data, int):
                 data = {"idx": data}
-        import json
 
         # Parse data if it's a stringified dict
         if isinstance(data, str) and (data.startswith("{") and data.endswith("}")):
@@ -1598,8 +2062,10 @@ class SpotHedgerBot:
         elif step == "cancel":
             await self.show_hedge_menu(update, context)
         else:
-            await update.callback_query.edit_message_text(
-                "Unknown hedge action.", reply_markup=get_back_button()
+            await self._safe_edit(
+                update.callback_query,
+                "Unknown hedge action.",
+                reply_markup=get_back_button(),
             )
 
     async def start_perp_delta_neutral_hedge(
@@ -1612,8 +2078,8 @@ class SpotHedgerBot:
 
         if abs(total_delta) < 0.01:
             text = "✅ *Portfolio Already Delta-Neutral*\n\nNo hedge needed - your portfolio is already delta-neutral."
-            await query.edit_message_text(
-                text, reply_markup=get_back_button(), parse_mode="Markdown"
+            await self._safe_edit(
+                query, text, reply_markup=get_back_button(), parse_mode="Markdown"
             )
             return
 
@@ -1635,7 +2101,7 @@ class SpotHedgerBot:
             f"Hedge Required: {abs(hedge_qty):.4f} BTC {direction}\n"
             f"Price: ${current_price:.2f}\n"
             f"Notional: ${abs(hedge_qty * current_price):,.2f}\n\n"
-            f"{costing_service.get_cost_summary(hedge_qty, current_price, 'OKX', 'perpetual')}\n\n"
+            f"{costing_service.format_cost_summary(costs)}\n\n"
             f"This will make your portfolio delta-neutral."
         )
 
@@ -1650,8 +2116,11 @@ class SpotHedgerBot:
             "target_delta": 0.0,
         }
 
-        await query.edit_message_text(
-            text, reply_markup=get_confirmation_buttons("hedge"), parse_mode="Markdown"
+        await self._safe_edit(
+            query,
+            text,
+            reply_markup=get_confirmation_buttons("hedge"),
+            parse_mode="Markdown",
         )
 
     async def start_protective_put_hedge(
@@ -1664,8 +2133,8 @@ class SpotHedgerBot:
 
         if total_delta <= 0:
             text = "❌ *No Protective Put Needed*\n\nProtective puts are for long positions only."
-            await query.edit_message_text(
-                text, reply_markup=get_back_button(), parse_mode="Markdown"
+            await self._safe_edit(
+                query, text, reply_markup=get_back_button(), parse_mode="Markdown"
             )
             return
 
@@ -1677,23 +2146,9 @@ class SpotHedgerBot:
             f"Current Portfolio Delta: {total_delta:+.4f} BTC\n\n"
             f"How would you like to select your put option?"
         )
-        from telegram import InlineKeyboardMarkup, InlineKeyboardButton
 
-        keyboard = InlineKeyboardMarkup(
-            [
-                [
-                    InlineKeyboardButton(
-                        "🔍 Select", callback_data="hedge|protective_put_select|{}"
-                    ),
-                    InlineKeyboardButton(
-                        "⚡ Automatic", callback_data="hedge|protective_put_auto|{}"
-                    ),
-                ],
-                [InlineKeyboardButton("⬅️ Back", callback_data="back")],
-            ]
-        )
-        await query.edit_message_text(
-            text, reply_markup=keyboard, parse_mode="Markdown"
+        await self._safe_edit(
+            query, text, reply_markup=_PROTECTIVE_PUT_MENU_MARKUP, parse_mode="Markdown"
         )
 
     async def protective_put_auto_flow(
@@ -1704,21 +2159,12 @@ class SpotHedgerBot:
         total_delta = self.portfolio.get_total_delta()
         logger.info("[protective_put_auto_flow] Entered function")
         try:
-            from ..exchanges.deribit_options import deribit_options
-
             logger.info("[protective_put_auto_flow] Before async with deribit_options")
             async with deribit_options:
                 logger.info(
                     "[protective_put_auto_flow] Inside async with deribit_options"
                 )
-                instruments = await deribit_options.get_instruments()
-                put_instruments = [
-                    i
-                    for i in instruments
-                    if i.symbol.startswith("BTC")
-                    and i.instrument_type == "option"
-                    and "-P" in i.symbol
-                ]
+                put_instruments = await deribit_options.get_options("BTC", "P")
                 logger.info(
                     f"[protective_put_auto_flow] Found {len(put_instruments)} put instruments"
                 )
@@ -1729,8 +2175,11 @@ class SpotHedgerBot:
                         f"❌ No put options available for hedging.\n\n"
                         f"Try perpetual delta-neutral hedge instead."
                     )
-                    await query.edit_message_text(
-                        text, reply_markup=get_back_button(), parse_mode="Markdown"
+                    await self._safe_edit(
+                        query,
+                        text,
+                        reply_markup=get_back_button(),
+                        parse_mode="Markdown",
                     )
                     logger.info(
                         "[protective_put_auto_flow] No put options, sent error message"
@@ -1741,19 +2190,13 @@ class SpotHedgerBot:
                     f"[protective_put_auto_flow] Got current price: {current_price}"
                 )
                 # Find 10 closest puts to ATM
-                closest_puts = sorted(
-                    put_instruments,
-                    key=lambda x: abs(
-                        x.symbol.split("-")[2]
-                        and float(x.symbol.split("-")[2]) - current_price
-                    ),
-                )[:10]
-                # Fetch tickers for these
-                put_options = []
-                for inst in closest_puts:
-                    ticker = await deribit_options.get_option_ticker(inst.symbol)
-                    if ticker:
-                        put_options.append(ticker)
+                closest_puts = heapq.nsmallest(
+                    10, put_instruments, key=lambda x: abs(x.strike - current_price)
+                )
+                # Fetch tickers for these from one book summary request
+                put_options = await deribit_options.get_option_tickers(
+                    [inst.symbol for inst in closest_puts]
+                )
                 logger.info(
                     f"[protective_put_auto_flow] Got {len(put_options)} put tickers"
                 )
@@ -1764,8 +2207,11 @@ class SpotHedgerBot:
                         f"❌ No put options with price data.\n\n"
                         f"Try perpetual delta-neutral hedge instead."
                     )
-                    await query.edit_message_text(
-                        text, reply_markup=get_back_button(), parse_mode="Markdown"
+                    await self._safe_edit(
+                        query,
+                        text,
+                        reply_markup=get_back_button(),
+                        parse_mode="Markdown",
                     )
                     logger.info(
                         "[protective_put_auto_flow] No put tickers, sent error message"
@@ -1775,16 +2221,7 @@ class SpotHedgerBot:
                 target_delta = total_delta * 0.5
                 hedge_delta = total_delta - target_delta
                 put_quantity = hedge_delta / abs(best_put.delta)
-                # Use last_price if mid_price is 0 (when bid/ask are 0)
-                price = (
-                    best_put.mid_price
-                    if best_put.mid_price > 0
-                    else best_put.last_price
-                )
-                # If both are 0, use a fallback price based on strike
-                if price <= 0:
-                    # Use a simple estimate: 5% of strike for puts
-                    price = best_put.strike * 0.05
+                price = self._effective_price(best_put, 0.05)
                 put_cost = put_quantity * price
                 logger.info(
                     f"[protective_put_auto_flow] Price calculation: mid_price={best_put.mid_price}, last_price={best_put.last_price}, final_price={price}, cost={put_cost}"
@@ -1803,11 +2240,7 @@ class SpotHedgerBot:
                     f"• Cost: ${put_cost:,.2f}\n"
                     f"• Risk Reduction: ${risk_reduction:,.2f}\n\n"
                     f"*Greeks:*\n"
-                    f"• Delta: {best_put.delta:.4f}\n"
-                    f"• Gamma: {best_put.gamma:.6f}\n"
-                    f"• Theta: {best_put.theta:.4f}\n"
-                    f"• Vega: {best_put.vega:.4f}\n"
-                    f"• IV: {best_put.implied_volatility:.1%}\n\n"
+                    f"{best_put.greeks_text}\n"
                     f"This will protect your long position from downside risk."
                 )
                 context.user_data["pending_hedge"] = {
@@ -1821,7 +2254,8 @@ class SpotHedgerBot:
                     "target_delta": target_delta,
                     "option_contract": best_put,
                 }
-                await query.edit_message_text(
+                await self._safe_edit(
+                    query,
                     text,
                     reply_markup=get_confirmation_buttons("hedge"),
                     parse_mode="Markdown",
@@ -1835,8 +2269,8 @@ class SpotHedgerBot:
                 f"❌ Error loading options data: {str(e)}\n\n"
                 f"Try perpetual delta-neutral hedge instead."
             )
-            await query.edit_message_text(
-                text, reply_markup=get_back_button(), parse_mode="Markdown"
+            await self._safe_edit(
+                query, text, reply_markup=get_back_button(), parse_mode="Markdown"
             )
 
     async def protective_put_select_expiry(
@@ -1848,25 +2282,14 @@ class SpotHedgerBot:
             "[protective_put_select] User chose 'Select' - showing expiry options"
         )
         query = update.callback_query
-        from ..exchanges.deribit_options import deribit_options
 
         async with deribit_options:
-            instruments = await deribit_options.get_instruments()
-            put_instruments = [
-                i
-                for i in instruments
-                if i.symbol.startswith("BTC")
-                and i.instrument_type == "option"
-                and "-P" in i.symbol
-            ]
+            put_instruments = await deribit_options.get_options("BTC", "P")
             # Extract unique expiries
-            expiries = sorted(
-                list(set(i.symbol.split("-")[1] for i in put_instruments))
-            )
+            expiries = sorted({i.expiry for i in put_instruments})
             logger.info(
-                f"[protective_put_select_expiry] Available expiries: {expiries}"
+                "[protective_put_select_expiry] Available expiries: %s", expiries
             )
-            from telegram import InlineKeyboardMarkup, InlineKeyboardButton
 
             keyboard = [
                 [
@@ -1878,219 +2301,23 @@ class SpotHedgerBot:
                     )
                 ]
                 for exp in expiries[:10]
-            ]
-            keyboard.append(
-                [
-                    InlineKeyboardButton(
-                        "⬅️ Back", callback_data="hedge|protective_put|{}"
-                    )
-                ]
-            )
+            ] + [_PROTECTIVE_PUT_BACK_ROW]
             text = "Select expiry for your protective put:"
-            await query.edit_message_text(
-                text, reply_markup=InlineKeyboardMarkup(keyboard)
+            await self._safe_edit(
+                query, text, reply_markup=InlineKeyboardMarkup(keyboard)
             )
 
     async def protective_put_select_strike(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE, data: dict
     ):
         """Step 2: Let user select strike for chosen expiry."""
-        logger = logging.getLogger(__name__)
-        query = update.callback_query
-        expiry = data.get("expiry")
-        logger.info(f"[protective_put_select_strike] Entered with expiry={expiry}")
-        from ..exchanges.deribit_options import deribit_options
-
-        try:
-            async with deribit_options:
-                instruments = await deribit_options.get_instruments()
-                logger.info(
-                    f"[protective_put_select_strike] Got {len(instruments)} instruments"
-                )
-                put_instruments = [
-                    i
-                    for i in instruments
-                    if i.symbol.startswith("BTC")
-                    and i.instrument_type == "option"
-                    and "-P" in i.symbol
-                    and i.symbol.split("-")[1] == expiry
-                ]
-                logger.info(
-                    f"[protective_put_select_strike] Found {len(put_instruments)} puts for expiry {expiry}"
-                )
-                strikes = sorted(
-                    list(set(float(i.symbol.split("-")[2]) for i in put_instruments))
-                )
-                logger.info(f"[protective_put_select_strike] Strikes: {strikes}")
-                print(
-                    f"[protective_put_select_strike] Strikes for expiry {expiry}: {strikes}"
-                )
-
-                # Get current price to find strikes around it
-                current_price = await self.get_current_price("BTC-USDT-PERP")
-                logger.info(
-                    f"[protective_put_select_strike] Current price: {current_price}"
-                )
-
-                # Find strikes 5 below and 5 above current price
-                strikes_around_current = []
-                for strike in strikes:
-                    if len(strikes_around_current) >= 10:  # Max 10 strikes
-                        break
-                    if (
-                        strike <= current_price + 5000
-                        and strike >= current_price - 5000
-                    ):
-                        strikes_around_current.append(strike)
-
-                # If we don't have enough strikes around current price, add more
-                if len(strikes_around_current) < 10:
-                    # Add strikes closest to current price
-                    strikes_sorted_by_distance = sorted(
-                        strikes, key=lambda x: abs(x - current_price)
-                    )
-                    for strike in strikes_sorted_by_distance:
-                        if (
-                            strike not in strikes_around_current
-                            and len(strikes_around_current) < 10
-                        ):
-                            strikes_around_current.append(strike)
-
-                # Sort by strike price (lowest to highest)
-                strikes_around_current.sort()
-
-                from telegram import InlineKeyboardMarkup, InlineKeyboardButton
-
-                keyboard = [
-                    [
-                        InlineKeyboardButton(
-                            f"${int(strike):,}",
-                            callback_data=f"hedge|protective_put_select_confirm|{expiry}|{int(strike)}",
-                        )
-                    ]
-                    for strike in strikes_around_current[:10]
-                ]
-                keyboard.append(
-                    [
-                        InlineKeyboardButton(
-                            "⬅️ Back", callback_data="hedge|protective_put_select|{}"
-                        )
-                    ]
-                )
-                text = f"Select strike for expiry {expiry}:"
-                await query.edit_message_text(
-                    text, reply_markup=InlineKeyboardMarkup(keyboard)
-                )
-                logger.info(
-                    f"[protective_put_select_strike] Sent strike selection message"
-                )
-        except Exception as e:
-            logger.error(f"[protective_put_select_strike] Exception: {e}")
-            await query.edit_message_text(
-                f"❌ Error: {e}", reply_markup=get_back_button()
-            )
+        await self._option_select_strike(update, context, data, kind="P")
 
     async def protective_put_select_confirm(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE, data: dict
     ):
         """Step 3: Show summary for selected expiry/strike, ask for confirmation."""
-        logger = logging.getLogger(__name__)
-        logger.info(f"[protective_put_select_confirm] Entered with data: {data}")
-        query = update.callback_query
-        expiry = data.get("expiry")
-        strike = float(data.get("strike"))
-        from ..exchanges.deribit_options import deribit_options
-
-        async with deribit_options:
-            instruments = await deribit_options.get_instruments()
-            # Find the symbol for this expiry/strike
-            symbol = None
-            for i in instruments:
-                if (
-                    i.symbol.startswith("BTC")
-                    and i.instrument_type == "option"
-                    and "-P" in i.symbol
-                ):
-                    parts = i.symbol.split("-")
-                    if parts[1] == expiry and float(parts[2]) == strike:
-                        symbol = i.symbol
-                        break
-            if not symbol:
-                logger.error(
-                    f"[protective_put_select_confirm] Option not found for expiry={expiry}, strike={strike}"
-                )
-                await query.edit_message_text(
-                    "❌ Option not found.", reply_markup=get_back_button()
-                )
-                return
-            ticker = await deribit_options.get_option_ticker(symbol)
-            if not ticker:
-                logger.error(
-                    f"[protective_put_select_confirm] Option price unavailable for symbol={symbol}"
-                )
-                await query.edit_message_text(
-                    "❌ Option price unavailable.", reply_markup=get_back_button()
-                )
-                return
-            total_delta = self.portfolio.get_total_delta()
-            target_delta = total_delta * 0.5
-            hedge_delta = total_delta - target_delta
-            put_quantity = (
-                hedge_delta / abs(ticker.delta) if abs(ticker.delta) > 0 else 0.0
-            )
-            # Use last_price if mid_price is 0 (when bid/ask are 0)
-            price = ticker.mid_price if ticker.mid_price > 0 else ticker.last_price
-            # If both are 0, use a fallback price based on strike
-            if price <= 0:
-                current_price = await self.get_current_price("BTC-USDT-PERP")
-                # Use a simple estimate: 5% of strike for puts
-                price = ticker.strike * 0.05
-            put_cost = put_quantity * price
-            logger.info(
-                f"[protective_put_select_confirm] Price calculation: mid_price={ticker.mid_price}, last_price={ticker.last_price}, final_price={price}, cost={put_cost}"
-            )
-            risk_reduction = (
-                hedge_delta * (await self.get_current_price("BTC-USDT-PERP")) * 0.15
-            )
-            logger.info(
-                f"[protective_put_select_confirm] Showing summary for symbol={symbol}, strike={strike}, expiry={expiry}"
-            )
-            text = (
-                f"🛡️ *Protective Put Hedge*\n\n"
-                f"Current Portfolio Delta: {total_delta:+.4f} BTC\n"
-                f"Target Delta: {target_delta:+.4f} BTC\n\n"
-                f"*Selected Put:*\n"
-                f"• Symbol: {ticker.symbol}\n"
-                f"• Strike: ${ticker.strike:,.0f}\n"
-                f"• Expiry: {ticker.expiry.strftime('%Y-%m-%d')}\n"
-                f"• Quantity: {put_quantity:.4f} contracts\n"
-                f"• Price: ${price:.2f}\n"
-                f"• Cost: ${put_cost:,.2f}\n"
-                f"• Risk Reduction: ${risk_reduction:,.2f}\n\n"
-                f"*Greeks:*\n"
-                f"• Delta: {ticker.delta:.4f}\n"
-                f"• Gamma: {ticker.gamma:.6f}\n"
-                f"• Theta: {ticker.theta:.4f}\n"
-                f"• Vega: {ticker.vega:.4f}\n"
-                f"• IV: {ticker.implied_volatility:.1%}\n\n"
-                f"This will protect your long position from downside risk."
-            )
-            context.user_data["pending_hedge"] = {
-                "type": "protective_put",
-                "symbol": ticker.symbol,
-                "qty": put_quantity,
-                "price": price,
-                "cost": put_cost,
-                "instrument_type": "option",
-                "exchange": "Deribit",
-                "target_delta": target_delta,
-                "option_contract": ticker,
-            }
-            await query.edit_message_text(
-                text,
-                reply_markup=get_confirmation_buttons("hedge"),
-                parse_mode="Markdown",
-            )
+        await self._option_select_confirm(update, context, data, kind="P")
 
     async def start_covered_call_hedge(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
@@ -2102,8 +2329,8 @@ class SpotHedgerBot:
 
         if total_delta <= 0:
             text = "❌ *No Covered Call Needed*\n\nCovered calls are for long positions only."
-            await query.edit_message_text(
-                text, reply_markup=get_back_button(), parse_mode="Markdown"
+            await self._safe_edit(
+                query, text, reply_markup=get_back_button(), parse_mode="Markdown"
             )
             return
 
@@ -2115,23 +2342,9 @@ class SpotHedgerBot:
             f"Current Portfolio Delta: {total_delta:+.4f} BTC\n\n"
             f"How would you like to select your call option?"
         )
-        from telegram import InlineKeyboardMarkup, InlineKeyboardButton
 
-        keyboard = InlineKeyboardMarkup(
-            [
-                [
-                    InlineKeyboardButton(
-                        "🔍 Select", callback_data="hedge|covered_call_select|{}"
-                    ),
-                    InlineKeyboardButton(
-                        "⚡ Automatic", callback_data="hedge|covered_call_auto|{}"
-                    ),
-                ],
-                [InlineKeyboardButton("⬅️ Back", callback_data="back")],
-            ]
-        )
-        await query.edit_message_text(
-            text, reply_markup=keyboard, parse_mode="Markdown"
+        await self._safe_edit(
+            query, text, reply_markup=_COVERED_CALL_MENU_MARKUP, parse_mode="Markdown"
         )
 
     async def covered_call_auto_flow(
@@ -2142,21 +2355,15 @@ class SpotHedgerBot:
         total_delta = self.portfolio.get_total_delta()
         logger.info("[covered_call_auto_flow] Entered function")
         try:
-            from ..exchanges.deribit_options import deribit_options
-
             logger.info("[covered_call_auto_flow] Before async with deribit_options")
             async with deribit_options:
                 logger.info(
                     "[covered_call_auto_flow] Inside async with deribit_options"
                 )
-                instruments = await deribit_options.get_instruments()
-                call_instruments = [
-                    i
-                    for i in instruments
-                    if i.symbol.startswith("BTC")
-                    and i.instrument_type == "option"
-                    and "-C" in i.symbol
-                ]
+                call_instruments, current_price = await asyncio.gather(
+                    deribit_options.get_options("BTC", "C"),
+                    self.get_current_price("BTC-USDT-PERP"),
+                )
                 logger.info(
                     f"[covered_call_auto_flow] Found {len(call_instruments)} call instruments"
                 )
@@ -2167,31 +2374,27 @@ class SpotHedgerBot:
                         f"❌ No call options available for hedging.\n\n"
                         f"Try perpetual delta-neutral hedge instead."
                     )
-                    await query.edit_message_text(
-                        text, reply_markup=get_back_button(), parse_mode="Markdown"
+                    await self._safe_edit(
+                        query,
+                        text,
+                        reply_markup=get_back_button(),
+                        parse_mode="Markdown",
                     )
                     logger.info(
                         "[covered_call_auto_flow] No call options, sent error message"
                     )
                     return
-                current_price = await self.get_current_price("BTC-USDT-PERP")
                 logger.info(
                     f"[covered_call_auto_flow] Got current price: {current_price}"
                 )
                 # Find 10 closest calls to ATM
-                closest_calls = sorted(
-                    call_instruments,
-                    key=lambda x: abs(
-                        x.symbol.split("-")[2]
-                        and float(x.symbol.split("-")[2]) - current_price
-                    ),
-                )[:10]
-                # Fetch tickers for these
-                call_options = []
-                for inst in closest_calls:
-                    ticker = await deribit_options.get_option_ticker(inst.symbol)
-                    if ticker:
-                        call_options.append(ticker)
+                closest_calls = heapq.nsmallest(
+                    10, call_instruments, key=lambda x: abs(x.strike - current_price)
+                )
+                # Fetch tickers for these from one book summary request
+                call_options = await deribit_options.get_option_tickers(
+                    [inst.symbol for inst in closest_calls]
+                )
                 logger.info(
                     f"[covered_call_auto_flow] Got {len(call_options)} call tickers"
                 )
@@ -2202,8 +2405,11 @@ class SpotHedgerBot:
                         f"❌ No call options with price data.\n\n"
                         f"Try perpetual delta-neutral hedge instead."
                     )
-                    await query.edit_message_text(
-                        text, reply_markup=get_back_button(), parse_mode="Markdown"
+                    await self._safe_edit(
+                        query,
+                        text,
+                        reply_markup=get_back_button(),
+                        parse_mode="Markdown",
                     )
                     logger.info(
                         "[covered_call_auto_flow] No call tickers, sent error message"
@@ -2223,16 +2429,7 @@ class SpotHedgerBot:
                 target_delta = total_delta * 0.7
                 hedge_delta = total_delta - target_delta
                 call_quantity = hedge_delta / best_call.delta
-                # Use last_price if mid_price is 0 (when bid/ask are 0)
-                price = (
-                    best_call.mid_price
-                    if best_call.mid_price > 0
-                    else best_call.last_price
-                )
-                # If both are 0, use a fallback price based on strike
-                if price <= 0:
-                    # Use a simple estimate: 3% of strike for calls
-                    price = best_call.strike * 0.03
+                price = self._effective_price(best_call, 0.03)
                 call_income = call_quantity * price
                 logger.info(
                     f"[covered_call_auto_flow] Price calculation: mid_price={best_call.mid_price}, last_price={best_call.last_price}, final_price={price}, income={call_income}"
@@ -2251,11 +2448,7 @@ class SpotHedgerBot:
                     f"• Income: ${call_income:,.2f}\n"
                     f"• Risk Reduction: ${risk_reduction:,.2f}\n\n"
                     f"*Greeks:*\n"
-                    f"• Delta: {best_call.delta:.4f}\n"
-                    f"• Gamma: {best_call.gamma:.6f}\n"
-                    f"• Theta: {best_call.theta:.4f}\n"
-                    f"• Vega: {best_call.vega:.4f}\n"
-                    f"• IV: {best_call.implied_volatility:.1%}\n\n"
+                    f"{best_call.greeks_text}\n"
                     f"This will generate income while limiting upside potential."
                 )
                 context.user_data["pending_hedge"] = {
@@ -2269,7 +2462,8 @@ class SpotHedgerBot:
                     "target_delta": target_delta,
                     "option_contract": best_call,
                 }
-                await query.edit_message_text(
+                await self._safe_edit(
+                    query,
                     text,
                     reply_markup=get_confirmation_buttons("hedge"),
                     parse_mode="Markdown",
@@ -2283,8 +2477,8 @@ class SpotHedgerBot:
                 f"❌ Error loading options data: {str(e)}\n\n"
                 f"Try perpetual delta-neutral hedge instead."
             )
-            await query.edit_message_text(
-                text, reply_markup=get_back_button(), parse_mode="Markdown"
+            await self._safe_edit(
+                query, text, reply_markup=get_back_button(), parse_mode="Markdown"
             )
 
     async def covered_call_select_expiry(
@@ -2296,23 +2490,12 @@ class SpotHedgerBot:
             "[covered_call_select] User chose 'Select' - showing expiry options"
         )
         query = update.callback_query
-        from ..exchanges.deribit_options import deribit_options
 
         async with deribit_options:
-            instruments = await deribit_options.get_instruments()
-            call_instruments = [
-                i
-                for i in instruments
-                if i.symbol.startswith("BTC")
-                and i.instrument_type == "option"
-                and "-C" in i.symbol
-            ]
+            call_instruments = await deribit_options.get_options("BTC", "C")
             # Extract unique expiries
-            expiries = sorted(
-                list(set(i.symbol.split("-")[1] for i in call_instruments))
-            )
-            logger.info(f"[covered_call_select_expiry] Available expiries: {expiries}")
-            from telegram import InlineKeyboardMarkup, InlineKeyboardButton
+            expiries = sorted({i.expiry for i in call_instruments})
+            logger.info("[covered_call_select_expiry] Available expiries: %s", expiries)
 
             keyboard = [
                 [
@@ -2324,208 +2507,205 @@ class SpotHedgerBot:
                     )
                 ]
                 for exp in expiries[:10]
-            ]
-            keyboard.append(
-                [InlineKeyboardButton("⬅️ Back", callback_data="hedge|covered_call|{}")]
-            )
+            ] + [_COVERED_CALL_BACK_ROW]
             text = "Select expiry for your covered call:"
-            await query.edit_message_text(
-                text, reply_markup=InlineKeyboardMarkup(keyboard)
+            await self._safe_edit(
+                query, text, reply_markup=InlineKeyboardMarkup(keyboard)
             )
 
     async def covered_call_select_strike(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE, data: dict
     ):
         """Step 2: Let user select strike for chosen expiry."""
+        await self._option_select_strike(update, context, data, kind="C")
+
+    async def covered_call_select_confirm(
+        self, update: Update, context: ContextTypes.DEFAULT_TYPE, data: dict
+    ):
+        """Step 3: Show summary for selected expiry/strike, ask for confirmation."""
+        await self._option_select_confirm(update, context, data, kind="C")
+
+    async def _option_select_strike(
+        self,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE,
+        data: dict,
+        *,
+        kind: Literal["P", "C"],
+    ):
+        """Let user select a strike for the chosen expiry.
+
+        Args:
+            update: Telegram update carrying the callback query.
+            context: Handler context.
+            data: Parsed callback data with the selected expiry.
+            kind: Option kind, "P" for protective puts, "C" for covered calls.
+        """
+        flow = _OPTION_SELECT_FLOWS[kind]
+        tag = f"[{flow['name']}_select_strike]"
         logger = logging.getLogger(__name__)
         query = update.callback_query
         expiry = data.get("expiry")
-        logger.info(f"[covered_call_select_strike] Entered with expiry={expiry}")
-        from ..exchanges.deribit_options import deribit_options
+        logger.info("%s Entered with expiry=%s", tag, expiry)
 
         try:
             async with deribit_options:
-                instruments = await deribit_options.get_instruments()
-                logger.info(
-                    f"[covered_call_select_strike] Got {len(instruments)} instruments"
+                # Get the options and the current price to find strikes around it
+                options, current_price = await asyncio.gather(
+                    deribit_options.get_options_by_expiry("BTC", kind, expiry),
+                    self.get_current_price("BTC-USDT-PERP"),
                 )
-                call_instruments = [
-                    i
-                    for i in instruments
-                    if i.symbol.startswith("BTC")
-                    and i.instrument_type == "option"
-                    and "-C" in i.symbol
-                    and i.symbol.split("-")[1] == expiry
-                ]
                 logger.info(
-                    f"[covered_call_select_strike] Found {len(call_instruments)} calls for expiry {expiry}"
+                    "%s Found %s %s for expiry %s",
+                    tag,
+                    len(options),
+                    flow["plural"],
+                    expiry,
                 )
-                strikes = sorted(
-                    list(set(float(i.symbol.split("-")[2]) for i in call_instruments))
-                )
-                logger.info(f"[covered_call_select_strike] Strikes: {strikes}")
-                print(
-                    f"[covered_call_select_strike] Strikes for expiry {expiry}: {strikes}"
+                strikes = [option.strike for option in options]
+                logger.info("%s Strikes: %s", tag, strikes)
+                logger.info("%s Current price: %s", tag, current_price)
+
+                # Pick the 10 strikes closest to the current price; strikes are
+                # sorted, so they lie within 10 places of the insertion point
+                pos = bisect.bisect_left(strikes, current_price)
+                strikes_around_current = heapq.nsmallest(
+                    10,
+                    strikes[max(pos - 10, 0) : pos + 10],
+                    key=lambda x: abs(x - current_price),
                 )
 
-                # Get current price to find strikes around it
-                current_price = await self.get_current_price("BTC-USDT-PERP")
-                logger.info(
-                    f"[covered_call_select_strike] Current price: {current_price}"
-                )
-
-                # Find strikes 5 below and 5 above current price
-                strikes_around_current = []
-                for strike in strikes:
-                    if len(strikes_around_current) >= 10:  # Max 10 strikes
-                        break
-                    if (
-                        strike <= current_price + 5000
-                        and strike >= current_price - 5000
-                    ):
-                        strikes_around_current.append(strike)
-
-                # If we don't have enough strikes around current price, add more
-                if len(strikes_around_current) < 10:
-                    # Add strikes closest to current price
-                    strikes_sorted_by_distance = sorted(
-                        strikes, key=lambda x: abs(x - current_price)
-                    )
-                    for strike in strikes_sorted_by_distance:
-                        if (
-                            strike not in strikes_around_current
-                            and len(strikes_around_current) < 10
-                        ):
-                            strikes_around_current.append(strike)
-
                 # Sort by strike price (lowest to highest)
                 strikes_around_current.sort()
 
-                from telegram import InlineKeyboardMarkup, InlineKeyboardButton
-
                 keyboard = [
                     [
                         InlineKeyboardButton(
                             f"${int(strike):,}",
-                            callback_data=f"hedge|covered_call_select_confirm|{expiry}|{int(strike)}",
+                            callback_data=f"hedge|{flow['name']}_select_confirm|{expiry}|{int(strike)}",
                         )
                     ]
-                    for strike in strikes_around_current[:10]
-                ]
-                keyboard.append(
-                    [
-                        InlineKeyboardButton(
-                            "⬅️ Back", callback_data="hedge|covered_call_select|{}"
-                        )
-                    ]
-                )
+                    for strike in strikes_around_current
+                ] + [flow["back_row"]]
                 text = f"Select strike for expiry {expiry}:"
-                await query.edit_message_text(
-                    text, reply_markup=InlineKeyboardMarkup(keyboard)
-                )
-                logger.info(
-                    f"[covered_call_select_strike] Sent strike selection message"
+                await self._safe_edit(
+                    query, text, reply_markup=InlineKeyboardMarkup(keyboard)
                 )
+                logger.info("%s Sent strike selection message", tag)
         except Exception as e:
-            logger.error(f"[covered_call_select_strike] Exception: {e}")
-            await query.edit_message_text(
-                f"❌ Error: {e}", reply_markup=get_back_button()
+            logger.error("%s Exception: %s", tag, e)
+            await self._safe_edit(
+                query, f"❌ Error: {e}", reply_markup=get_back_button()
             )
 
-    async def covered_call_select_confirm(
-        self, update: Update, context: ContextTypes.DEFAULT_TYPE, data: dict
+    async def _option_select_confirm(
+        self,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE,
+        data: dict,
+        *,
+        kind: Literal["P", "C"],
     ):
-        """Step 3: Show summary for selected expiry/strike, ask for confirmation."""
+        """Show summary for the selected expiry/strike, ask for confirmation.
+
+        Args:
+            update: Telegram update carrying the callback query.
+            context: Handler context.
+            data: Parsed callback data with the selected expiry and strike.
+            kind: Option kind, "P" for protective puts, "C" for covered calls.
+        """
+        flow = _OPTION_SELECT_FLOWS[kind]
+        tag = f"[{flow['name']}_select_confirm]"
         logger = logging.getLogger(__name__)
-        logger.info(f"[covered_call_select_confirm] Entered with data: {data}")
+        logger.info("%s Entered with data: %s", tag, data)
         query = update.callback_query
         expiry = data.get("expiry")
         strike = float(data.get("strike"))
-        from ..exchanges.deribit_options import deribit_options
 
         async with deribit_options:
-            instruments = await deribit_options.get_instruments()
             # Find the symbol for this expiry/strike
-            symbol = None
-            for i in instruments:
-                if (
-                    i.symbol.startswith("BTC")
-                    and i.instrument_type == "option"
-                    and "-C" in i.symbol
-                ):
-                    parts = i.symbol.split("-")
-                    if parts[1] == expiry and float(parts[2]) == strike:
-                        symbol = i.symbol
-                        break
+            symbol, current_price = await asyncio.gather(
+                deribit_options.find_option_symbol("BTC", kind, expiry, strike),
+                self.get_current_price("BTC-USDT-PERP"),
+            )
             if not symbol:
                 logger.error(
-                    f"[covered_call_select_confirm] Option not found for expiry={expiry}, strike={strike}"
+                    "%s Option not found for expiry=%s, strike=%s",
+                    tag,
+                    expiry,
+                    strike,
                 )
-                await query.edit_message_text(
-                    "❌ Option not found.", reply_markup=get_back_button()
+                await self._safe_edit(
+                    query, "❌ Option not found.", reply_markup=get_back_button()
                 )
                 return
             ticker = await deribit_options.get_option_ticker(symbol)
             if not ticker:
                 logger.error(
-                    f"[covered_call_select_confirm] Option price unavailable for symbol={symbol}"
+                    "%s Option price unavailable for symbol=%s",
+                    tag,
+                    symbol,
                 )
-                await query.edit_message_text(
-                    "❌ Option price unavailable.", reply_markup=get_back_button()
+                await self._safe_edit(
+                    query,
+                    "❌ Option price unavailable.",
+                    reply_markup=get_back_button(),
                 )
                 return
             total_delta = self.portfolio.get_total_delta()
-            target_delta = total_delta * 0.7
+            target_delta = total_delta * flow["target_ratio"]
             hedge_delta = total_delta - target_delta
-            call_quantity = hedge_delta / ticker.delta if abs(ticker.delta) > 0 else 0.0
-            # Use last_price if mid_price is 0 (when bid/ask are 0)
-            price = ticker.mid_price if ticker.mid_price > 0 else ticker.last_price
-            # If both are 0, use a fallback price based on strike
-            if price <= 0:
-                # Use a simple estimate: 3% of strike for calls
-                price = ticker.strike * 0.03
-            call_income = call_quantity * price
+            # Puts have negative delta; size them against its magnitude
+            option_delta = abs(ticker.delta) if kind == "P" else ticker.delta
+            quantity = hedge_delta / option_delta if abs(ticker.delta) > 0 else 0.0
+            price = self._effective_price(ticker, flow["fallback_pct"])
+            premium = quantity * price
             logger.info(
-                f"[covered_call_select_confirm] Price calculation: mid_price={ticker.mid_price}, last_price={ticker.last_price}, final_price={price}, income={call_income}"
-            )
-            risk_reduction = (
-                hedge_delta * (await self.get_current_price("BTC-USDT-PERP")) * 0.08
-            )
+                "%s Price calculation: mid_price=%s, last_price=%s, final_price=%s, %s=%s",
+                tag,
+                ticker.mid_price,
+                ticker.last_price,
+                price,
+                flow["premium_label"].lower(),
+                premium,
+            )
+            risk_reduction = hedge_delta * current_price * flow["risk_factor"]
             logger.info(
-                f"[covered_call_select_confirm] Showing summary for symbol={symbol}, strike={strike}, expiry={expiry}"
+                "%s Showing summary for symbol=%s, strike=%s, expiry=%s",
+                tag,
+                symbol,
+                strike,
+                expiry,
             )
             text = (
-                f"📈 *Covered Call Hedge*\n\n"
+                f"{flow['title']}\n\n"
                 f"Current Portfolio Delta: {total_delta:+.4f} BTC\n"
                 f"Target Delta: {target_delta:+.4f} BTC\n\n"
-                f"*Selected Call:*\n"
+                f"*Selected {flow['label']}:*\n"
                 f"• Symbol: {ticker.symbol}\n"
                 f"• Strike: ${ticker.strike:,.0f}\n"
                 f"• Expiry: {ticker.expiry.strftime('%Y-%m-%d')}\n"
-                f"• Quantity: {call_quantity:.4f} contracts\n"
+                f"• Quantity: {quantity:.4f} contracts\n"
                 f"• Price: ${price:.2f}\n"
-                f"• Income: ${call_income:,.2f}\n"
+                f"• {flow['premium_label']}: ${premium:,.2f}\n"
                 f"• Risk Reduction: ${risk_reduction:,.2f}\n\n"
                 f"*Greeks:*\n"
-                f"• Delta: {ticker.delta:.4f}\n"
-                f"• Gamma: {ticker.gamma:.6f}\n"
-                f"• Theta: {ticker.theta:.4f}\n"
-                f"• Vega: {ticker.vega:.4f}\n"
-                f"• IV: {ticker.implied_volatility:.1%}\n\n"
-                f"This will generate income while limiting upside potential."
+                f"{ticker.greeks_text}\n"
+                f"{flow['outcome']}"
             )
             context.user_data["pending_hedge"] = {
-                "type": "covered_call",
+                "type": flow["name"],
                 "symbol": ticker.symbol,
-                "qty": call_quantity,
+                "qty": quantity,
                 "price": price,
-                "cost": call_income,
+                "cost": premium,
                 "instrument_type": "option",
                 "exchange": "Deribit",
                 "target_delta": target_delta,
                 "option_contract": ticker,
             }
-            await query.edit_message_text(
+            await self._safe_edit(
+                query,
                 text,
                 reply_markup=get_confirmation_buttons("hedge"),
                 parse_mode="Markdown",
@@ -2541,8 +2721,8 @@ class SpotHedgerBot:
 
         if total_delta <= 0:
             text = "❌ *No Collar Needed*\n\nCollars are for long positions only."
-            await query.edit_message_text(
-                text, reply_markup=get_back_button(), parse_mode="Markdown"
+            await self._safe_edit(
+                query, text, reply_markup=get_back_button(), parse_mode="Markdown"
             )
             return
 
@@ -2558,23 +2738,8 @@ class SpotHedgerBot:
             f"Current Portfolio Delta: {total_delta:+.4f} BTC\n\n"
             f"How would you like to select your collar options?"
         )
-        from telegram import InlineKeyboardMarkup, InlineKeyboardButton
-
-        keyboard = InlineKeyboardMarkup(
-            [
-                [
-                    InlineKeyboardButton(
-                        "🔍 Select", callback_data="hedge|collar_select|{}"
-                    ),
-                    InlineKeyboardButton(
-                        "⚡ Automatic", callback_data="hedge|collar_auto|{}"
-                    ),
-                ],
-                [InlineKeyboardButton("⬅️ Back", callback_data="back")],
-            ]
-        )
-        await query.edit_message_text(
-            text, reply_markup=keyboard, parse_mode="Markdown"
+        await self._safe_edit(
+            query, text, reply_markup=_COLLAR_MENU_MARKUP, parse_mode="Markdown"
         )
 
     async def collar_auto_flow(
@@ -2584,29 +2749,25 @@ class SpotHedgerBot:
         query = update.callback_query
         total_delta = self.portfolio.get_total_delta()
         logger.info("[collar_auto_flow] Entered function")
-        try:
-            from ..exchanges.deribit_options import deribit_options
 
+        # Nothing to hedge; skip loading options entirely
+        if abs(total_delta) < 0.01:
+            text = "✅ *Portfolio Already Delta-Neutral*\n\nNo collar needed - your portfolio is already delta-neutral."
+            await self._safe_edit(
+                query, text, reply_markup=get_back_button(), parse_mode="Markdown"
+            )
+            return
+
+        try:
             logger.info("[collar_auto_flow] Before async with deribit_options")
             async with deribit_options:
                 logger.info("[collar_auto_flow] Inside async with deribit_options")
-                instruments = await deribit_options.get_instruments()
-                put_instruments = [
-                    i
-                    for i in instruments
-                    if i.symbol.startswith("BTC")
-                    and i.instrument_type == "option"
-                    and "-P" in i.symbol
-                ]
-                call_instruments = [
-                    i
-                    for i in instruments
-                    if i.symbol.startswith("BTC")
-                    and i.instrument_type == "option"
-                    and "-C" in i.symbol
-                ]
+                put_instruments = await deribit_options.get_options("BTC", "P")
+                call_instruments = await deribit_options.get_options("BTC", "C")
                 logger.info(
-                    f"[collar_auto_flow] Found {len(put_instruments)} put and {len(call_instruments)} call instruments"
+                    "[collar_auto_flow] Found {} put and {} call instruments",
+                    len(put_instruments),
+                    len(call_instruments),
                 )
                 if not put_instruments or not call_instruments:
                     text = (
@@ -2615,100 +2776,99 @@ class SpotHedgerBot:
                         f"❌ Insufficient options available for collar.\n\n"
                         f"Try perpetual delta-neutral hedge instead."
                     )
-                    await query.edit_message_text(
-                        text, reply_markup=get_back_button(), parse_mode="Markdown"
+                    await self._safe_edit(
+                        query,
+                        text,
+                        reply_markup=get_back_button(),
+                        parse_mode="Markdown",
                     )
                     logger.info(
                         "[collar_auto_flow] Insufficient options, sent error message"
                     )
                     return
                 current_price = await self.get_current_price("BTC-USDT-PERP")
-                logger.info(f"[collar_auto_flow] Got current price: {current_price}")
-                # Find 10 closest puts and calls to ATM
-                closest_puts = sorted(
-                    put_instruments,
-                    key=lambda x: abs(
-                        x.symbol.split("-")[2]
-                        and float(x.symbol.split("-")[2]) - current_price
-                    ),
-                )[:10]
-                closest_calls = sorted(
-                    call_instruments,
-                    key=lambda x: abs(
-                        x.symbol.split("-")[2]
-                        and float(x.symbol.split("-")[2]) - current_price
-                    ),
-                )[:10]
-                # Fetch tickers for these
-                put_options = []
-                call_options = []
-                for inst in closest_puts:
-                    ticker = await deribit_options.get_option_ticker(inst.symbol)
-                    if ticker:
-                        put_options.append(ticker)
-                for inst in closest_calls:
-                    ticker = await deribit_options.get_option_ticker(inst.symbol)
-                    if ticker:
-                        call_options.append(ticker)
-                logger.info(
-                    f"[collar_auto_flow] Got {len(put_options)} put and {len(call_options)} call tickers"
+                logger.info("[collar_auto_flow] Got current price: {}", current_price)
+                # Find 10 puts closest to the 95% protection level and the 10
+                # lowest OTM calls, so no tickers are fetched for unusable legs
+                put_target = current_price * 0.95
+                closest_puts = heapq.nsmallest(
+                    10, put_instruments, key=lambda x: abs(x.strike - put_target)
                 )
-                if not put_options or not call_options:
+                closest_calls = heapq.nsmallest(
+                    10,
+                    (x for x in call_instruments if x.strike > current_price * 1.10),
+                    key=lambda x: x.strike,
+                )
+                if not closest_calls:
                     text = (
                         f"🔒 *Collar Hedge*\n\n"
                         f"Current Portfolio Delta: {total_delta:+.4f} BTC\n"
-                        f"❌ No options with price data available for collar.\n\n"
+                        f"❌ No suitable OTM calls available for collar.\n\n"
                         f"Try perpetual delta-neutral hedge instead."
                     )
-                    await query.edit_message_text(
-                        text, reply_markup=get_back_button(), parse_mode="Markdown"
+                    await self._safe_edit(
+                        query,
+                        text,
+                        reply_markup=get_back_button(),
+                        parse_mode="Markdown",
                     )
-                    logger.info("[collar_auto_flow] No tickers, sent error message")
+                    logger.info("[collar_auto_flow] No OTM calls, sent error message")
                     return
-                # Find ATM put and OTM call
-                best_put = min(
-                    put_options, key=lambda x: abs(x.strike - current_price * 0.95)
+                # Price both legs from a single book summary request
+                put_symbols = {i.symbol for i in closest_puts}
+                tickers = await deribit_options.get_option_tickers(
+                    [i.symbol for i in closest_puts]
+                    + [i.symbol for i in closest_calls],
+                    timeout=self.ticker_timeout,
                 )
-                otm_calls = [
-                    opt for opt in call_options if opt.strike > current_price * 1.10
-                ]
-                if not otm_calls:
+                put_options = [t for t in tickers if t.symbol in put_symbols]
+                call_options = [t for t in tickers if t.symbol not in put_symbols]
+                logger.info(
+                    "[collar_auto_flow] Got {} put and {} call tickers",
+                    len(put_options),
+                    len(call_options),
+                )
+                if not put_options or not call_options:
                     text = (
                         f"🔒 *Collar Hedge*\n\n"
                         f"Current Portfolio Delta: {total_delta:+.4f} BTC\n"
-                        f"❌ No suitable OTM calls available for collar.\n\n"
+                        f"❌ No options with price data available for collar.\n\n"
                         f"Try perpetual delta-neutral hedge instead."
                     )
-                    await query.edit_message_text(
-                        text, reply_markup=get_back_button(), parse_mode="Markdown"
+                    await self._safe_edit(
+                        query,
+                        text,
+                        reply_markup=get_back_button(),
+                        parse_mode="Markdown",
                     )
-                    logger.info("[collar_auto_flow] No OTM calls, sent error message")
+                    logger.info("[collar_auto_flow] No tickers, sent error message")
                     return
-                best_call = min(otm_calls, key=lambda x: x.strike)
+                # Find ATM put and OTM call
+                # Track the best leg of each side in a single pass
+                best_put = None
+                best_put_distance = float("inf")
+                for option in put_options:
+                    distance = abs(option.strike - put_target)
+                    if distance < best_put_distance:
+                        best_put, best_put_distance = option, distance
+                best_call = call_options[0]
+                for option in call_options:
+                    if option.strike < best_call.strike:
+                        best_call = option
                 # Calculate collar quantities
                 put_quantity = total_delta / abs(best_put.delta)
                 call_quantity = total_delta / best_call.delta
                 # Net cost (put cost - call premium)
-                # Use last_price if mid_price is 0 (when bid/ask are 0)
-                put_price = (
-                    best_put.mid_price
-                    if best_put.mid_price > 0
-                    else best_put.last_price
-                )
-                call_price = (
-                    best_call.mid_price
-                    if best_call.mid_price > 0
-                    else best_call.last_price
-                )
-                # If both are 0, use fallback prices based on strike
-                if put_price <= 0:
-                    put_price = best_put.strike * 0.05  # 5% of strike for puts
-                if call_price <= 0:
-                    call_price = best_call.strike * 0.03  # 3% of strike for calls
+                put_price = self._effective_price(best_put, 0.05)
+                call_price = self._effective_price(best_call, 0.03)
                 put_cost = put_quantity * put_price
                 call_income = call_quantity * call_price
                 logger.info(
-                    f"[collar_auto_flow] Put price: {put_price}, Call price: {call_price}, Put cost: {put_cost}, Call income: {call_income}"
+                    "[collar_auto_flow] Put price: {}, Call price: {}, Put cost: {}, Call income: {}",
+                    put_price,
+                    call_price,
+                    put_cost,
+                    call_income,
                 )
                 net_cost = put_cost - call_income
                 # Risk reduction
@@ -2751,22 +2911,34 @@ class SpotHedgerBot:
                         "call_qty": call_quantity,
                     },
                 }
-                await query.edit_message_text(
+                await self._safe_edit(
+                    query,
                     text,
                     reply_markup=get_confirmation_buttons("hedge"),
                     parse_mode="Markdown",
                 )
                 logger.info("[collar_auto_flow] Sent confirmation message")
+        except asyncio.TimeoutError:
+            logger.warning("[collar_auto_flow] Timed out fetching option prices")
+            text = (
+                f"🔒 *Collar Hedge*\n\n"
+                f"Current Portfolio Delta: {total_delta:+.4f} BTC\n"
+                f"❌ Timed out fetching option prices from Deribit.\n\n"
+                f"Please try again, or use a perpetual delta-neutral hedge instead."
+            )
+            await self._safe_edit(
+                query, text, reply_markup=get_back_button(), parse_mode="Markdown"
+            )
         except Exception as e:
-            logger.error(f"[collar_auto_flow] Exception: {e}")
+            logger.error("[collar_auto_flow] Exception: {}", e)
             text = (
                 f"🔒 *Collar Hedge*\n\n"
                 f"Current Portfolio Delta: {total_delta:+.4f} BTC\n"
                 f"❌ Error loading options data: {str(e)}\n\n"
                 f"Try perpetual delta-neutral hedge instead."
             )
-            await query.edit_message_text(
-                text, reply_markup=get_back_button(), parse_mode="Markdown"
+            await self._safe_edit(
+                query, text, reply_markup=get_back_button(), parse_mode="Markdown"
             )
 
     async def collar_select_expiry(
@@ -2776,30 +2948,26 @@ class SpotHedgerBot:
         logger = logging.getLogger(__name__)
         logger.info("[collar_select] User chose 'Select' - showing expiry options")
         query = update.callback_query
-        from ..exchanges.deribit_options import deribit_options
+        total_delta = self.portfolio.get_total_delta()
+
+        # Nothing to hedge; skip loading options entirely
+        if abs(total_delta) < 0.01:
+            text = "✅ *Portfolio Already Delta-Neutral*\n\nNo collar needed - your portfolio is already delta-neutral."
+            await self._safe_edit(
+                query, text, reply_markup=get_back_button(), parse_mode="Markdown"
+            )
+            return
 
         async with deribit_options:
-            instruments = await deribit_options.get_instruments()
-            put_instruments = [
-                i
-                for i in instruments
-                if i.symbol.startswith("BTC")
-                and i.instrument_type == "option"
-                and "-P" in i.symbol
-            ]
-            call_instruments = [
-                i
-                for i in instruments
-                if i.symbol.startswith("BTC")
-                and i.instrument_type == "option"
-                and "-C" in i.symbol
-            ]
+            put_instruments = await deribit_options.get_options("BTC", "P")
+            call_instruments = await deribit_options.get_options("BTC", "C")
             # Extract unique expiries (common to both puts and calls)
-            put_expiries = set(i.symbol.split("-")[1] for i in put_instruments)
-            call_expiries = set(i.symbol.split("-")[1] for i in call_instruments)
-            common_expiries = sorted(list(put_expiries.intersection(call_expiries)))
-            logger.info(f"[collar_select_expiry] Available expiries: {common_expiries}")
-            from telegram import InlineKeyboardMarkup, InlineKeyboardButton
+            put_expiries = {i.expiry for i in put_instruments}
+            call_expiries = {i.expiry for i in call_instruments}
+            common_expiries = sorted(put_expiries & call_expiries)
+            logger.info(
+                "[collar_select_expiry] Available expiries: %s", common_expiries
+            )
 
             keyboard = [
                 [
@@ -2816,8 +2984,8 @@ class SpotHedgerBot:
                 [InlineKeyboardButton("⬅️ Back", callback_data="hedge|collar|{}")]
             )
             text = "Select expiry for your collar (both put and call):"
-            await query.edit_message_text(
-                text, reply_markup=InlineKeyboardMarkup(keyboard)
+            await self._safe_edit(
+                query, text, reply_markup=InlineKeyboardMarkup(keyboard)
             )
 
     async def collar_select_strike(
@@ -2827,151 +2995,73 @@ class SpotHedgerBot:
         logger = logging.getLogger(__name__)
         query = update.callback_query
         expiry = data.get("expiry")
-        logger.info(f"[collar_select_strike] Entered with expiry={expiry}")
-        from ..exchanges.deribit_options import deribit_options
+        logger.info("[collar_select_strike] Entered with expiry=%s", expiry)
 
         try:
             async with deribit_options:
-                instruments = await deribit_options.get_instruments()
-                logger.info(
-                    f"[collar_select_strike] Got {len(instruments)} instruments"
-                )
-                put_instruments = [
-                    i
-                    for i in instruments
-                    if i.symbol.startswith("BTC")
-                    and i.instrument_type == "option"
-                    and "-P" in i.symbol
-                    and i.symbol.split("-")[1] == expiry
-                ]
-                call_instruments = [
-                    i
-                    for i in instruments
-                    if i.symbol.startswith("BTC")
-                    and i.instrument_type == "option"
-                    and "-C" in i.symbol
-                    and i.symbol.split("-")[1] == expiry
-                ]
-                logger.info(
-                    f"[collar_select_strike] Found {len(put_instruments)} puts and {len(call_instruments)} calls for expiry {expiry}"
-                )
-                put_strikes = sorted(
-                    list(set(float(i.symbol.split("-")[2]) for i in put_instruments))
+                # Both legs come pre-partitioned and sorted by strike
+                put_instruments = await deribit_options.get_options_by_expiry(
+                    "BTC", "P", expiry
                 )
-                call_strikes = sorted(
-                    list(set(float(i.symbol.split("-")[2]) for i in call_instruments))
+                call_instruments = await deribit_options.get_options_by_expiry(
+                    "BTC", "C", expiry
                 )
-                logger.info(f"[collar_select_strike] Put strikes: {put_strikes}")
-                logger.info(f"[collar_select_strike] Call strikes: {call_strikes}")
-                print(
-                    f"[collar_select_strike] Put strikes for expiry {expiry}: {put_strikes}"
-                )
-                print(
-                    f"[collar_select_strike] Call strikes for expiry {expiry}: {call_strikes}"
+                logger.info(
+                    "[collar_select_strike] Found %s puts and %s calls for expiry %s",
+                    len(put_instruments),
+                    len(call_instruments),
+                    expiry,
                 )
+                put_strikes = [i.strike for i in put_instruments]
+                call_strikes = [i.strike for i in call_instruments]
+                logger.debug("[collar_select_strike] Put strikes: %s", put_strikes)
+                logger.debug("[collar_select_strike] Call strikes: %s", call_strikes)
 
                 # Get current price to find strikes around it
                 current_price = await self.get_current_price("BTC-USDT-PERP")
-                logger.info(f"[collar_select_strike] Current price: {current_price}")
+                logger.info("[collar_select_strike] Current price: %s", current_price)
 
                 # Find strikes around current price for both puts and calls
-                put_strikes_around_current = []
-                call_strikes_around_current = []
-
-                for strike in put_strikes:
-                    if len(put_strikes_around_current) >= 5:  # Max 5 put strikes
-                        break
-                    if (
-                        strike <= current_price + 3000
-                        and strike >= current_price - 3000
-                    ):
-                        put_strikes_around_current.append(strike)
-
-                for strike in call_strikes:
-                    if len(call_strikes_around_current) >= 5:  # Max 5 call strikes
-                        break
-                    if (
-                        strike <= current_price + 5000
-                        and strike >= current_price + 1000  # OTM calls only
-                    ):
-                        call_strikes_around_current.append(strike)
-
-                # If we don't have enough strikes, add more
-                if len(put_strikes_around_current) < 5:
-                    put_strikes_sorted_by_distance = sorted(
-                        put_strikes, key=lambda x: abs(x - current_price)
-                    )
-                    for strike in put_strikes_sorted_by_distance:
-                        if (
-                            strike not in put_strikes_around_current
-                            and len(put_strikes_around_current) < 5
-                        ):
-                            put_strikes_around_current.append(strike)
-
-                if len(call_strikes_around_current) < 5:
-                    call_strikes_sorted_by_distance = sorted(
-                        call_strikes, key=lambda x: abs(x - current_price)
-                    )
-                    for strike in call_strikes_sorted_by_distance:
-                        if (
-                            strike not in call_strikes_around_current
-                            and len(call_strikes_around_current) < 5
-                        ):
-                            call_strikes_around_current.append(strike)
-
-                # Sort by strike price (lowest to highest)
-                put_strikes_around_current.sort()
-                call_strikes_around_current.sort()
-
-                from telegram import InlineKeyboardMarkup, InlineKeyboardButton
+                put_strikes_around_current = _pick_strikes(
+                    put_strikes, current_price, -3000, 3000
+                )
+                call_strikes_around_current = _pick_strikes(
+                    call_strikes, current_price, 1000, 5000  # OTM calls only
+                )
 
                 # Create keyboard with put and call strikes
-                keyboard = []
-
-                # Add put strikes section
-                keyboard.append(
-                    [InlineKeyboardButton("🛡️ PUT STRIKES:", callback_data="info")]
-                )
-                for strike in put_strikes_around_current[:5]:
-                    keyboard.append(
+                keyboard = (
+                    [[InlineKeyboardButton("🛡️ PUT STRIKES:", callback_data="info")]]
+                    + [
                         [
                             InlineKeyboardButton(
                                 f"🛡️ ${int(strike):,}",
                                 callback_data=f"hedge|collar_select_confirm|{expiry}|put|{int(strike)}",
                             )
                         ]
-                    )
-
-                # Add call strikes section
-                keyboard.append(
-                    [InlineKeyboardButton("📈 CALL STRIKES:", callback_data="info")]
-                )
-                for strike in call_strikes_around_current[:5]:
-                    keyboard.append(
+                        for strike in put_strikes_around_current
+                    ]
+                    + [[InlineKeyboardButton("📈 CALL STRIKES:", callback_data="info")]]
+                    + [
                         [
                             InlineKeyboardButton(
                                 f"📈 ${int(strike):,}",
                                 callback_data=f"hedge|collar_select_confirm|{expiry}|call|{int(strike)}",
                             )
                         ]
-                    )
-
-                keyboard.append(
-                    [
-                        InlineKeyboardButton(
-                            "⬅️ Back", callback_data="hedge|collar_select|{}"
-                        )
+                        for strike in call_strikes_around_current
                     ]
+                    + [_COLLAR_SELECT_BACK_ROW]
                 )
                 text = f"Select strike for expiry {expiry}:\n\n🛡️ Choose a PUT strike (protection)\n📈 Choose a CALL strike (income)"
-                await query.edit_message_text(
-                    text, reply_markup=InlineKeyboardMarkup(keyboard)
+                await self._safe_edit(
+                    query, text, reply_markup=InlineKeyboardMarkup(keyboard)
                 )
-                logger.info(f"[collar_select_strike] Sent strike selection message")
+                logger.info("[collar_select_strike] Sent strike selection message")
         except Exception as e:
-            logger.error(f"[collar_select_strike] Exception: {e}")
-            await query.edit_message_text(
-                f"❌ Error: {e}", reply_markup=get_back_button()
+            logger.error("[collar_select_strike] Exception: %s", e)
+            await self._safe_edit(
+                query, f"❌ Error: {e}", reply_markup=get_back_button()
             )
 
     async def collar_select_confirm(
@@ -2979,42 +3069,38 @@ class SpotHedgerBot:
     ):
         """Step 3: Store selected option and check if both legs are selected."""
         logger = logging.getLogger(__name__)
-        logger.info(f"[collar_select_confirm] Entered with data: {data}")
+        logger.info("[collar_select_confirm] Entered with data: %s", data)
         query = update.callback_query
         expiry = data.get("expiry")
         option_type = data.get("option_type")  # "put" or "call"
         strike = float(data.get("strike"))
-        from ..exchanges.deribit_options import deribit_options
 
         async with deribit_options:
-            instruments = await deribit_options.get_instruments()
             # Find the symbol for this expiry/strike/type
-            symbol = None
-            for i in instruments:
-                if (
-                    i.symbol.startswith("BTC")
-                    and i.instrument_type == "option"
-                    and f"-{option_type.upper()[0]}" in i.symbol
-                ):
-                    parts = i.symbol.split("-")
-                    if parts[1] == expiry and float(parts[2]) == strike:
-                        symbol = i.symbol
-                        break
+            symbol = await deribit_options.find_option_symbol(
+                "BTC", option_type.upper()[0], expiry, strike
+            )
             if not symbol:
                 logger.error(
-                    f"[collar_select_confirm] Option not found for expiry={expiry}, strike={strike}, type={option_type}"
+                    "[collar_select_confirm] Option not found for expiry=%s, strike=%s, type=%s",
+                    expiry,
+                    strike,
+                    option_type,
                 )
-                await query.edit_message_text(
-                    "❌ Option not found.", reply_markup=get_back_button()
+                await self._safe_edit(
+                    query, "❌ Option not found.", reply_markup=get_back_button()
                 )
                 return
             ticker = await deribit_options.get_option_ticker(symbol)
             if not ticker:
                 logger.error(
-                    f"[collar_select_confirm] Option price unavailable for symbol={symbol}"
+                    "[collar_select_confirm] Option price unavailable for symbol=%s",
+                    symbol,
                 )
-                await query.edit_message_text(
-                    "❌ Option price unavailable.", reply_markup=get_back_button()
+                await self._safe_edit(
+                    query,
+                    "❌ Option price unavailable.",
+                    reply_markup=get_back_button(),
                 )
                 return
 
@@ -3030,7 +3116,7 @@ class SpotHedgerBot:
             }
 
             logger.info(
-                f"[collar_select_confirm] Stored {option_type} selection: {symbol}"
+                "[collar_select_confirm] Stored %s selection: %s", option_type, symbol
             )
 
             # Check if both put and call are selected
@@ -3047,7 +3133,6 @@ class SpotHedgerBot:
                     f"• Strike: ${strike:,.0f}\n\n"
                     f"Now select your {remaining_type} strike to complete the collar."
                 )
-                from telegram import InlineKeyboardMarkup, InlineKeyboardButton
 
                 keyboard = [
                     [
@@ -3056,14 +3141,11 @@ class SpotHedgerBot:
                             callback_data=f"hedge|collar_select_strike|{expiry}",
                         )
                     ],
-                    [
-                        InlineKeyboardButton(
-                            "⬅️ Back", callback_data="hedge|collar_select|{}"
-                        )
-                    ],
+                    _COLLAR_SELECT_BACK_ROW,
                 ]
 
-                await query.edit_message_text(
+                await self._safe_edit(
+                    query,
                     text,
                     reply_markup=InlineKeyboardMarkup(keyboard),
                     parse_mode="Markdown",
@@ -3082,7 +3164,8 @@ class SpotHedgerBot:
         call_data = collar_selection.get("call")
 
         if not put_data or not call_data:
-            await query.edit_message_text(
+            await self._safe_edit(
+                query,
                 "❌ Error: Both put and call must be selected for collar.",
                 reply_markup=get_back_button(),
             )
@@ -3104,19 +3187,8 @@ class SpotHedgerBot:
         )
 
         # Calculate prices with fallbacks
-        put_price = (
-            put_ticker.mid_price if put_ticker.mid_price > 0 else put_ticker.last_price
-        )
-        if put_price <= 0:
-            put_price = put_ticker.strike * 0.05
-
-        call_price = (
-            call_ticker.mid_price
-            if call_ticker.mid_price > 0
-            else call_ticker.last_price
-        )
-        if call_price <= 0:
-            call_price = call_ticker.strike * 0.03
+        put_price = self._effective_price(put_ticker, 0.05)
+        call_price = self._effective_price(call_ticker, 0.03)
 
         put_cost = put_quantity * put_price
         call_income = call_quantity * call_price
@@ -3126,7 +3198,10 @@ class SpotHedgerBot:
         risk_reduction = total_delta * current_price * 0.20
 
         logger.info(
-            f"[show_collar_summary] Put cost: {put_cost}, Call income: {call_income}, Net cost: {net_cost}"
+            "[show_collar_summary] Put cost: %s, Call income: %s, Net cost: %s",
+            put_cost,
+            call_income,
+            net_cost,
         )
 
         text = (
@@ -3174,7 +3249,8 @@ class SpotHedgerBot:
             },
         }
 
-        await query.edit_message_text(
+        await self._safe_edit(
+            query,
             text,
             reply_markup=get_confirmation_buttons("hedge"),
             parse_mode="Markdown",
@@ -3190,8 +3266,8 @@ class SpotHedgerBot:
 
         if abs(total_delta) < 0.01:
             text = "✅ *Portfolio Already Delta-Neutral*\n\nNo dynamic hedge needed - your portfolio is already delta-neutral."
-            await query.edit_message_text(
-                text, reply_markup=get_back_button(), parse_mode="Markdown"
+            await self._safe_edit(
+                query, text, reply_markup=get_back_button(), parse_mode="Markdown"
             )
             return
 
@@ -3204,42 +3280,39 @@ class SpotHedgerBot:
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
         """Automatic dynamic hedge flow - bot finds the best option."""
-        import logging
-
         logger = logging.getLogger(__name__)
         logger.info("[dynamic_hedge_auto_flow] Starting automatic dynamic hedge")
         query = update.callback_query
 
         total_delta = self.portfolio.get_total_delta()
 
+        # Nothing to hedge; skip loading options entirely
+        if abs(total_delta) < 0.01:
+            text = "✅ *Portfolio Already Delta-Neutral*\n\nNo dynamic hedge needed - your portfolio is already delta-neutral."
+            await self._safe_edit(
+                query, text, reply_markup=get_back_button(), parse_mode="Markdown"
+            )
+            return
+
         try:
             # Get option chain for dynamic hedge (ultra-fast approach)
-            from ..exchanges.deribit_options import deribit_options
-
             async with deribit_options:
                 # Get current price first
                 current_price = await self.get_current_price("BTC-USDT-PERP")
 
-                # Get only a small sample of instruments for speed
-                instruments = await deribit_options.get_instruments()
-
-                # Filter to BTC options and limit to 10 closest to current price
-                btc_options = []
-                for i in instruments:
-                    if i.symbol.startswith("BTC") and i.instrument_type == "option":
-                        parts = i.symbol.split("-")
-                        if len(parts) >= 4:  # Valid option symbol
-                            try:
-                                strike = float(parts[2])
-                                # Only consider options within 10% of current price (tighter filter)
-                                if abs(strike - current_price) <= current_price * 0.1:
-                                    btc_options.append((i, abs(strike - current_price)))
-                            except ValueError:
-                                continue
-
-                # Sort by distance from current price and take only top 5
-                btc_options.sort(key=lambda x: x[1])
-                btc_options = [opt[0] for opt in btc_options[:5]]
+                # Long puts offset positive delta and long calls offset
+                # negative delta, so only load the side that can hedge. Only
+                # consider options within 10% of current price and keep the
+                # 5 closest
+                candidates = await deribit_options.get_options_in_range(
+                    "BTC",
+                    "P" if total_delta > 0 else "C",
+                    current_price * 0.9,
+                    current_price * 1.1,
+                )
+                btc_options = heapq.nsmallest(
+                    5, candidates, key=lambda i: abs(i.strike - current_price)
+                )
 
                 if not btc_options:
                     text = (
@@ -3248,17 +3321,33 @@ class SpotHedgerBot:
                         f"❌ No suitable options available for dynamic hedging.\n\n"
                         f"Try perpetual delta-neutral hedge instead."
                     )
-                    await query.edit_message_text(
-                        text, reply_markup=get_back_button(), parse_mode="Markdown"
+                    await self._safe_edit(
+                        query,
+                        text,
+                        reply_markup=get_back_button(),
+                        parse_mode="Markdown",
                     )
                     return
 
-                # Get tickers for only the top 5 options (much faster)
-                option_chain = []
-                for option in btc_options:
-                    ticker = await deribit_options.get_option_ticker(option.symbol)
-                    if ticker:
-                        option_chain.append(ticker)
+                async def report_progress(completed, total):
+                    # Skip the first and last steps; the result replaces the
+                    # message. Progress is cosmetic, so a failed or
+                    # rate-limited edit is dropped rather than retried
+                    if completed % 3 == 0 and 0 < completed < total:
+                        try:
+                            await query.edit_message_text(
+                                f"♻️ *Dynamic Hedge - Automatic*\n\n"
+                                f"Scanning {completed}/{total} options...",
+                                parse_mode="Markdown",
+                            )
+                        except TelegramError as e:
+                            logger.debug("Skipped scan progress update: %s", e)
+
+                # Get tickers for only the top 5 options, concurrently,
+                # showing progress while they arrive
+                option_chain = await self.fetch_option_tickers(
+                    [option.symbol for option in btc_options], report_progress
+                )
 
                 if not option_chain:
                     text = (
@@ -3267,33 +3356,29 @@ class SpotHedgerBot:
                         f"❌ No option prices available for dynamic hedging.\n\n"
                         f"Try perpetual delta-neutral hedge instead."
                     )
-                    await query.edit_message_text(
-                        text, reply_markup=get_back_button(), parse_mode="Markdown"
+                    await self._safe_edit(
+                        query,
+                        text,
+                        reply_markup=get_back_button(),
+                        parse_mode="Markdown",
                     )
                     return
 
-                # Find best option manually (faster than hedge service)
-                best_option = None
-                best_score = 0
-
-                for option in option_chain:
-                    # Calculate effectiveness score
-                    delta_impact = abs(option.delta)
-                    price = (
-                        option.mid_price if option.mid_price > 0 else option.last_price
+                # Find best option manually (faster than hedge service):
+                # score each option by delta impact per unit of cost
+                prices = [
+                    self._effective_price(
+                        option, 0.05 if option.option_type == "put" else 0.03
                     )
-                    if price <= 0:
-                        if option.option_type == "put":
-                            price = option.strike * 0.05
-                        else:
-                            price = option.strike * 0.03
-
-                    # Score based on delta impact vs cost
-                    if price > 0:
-                        score = delta_impact / price
-                        if score > best_score:
-                            best_score = score
-                            best_option = option
+                    for option in option_chain
+                ]
+                scores = [
+                    abs(option.delta) / price
+                    for option, price in zip(option_chain, prices)
+                ]
+                best_index = max(range(len(scores)), key=scores.__getitem__)
+                best_score = scores[best_index]
+                best_option = option_chain[best_index] if best_score > 0 else None
 
                 if not best_option:
                     text = (
@@ -3302,8 +3387,11 @@ class SpotHedgerBot:
                         f"❌ No suitable options found for dynamic hedge.\n\n"
                         f"Try perpetual delta-neutral hedge instead."
                     )
-                    await query.edit_message_text(
-                        text, reply_markup=get_back_button(), parse_mode="Markdown"
+                    await self._safe_edit(
+                        query,
+                        text,
+                        reply_markup=get_back_button(),
+                        parse_mode="Markdown",
                     )
                     return
 
@@ -3316,19 +3404,7 @@ class SpotHedgerBot:
                     else 0.0
                 )
 
-                # Use last_price if mid_price is 0 (when bid/ask are 0)
-                price = (
-                    best_option.mid_price
-                    if best_option.mid_price > 0
-                    else best_option.last_price
-                )
-                # If both are 0, use a fallback price based on strike
-                if price <= 0:
-                    # Use a simple estimate based on option type
-                    if best_option.option_type == "put":
-                        price = best_option.strike * 0.05  # 5% of strike for puts
-                    else:
-                        price = best_option.strike * 0.03  # 3% of strike for calls
+                price = prices[best_index]
                 cost = quantity * price
                 logger.info(
                     f"[dynamic_hedge_auto_flow] Price calculation: mid_price={best_option.mid_price}, last_price={best_option.last_price}, final_price={price}, cost={cost}"
@@ -3355,11 +3431,7 @@ class SpotHedgerBot:
                     f"• Cost: ${cost:,.2f}\n"
                     f"• Effectiveness: {best_score:.2f}\n\n"
                     f"Greeks:\n"
-                    f"• Delta: {best_option.delta:.4f}\n"
-                    f"• Gamma: {best_option.gamma:.6f}\n"
-                    f"• Theta: {best_option.theta:.4f}\n"
-                    f"• Vega: {best_option.vega:.4f}\n"
-                    f"• IV: {best_option.implied_volatility:.1%}\n\n"
+                    f"{best_option.greeks_text}\n"
                     f"Dynamic Features:\n"
                     f"• Auto-rebalancing based on delta changes\n"
                     f"• Real-time Greeks monitoring\n"
@@ -3380,7 +3452,8 @@ class SpotHedgerBot:
                     "option_contract": best_option,
                 }
 
-                await query.edit_message_text(
+                await self._safe_edit(
+                    query,
                     text,
                     reply_markup=get_confirmation_buttons("hedge"),
                     parse_mode="Markdown",
@@ -3394,8 +3467,8 @@ class SpotHedgerBot:
                 f"❌ Error loading options data: {str(e)}\n\n"
                 f"Try perpetual delta-neutral hedge instead."
             )
-            await query.edit_message_text(
-                text, reply_markup=get_back_button(), parse_mode="Markdown"
+            await self._safe_edit(
+                query, text, reply_markup=get_back_button(), parse_mode="Markdown"
             )
 
     async def start_straddle_hedge(
@@ -3411,7 +3484,6 @@ class SpotHedgerBot:
             f"Unlimited profit potential, limited risk.\n\n"
             f"How would you like to select your options?"
         )
-        from telegram import InlineKeyboardMarkup, InlineKeyboardButton
 
         keyboard = InlineKeyboardMarkup(
             [
@@ -3426,9 +3498,7 @@ class SpotHedgerBot:
                 [InlineKeyboardButton("⬅️ Back", callback_data="back")],
             ]
         )
-        await query.edit_message_text(
-            text, reply_markup=keyboard, parse_mode="Markdown"
-        )
+        await self._safe_edit(query, text, reply_markup=keyboard, parse_mode="Markdown")
 
     async def straddle_auto_flow(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
@@ -3444,26 +3514,26 @@ class SpotHedgerBot:
             atm_strike = round(current_price / 1000) * 1000
 
             # Get options data
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
-                    params={"instrument_name": f"BTC-{atm_strike}-C-25JUL25"},
-                ) as response:
-                    if response.status == 200:
-                        call_data = await response.json()
-                        call_price = call_data["result"][0]["mark_price"]
-                    else:
-                        call_price = max(0.01, current_price * 0.05)  # Fallback
-
-                async with session.get(
-                    f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
-                    params={"instrument_name": f"BTC-{atm_strike}-P-25JUL25"},
-                ) as response:
-                    if response.status == 200:
-                        put_data = await response.json()
-                        put_price = put_data["result"][0]["mark_price"]
-                    else:
-                        put_price = max(0.01, current_price * 0.05)  # Fallback
+            session = self._get_http()
+            async with session.get(
+                f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
+                params={"instrument_name": f"BTC-{atm_strike}-C-25JUL25"},
+            ) as response:
+                if response.status == 200:
+                    call_data = await response.json()
+                    call_price = call_data["result"][0]["mark_price"]
+                else:
+                    call_price = max(0.01, current_price * 0.05)  # Fallback
+
+            async with session.get(
+                f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
+                params={"instrument_name": f"BTC-{atm_strike}-P-25JUL25"},
+            ) as response:
+                if response.status == 200:
+                    put_data = await response.json()
+                    put_price = put_data["result"][0]["mark_price"]
+                else:
+                    put_price = max(0.01, current_price * 0.05)  # Fallback
 
             total_cost = call_price + put_price
 
@@ -3496,7 +3566,8 @@ class SpotHedgerBot:
                 },
             }
 
-            await query.edit_message_text(
+            await self._safe_edit(
+                query,
                 text,
                 reply_markup=get_confirmation_buttons("hedge"),
                 parse_mode="Markdown",
@@ -3509,8 +3580,8 @@ class SpotHedgerBot:
                 f"❌ Error loading options data: {str(e)}\n\n"
                 f"Try manual selection instead."
             )
-            await query.edit_message_text(
-                text, reply_markup=get_back_button(), parse_mode="Markdown"
+            await self._safe_edit(
+                query, text, reply_markup=get_back_button(), parse_mode="Markdown"
             )
 
     async def straddle_select_expiry(
@@ -3523,7 +3594,6 @@ class SpotHedgerBot:
             f"🦋 *Straddle Strategy - Select Expiry*\n\n"
             f"Choose the expiry for your straddle:"
         )
-        from telegram import InlineKeyboardMarkup, InlineKeyboardButton
 
         keyboard = InlineKeyboardMarkup(
             [
@@ -3546,9 +3616,7 @@ class SpotHedgerBot:
                 [InlineKeyboardButton("⬅️ Back", callback_data="back")],
             ]
         )
-        await query.edit_message_text(
-            text, reply_markup=keyboard, parse_mode="Markdown"
-        )
+        await self._safe_edit(query, text, reply_markup=keyboard, parse_mode="Markdown")
 
     async def straddle_select_strike(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE, data: dict
@@ -3572,7 +3640,7 @@ class SpotHedgerBot:
                 strike = round((current_price + i * 1000) / 1000) * 1000
                 strikes.append(strike)
 
-            strikes = sorted(list(set(strikes)))  # Remove duplicates and sort
+            strikes = sorted(set(strikes))  # Remove duplicates and sort
 
             text = (
                 f"🦋 *Straddle Strategy - Select Strike*\n\n"
@@ -3580,7 +3648,6 @@ class SpotHedgerBot:
                 f"Current Price: ${current_price:,.2f}\n\n"
                 f"Choose the strike price for your straddle:"
             )
-            from telegram import InlineKeyboardMarkup, InlineKeyboardButton
 
             keyboard = []
             for strike in strikes:
@@ -3592,8 +3659,11 @@ class SpotHedgerBot:
 
             keyboard.append([InlineKeyboardButton("⬅️ Back", callback_data="back")])
 
-            await query.edit_message_text(
-                text, reply_markup=InlineKeyboardMarkup(keyboard), parse_mode="Markdown"
+            await self._safe_edit(
+                query,
+                text,
+                reply_markup=InlineKeyboardMarkup(keyboard),
+                parse_mode="Markdown",
             )
 
         except Exception as e:
@@ -3603,8 +3673,8 @@ class SpotHedgerBot:
                 f"❌ Error loading strikes: {str(e)}\n\n"
                 f"Try automatic selection instead."
             )
-            await query.edit_message_text(
-                text, reply_markup=get_back_button(), parse_mode="Markdown"
+            await self._safe_edit(
+                query, text, reply_markup=get_back_button(), parse_mode="Markdown"
             )
 
     async def straddle_select_confirm(
@@ -3631,26 +3701,26 @@ class SpotHedgerBot:
             current_price = await self.get_current_price("BTC-USDT-PERP")
 
             # Get option prices
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
-                    params={"instrument_name": f"BTC-{strike}-C-{expiry}"},
-                ) as response:
-                    if response.status == 200:
-                        call_data = await response.json()
-                        call_price = call_data["result"][0]["mark_price"]
-                    else:
-                        call_price = max(0.01, abs(current_price - strike) * 0.1)
-
-                async with session.get(
-                    f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
-                    params={"instrument_name": f"BTC-{strike}-P-{expiry}"},
-                ) as response:
-                    if response.status == 200:
-                        put_data = await response.json()
-                        put_price = put_data["result"][0]["mark_price"]
-                    else:
-                        put_price = max(0.01, abs(current_price - strike) * 0.1)
+            session = self._get_http()
+            async with session.get(
+                f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
+                params={"instrument_name": f"BTC-{strike}-C-{expiry}"},
+            ) as response:
+                if response.status == 200:
+                    call_data = await response.json()
+                    call_price = call_data["result"][0]["mark_price"]
+                else:
+                    call_price = max(0.01, abs(current_price - strike) * 0.1)
+
+            async with session.get(
+                f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
+                params={"instrument_name": f"BTC-{strike}-P-{expiry}"},
+            ) as response:
+                if response.status == 200:
+                    put_data = await response.json()
+                    put_price = put_data["result"][0]["mark_price"]
+                else:
+                    put_price = max(0.01, abs(current_price - strike) * 0.1)
 
             total_cost = call_price + put_price
 
@@ -3685,7 +3755,8 @@ class SpotHedgerBot:
                 },
             }
 
-            await query.edit_message_text(
+            await self._safe_edit(
+                query,
                 text,
                 reply_markup=get_confirmation_buttons("hedge"),
                 parse_mode="Markdown",
@@ -3698,8 +3769,8 @@ class SpotHedgerBot:
                 f"❌ Error loading option prices: {str(e)}\n\n"
                 f"Try automatic selection instead."
             )
-            await query.edit_message_text(
-                text, reply_markup=get_back_button(), parse_mode="Markdown"
+            await self._safe_edit(
+                query, text, reply_markup=get_back_button(), parse_mode="Markdown"
             )
 
     async def start_butterfly_hedge(
@@ -3715,7 +3786,6 @@ class SpotHedgerBot:
             f"Limited profit and loss.\n\n"
             f"How would you like to select your options?"
         )
-        from telegram import InlineKeyboardMarkup, InlineKeyboardButton
 
         keyboard = InlineKeyboardMarkup(
             [
@@ -3730,9 +3800,7 @@ class SpotHedgerBot:
                 [InlineKeyboardButton("⬅️ Back", callback_data="back")],
             ]
         )
-        await query.edit_message_text(
-            text, reply_markup=keyboard, parse_mode="Markdown"
-        )
+        await self._safe_edit(query, text, reply_markup=keyboard, parse_mode="Markdown")
 
     async def butterfly_auto_flow(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
@@ -3750,36 +3818,36 @@ class SpotHedgerBot:
             upper_strike = atm_strike + 2000
 
             # Get option prices
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
-                    params={"instrument_name": f"BTC-{lower_strike}-C-25JUL25"},
-                ) as response:
-                    if response.status == 200:
-                        lower_data = await response.json()
-                        lower_price = lower_data["result"][0]["mark_price"]
-                    else:
-                        lower_price = max(0.01, (current_price - lower_strike) * 0.1)
-
-                async with session.get(
-                    f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
-                    params={"instrument_name": f"BTC-{atm_strike}-C-25JUL25"},
-                ) as response:
-                    if response.status == 200:
-                        middle_data = await response.json()
-                        middle_price = middle_data["result"][0]["mark_price"]
-                    else:
-                        middle_price = max(0.01, abs(current_price - atm_strike) * 0.1)
-
-                async with session.get(
-                    f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
-                    params={"instrument_name": f"BTC-{upper_strike}-C-25JUL25"},
-                ) as response:
-                    if response.status == 200:
-                        upper_data = await response.json()
-                        upper_price = upper_data["result"][0]["mark_price"]
-                    else:
-                        upper_price = max(0.01, (upper_strike - current_price) * 0.1)
+            session = self._get_http()
+            async with session.get(
+                f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
+                params={"instrument_name": f"BTC-{lower_strike}-C-25JUL25"},
+            ) as response:
+                if response.status == 200:
+                    lower_data = await response.json()
+                    lower_price = lower_data["result"][0]["mark_price"]
+                else:
+                    lower_price = max(0.01, (current_price - lower_strike) * 0.1)
+
+            async with session.get(
+                f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
+                params={"instrument_name": f"BTC-{atm_strike}-C-25JUL25"},
+            ) as response:
+                if response.status == 200:
+                    middle_data = await response.json()
+                    middle_price = middle_data["result"][0]["mark_price"]
+                else:
+                    middle_price = max(0.01, abs(current_price - atm_strike) * 0.1)
+
+            async with session.get(
+                f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
+                params={"instrument_name": f"BTC-{upper_strike}-C-25JUL25"},
+            ) as response:
+                if response.status == 200:
+                    upper_data = await response.json()
+                    upper_price = upper_data["result"][0]["mark_price"]
+                else:
+                    upper_price = max(0.01, (upper_strike - current_price) * 0.1)
 
             total_cost = lower_price - 2 * middle_price + upper_price
             max_profit = atm_strike - lower_strike - total_cost
@@ -3820,7 +3888,8 @@ class SpotHedgerBot:
                 },
             }
 
-            await query.edit_message_text(
+            await self._safe_edit(
+                query,
                 text,
                 reply_markup=get_confirmation_buttons("hedge"),
                 parse_mode="Markdown",
@@ -3833,8 +3902,8 @@ class SpotHedgerBot:
                 f"❌ Error loading options data: {str(e)}\n\n"
                 f"Try manual selection instead."
             )
-            await query.edit_message_text(
-                text, reply_markup=get_back_button(), parse_mode="Markdown"
+            await self._safe_edit(
+                query, text, reply_markup=get_back_button(), parse_mode="Markdown"
             )
 
     async def butterfly_select_expiry(
@@ -3847,7 +3916,6 @@ class SpotHedgerBot:
             f"🦋 *Butterfly Strategy - Select Expiry*\n\n"
             f"Choose the expiry for your butterfly:"
         )
-        from telegram import InlineKeyboardMarkup, InlineKeyboardButton
 
         keyboard = InlineKeyboardMarkup(
             [
@@ -3870,9 +3938,7 @@ class SpotHedgerBot:
                 [InlineKeyboardButton("⬅️ Back", callback_data="back")],
             ]
         )
-        await query.edit_message_text(
-            text, reply_markup=keyboard, parse_mode="Markdown"
-        )
+        await self._safe_edit(query, text, reply_markup=keyboard, parse_mode="Markdown")
 
     async def butterfly_select_strike(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE, data: dict
@@ -3896,7 +3962,7 @@ class SpotHedgerBot:
                 strike = round((current_price + i * 1000) / 1000) * 1000
                 strikes.append(strike)
 
-            strikes = sorted(list(set(strikes)))  # Remove duplicates and sort
+            strikes = sorted(set(strikes))  # Remove duplicates and sort
 
             text = (
                 f"🦋 *Butterfly Strategy - Select Middle Strike*\n\n"
@@ -3904,7 +3970,6 @@ class SpotHedgerBot:
                 f"Current Price: ${current_price:,.2f}\n\n"
                 f"Choose the middle strike (ATM) for your butterfly:"
             )
-            from telegram import InlineKeyboardMarkup, InlineKeyboardButton
 
             keyboard = []
             for strike in strikes:
@@ -3916,8 +3981,11 @@ class SpotHedgerBot:
 
             keyboard.append([InlineKeyboardButton("⬅️ Back", callback_data="back")])
 
-            await query.edit_message_text(
-                text, reply_markup=InlineKeyboardMarkup(keyboard), parse_mode="Markdown"
+            await self._safe_edit(
+                query,
+                text,
+                reply_markup=InlineKeyboardMarkup(keyboard),
+                parse_mode="Markdown",
             )
 
         except Exception as e:
@@ -3927,8 +3995,8 @@ class SpotHedgerBot:
                 f"❌ Error loading strikes: {str(e)}\n\n"
                 f"Try automatic selection instead."
             )
-            await query.edit_message_text(
-                text, reply_markup=get_back_button(), parse_mode="Markdown"
+            await self._safe_edit(
+                query, text, reply_markup=get_back_button(), parse_mode="Markdown"
             )
 
     async def butterfly_select_confirm(
@@ -3959,38 +4027,36 @@ class SpotHedgerBot:
             upper_strike = middle_strike + 2000
 
             # Get option prices
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
-                    params={"instrument_name": f"BTC-{lower_strike}-C-{expiry}"},
-                ) as response:
-                    if response.status == 200:
-                        lower_data = await response.json()
-                        lower_price = lower_data["result"][0]["mark_price"]
-                    else:
-                        lower_price = max(0.01, (current_price - lower_strike) * 0.1)
-
-                async with session.get(
-                    f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
-                    params={"instrument_name": f"BTC-{middle_strike}-C-{expiry}"},
-                ) as response:
-                    if response.status == 200:
-                        middle_data = await response.json()
-                        middle_price = middle_data["result"][0]["mark_price"]
-                    else:
-                        middle_price = max(
-                            0.01, abs(current_price - middle_strike) * 0.1
-                        )
-
-                async with session.get(
-                    f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
-                    params={"instrument_name": f"BTC-{upper_strike}-C-{expiry}"},
-                ) as response:
-                    if response.status == 200:
-                        upper_data = await response.json()
-                        upper_price = upper_data["result"][0]["mark_price"]
-                    else:
-                        upper_price = max(0.01, (upper_strike - current_price) * 0.1)
+            session = self._get_http()
+            async with session.get(
+                f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
+                params={"instrument_name": f"BTC-{lower_strike}-C-{expiry}"},
+            ) as response:
+                if response.status == 200:
+                    lower_data = await response.json()
+                    lower_price = lower_data["result"][0]["mark_price"]
+                else:
+                    lower_price = max(0.01, (current_price - lower_strike) * 0.1)
+
+            async with session.get(
+                f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
+                params={"instrument_name": f"BTC-{middle_strike}-C-{expiry}"},
+            ) as response:
+                if response.status == 200:
+                    middle_data = await response.json()
+                    middle_price = middle_data["result"][0]["mark_price"]
+                else:
+                    middle_price = max(0.01, abs(current_price - middle_strike) * 0.1)
+
+            async with session.get(
+                f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
+                params={"instrument_name": f"BTC-{upper_strike}-C-{expiry}"},
+            ) as response:
+                if response.status == 200:
+                    upper_data = await response.json()
+                    upper_price = upper_data["result"][0]["mark_price"]
+                else:
+                    upper_price = max(0.01, (upper_strike - current_price) * 0.1)
 
             total_cost = lower_price - 2 * middle_price + upper_price
             max_profit = middle_strike - lower_strike - total_cost
@@ -4032,7 +4098,8 @@ class SpotHedgerBot:
                 },
             }
 
-            await query.edit_message_text(
+            await self._safe_edit(
+                query,
                 text,
                 reply_markup=get_confirmation_buttons("hedge"),
                 parse_mode="Markdown",
@@ -4045,8 +4112,8 @@ class SpotHedgerBot:
                 f"❌ Error loading option prices: {str(e)}\n\n"
                 f"Try automatic selection instead."
             )
-            await query.edit_message_text(
-                text, reply_markup=get_back_button(), parse_mode="Markdown"
+            await self._safe_edit(
+                query, text, reply_markup=get_back_button(), parse_mode="Markdown"
             )
 
     async def start_iron_condor_hedge(
@@ -4062,7 +4129,6 @@ class SpotHedgerBot:
             f"Defined risk and reward.\n\n"
             f"How would you like to select your options?"
         )
-        from telegram import InlineKeyboardMarkup, InlineKeyboardButton
 
         keyboard = InlineKeyboardMarkup(
             [
@@ -4077,9 +4143,7 @@ class SpotHedgerBot:
                 [InlineKeyboardButton("⬅️ Back", callback_data="back")],
             ]
         )
-        await query.edit_message_text(
-            text, reply_markup=keyboard, parse_mode="Markdown"
-        )
+        await self._safe_edit(query, text, reply_markup=keyboard, parse_mode="Markdown")
 
     async def iron_condor_auto_flow(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
@@ -4099,46 +4163,46 @@ class SpotHedgerBot:
             call_upper = atm_strike + 3000
 
             # Get option prices
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
-                    params={"instrument_name": f"BTC-{put_lower}-P-25JUL25"},
-                ) as response:
-                    if response.status == 200:
-                        put_lower_data = await response.json()
-                        put_lower_price = put_lower_data["result"][0]["mark_price"]
-                    else:
-                        put_lower_price = max(0.01, (put_lower - current_price) * 0.1)
-
-                async with session.get(
-                    f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
-                    params={"instrument_name": f"BTC-{put_upper}-P-25JUL25"},
-                ) as response:
-                    if response.status == 200:
-                        put_upper_data = await response.json()
-                        put_upper_price = put_upper_data["result"][0]["mark_price"]
-                    else:
-                        put_upper_price = max(0.01, (put_upper - current_price) * 0.1)
-
-                async with session.get(
-                    f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
-                    params={"instrument_name": f"BTC-{call_lower}-C-25JUL25"},
-                ) as response:
-                    if response.status == 200:
-                        call_lower_data = await response.json()
-                        call_lower_price = call_lower_data["result"][0]["mark_price"]
-                    else:
-                        call_lower_price = max(0.01, (current_price - call_lower) * 0.1)
-
-                async with session.get(
-                    f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
-                    params={"instrument_name": f"BTC-{call_upper}-C-25JUL25"},
-                ) as response:
-                    if response.status == 200:
-                        call_upper_data = await response.json()
-                        call_upper_price = call_upper_data["result"][0]["mark_price"]
-                    else:
-                        call_upper_price = max(0.01, (call_upper - current_price) * 0.1)
+            session = self._get_http()
+            async with session.get(
+                f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
+                params={"instrument_name": f"BTC-{put_lower}-P-25JUL25"},
+            ) as response:
+                if response.status == 200:
+                    put_lower_data = await response.json()
+                    put_lower_price = put_lower_data["result"][0]["mark_price"]
+                else:
+                    put_lower_price = max(0.01, (put_lower - current_price) * 0.1)
+
+            async with session.get(
+                f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
+                params={"instrument_name": f"BTC-{put_upper}-P-25JUL25"},
+            ) as response:
+                if response.status == 200:
+                    put_upper_data = await response.json()
+                    put_upper_price = put_upper_data["result"][0]["mark_price"]
+                else:
+                    put_upper_price = max(0.01, (put_upper - current_price) * 0.1)
+
+            async with session.get(
+                f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
+                params={"instrument_name": f"BTC-{call_lower}-C-25JUL25"},
+            ) as response:
+                if response.status == 200:
+                    call_lower_data = await response.json()
+                    call_lower_price = call_lower_data["result"][0]["mark_price"]
+                else:
+                    call_lower_price = max(0.01, (current_price - call_lower) * 0.1)
+
+            async with session.get(
+                f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
+                params={"instrument_name": f"BTC-{call_upper}-C-25JUL25"},
+            ) as response:
+                if response.status == 200:
+                    call_upper_data = await response.json()
+                    call_upper_price = call_upper_data["result"][0]["mark_price"]
+                else:
+                    call_upper_price = max(0.01, (call_upper - current_price) * 0.1)
 
             net_credit = (
                 put_lower_price - put_upper_price + call_lower_price - call_upper_price
@@ -4189,7 +4253,8 @@ class SpotHedgerBot:
                 },
             }
 
-            await query.edit_message_text(
+            await self._safe_edit(
+                query,
                 text,
                 reply_markup=get_confirmation_buttons("hedge"),
                 parse_mode="Markdown",
@@ -4202,8 +4267,8 @@ class SpotHedgerBot:
                 f"❌ Error loading options data: {str(e)}\n\n"
                 f"Try manual selection instead."
             )
-            await query.edit_message_text(
-                text, reply_markup=get_back_button(), parse_mode="Markdown"
+            await self._safe_edit(
+                query, text, reply_markup=get_back_button(), parse_mode="Markdown"
             )
 
     async def iron_condor_select_expiry(
@@ -4216,7 +4281,6 @@ class SpotHedgerBot:
             f"🦅 *Iron Condor Strategy - Select Expiry*\n\n"
             f"Choose the expiry for your iron condor:"
         )
-        from telegram import InlineKeyboardMarkup, InlineKeyboardButton
 
         keyboard = InlineKeyboardMarkup(
             [
@@ -4243,9 +4307,7 @@ class SpotHedgerBot:
                 [InlineKeyboardButton("⬅️ Back", callback_data="back")],
             ]
         )
-        await query.edit_message_text(
-            text, reply_markup=keyboard, parse_mode="Markdown"
-        )
+        await self._safe_edit(query, text, reply_markup=keyboard, parse_mode="Markdown")
 
     async def iron_condor_select_strike(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE, data: dict
@@ -4269,7 +4331,7 @@ class SpotHedgerBot:
                 strike = round((current_price + i * 1000) / 1000) * 1000
                 strikes.append(strike)
 
-            strikes = sorted(list(set(strikes)))  # Remove duplicates and sort
+            strikes = sorted(set(strikes))  # Remove duplicates and sort
 
             text = (
                 f"🦅 *Iron Condor Strategy - Select Middle Strike*\n\n"
@@ -4277,7 +4339,6 @@ class SpotHedgerBot:
                 f"Current Price: ${current_price:,.2f}\n\n"
                 f"Choose the middle strike (ATM) for your iron condor:"
             )
-            from telegram import InlineKeyboardMarkup, InlineKeyboardButton
 
             keyboard = []
             for strike in strikes:
@@ -4289,8 +4350,11 @@ class SpotHedgerBot:
 
             keyboard.append([InlineKeyboardButton("⬅️ Back", callback_data="back")])
 
-            await query.edit_message_text(
-                text, reply_markup=InlineKeyboardMarkup(keyboard), parse_mode="Markdown"
+            await self._safe_edit(
+                query,
+                text,
+                reply_markup=InlineKeyboardMarkup(keyboard),
+                parse_mode="Markdown",
             )
 
         except Exception as e:
@@ -4300,8 +4364,8 @@ class SpotHedgerBot:
                 f"❌ Error loading strikes: {str(e)}\n\n"
                 f"Try automatic selection instead."
             )
-            await query.edit_message_text(
-                text, reply_markup=get_back_button(), parse_mode="Markdown"
+            await self._safe_edit(
+                query, text, reply_markup=get_back_button(), parse_mode="Markdown"
             )
 
     async def iron_condor_select_confirm(
@@ -4334,46 +4398,46 @@ class SpotHedgerBot:
             call_upper = middle_strike + 3000
 
             # Get option prices
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
-                    params={"instrument_name": f"BTC-{put_lower}-P-{expiry}"},
-                ) as response:
-                    if response.status == 200:
-                        put_lower_data = await response.json()
-                        put_lower_price = put_lower_data["result"][0]["mark_price"]
-                    else:
-                        put_lower_price = max(0.01, (put_lower - current_price) * 0.1)
-
-                async with session.get(
-                    f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
-                    params={"instrument_name": f"BTC-{put_upper}-P-{expiry}"},
-                ) as response:
-                    if response.status == 200:
-                        put_upper_data = await response.json()
-                        put_upper_price = put_upper_data["result"][0]["mark_price"]
-                    else:
-                        put_upper_price = max(0.01, (put_upper - current_price) * 0.1)
-
-                async with session.get(
-                    f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
-                    params={"instrument_name": f"BTC-{call_lower}-C-{expiry}"},
-                ) as response:
-                    if response.status == 200:
-                        call_lower_data = await response.json()
-                        call_lower_price = call_lower_data["result"][0]["mark_price"]
-                    else:
-                        call_lower_price = max(0.01, (current_price - call_lower) * 0.1)
-
-                async with session.get(
-                    f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
-                    params={"instrument_name": f"BTC-{call_upper}-C-{expiry}"},
-                ) as response:
-                    if response.status == 200:
-                        call_upper_data = await response.json()
-                        call_upper_price = call_upper_data["result"][0]["mark_price"]
-                    else:
-                        call_upper_price = max(0.01, (call_upper - current_price) * 0.1)
+            session = self._get_http()
+            async with session.get(
+                f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
+                params={"instrument_name": f"BTC-{put_lower}-P-{expiry}"},
+            ) as response:
+                if response.status == 200:
+                    put_lower_data = await response.json()
+                    put_lower_price = put_lower_data["result"][0]["mark_price"]
+                else:
+                    put_lower_price = max(0.01, (put_lower - current_price) * 0.1)
+
+            async with session.get(
+                f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
+                params={"instrument_name": f"BTC-{put_upper}-P-{expiry}"},
+            ) as response:
+                if response.status == 200:
+                    put_upper_data = await response.json()
+                    put_upper_price = put_upper_data["result"][0]["mark_price"]
+                else:
+                    put_upper_price = max(0.01, (put_upper - current_price) * 0.1)
+
+            async with session.get(
+                f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
+                params={"instrument_name": f"BTC-{call_lower}-C-{expiry}"},
+            ) as response:
+                if response.status == 200:
+                    call_lower_data = await response.json()
+                    call_lower_price = call_lower_data["result"][0]["mark_price"]
+                else:
+                    call_lower_price = max(0.01, (current_price - call_lower) * 0.1)
+
+            async with session.get(
+                f"https://www.deribit.com/api/v2/public/get_book_summary_by_instrument_name",
+                params={"instrument_name": f"BTC-{call_upper}-C-{expiry}"},
+            ) as response:
+                if response.status == 200:
+                    call_upper_data = await response.json()
+                    call_upper_price = call_upper_data["result"][0]["mark_price"]
+                else:
+                    call_upper_price = max(0.01, (call_upper - current_price) * 0.1)
 
             net_credit = (
                 put_lower_price - put_upper_price + call_lower_price - call_upper_price
@@ -4425,7 +4489,8 @@ class SpotHedgerBot:
                 },
             }
 
-            await query.edit_message_text(
+            await self._safe_edit(
+                query,
                 text,
                 reply_markup=get_confirmation_buttons("hedge"),
                 parse_mode="Markdown",
@@ -4438,8 +4503,8 @@ class SpotHedgerBot:
                 f"❌ Error loading option prices: {str(e)}\n\n"
                 f"Try automatic selection instead."
             )
-            await query.edit_message_text(
-                text, reply_markup=get_back_button(), parse_mode="Markdown"
+            await self._safe_edit(
+                query, text, reply_markup=get_back_button(), parse_mode="Markdown"
             )
 
     async def show_active_hedges(
@@ -4455,14 +4520,13 @@ class SpotHedgerBot:
                 f"Create a hedge to see it here."
             )
         else:
-            text = "📂 *Active Hedges*\n\n"
-            for i, hedge in enumerate(self.active_hedges, 1):
-                text += (
-                    f"{i}. {hedge['type'].replace('_', ' ').title()} | {hedge['symbol']} | Qty: {hedge['qty']} @ ${hedge['price']}\n"
-                    f"   Exchange: {hedge['exchange']} | Time: {hedge['timestamp']}\n\n"
-                )
-        await query.edit_message_text(
-            text, reply_markup=get_back_button(), parse_mode="Markdown"
+            text = "📂 *Active Hedges*\n\n" + "".join(
+                f"{i}. {hedge['type'].replace('_', ' ').title()} | {hedge['symbol']} | Qty: {hedge['qty']} @ ${hedge['price']}\n"
+                f"   Exchange: {hedge['exchange']} | Time: {hedge['timestamp']}\n\n"
+                for i, hedge in enumerate(self.active_hedges.values(), 1)
+            )
+        await self._safe_edit(
+            query, text, reply_markup=get_back_button(), parse_mode="Markdown"
         )
 
     async def start_remove_hedge(
@@ -4477,20 +4541,18 @@ class SpotHedgerBot:
                 f"No active hedges to remove.\n\n"
                 f"Create a hedge first to remove it."
             )
-            await query.edit_message_text(
-                text, reply_markup=get_back_button(), parse_mode="Markdown"
+            await self._safe_edit(
+                query, text, reply_markup=get_back_button(), parse_mode="Markdown"
             )
             return
 
-        from telegram import InlineKeyboardMarkup, InlineKeyboardButton
-
         keyboard = []
-        for i, hedge in enumerate(self.active_hedges, 1):
+        for hedge_id, hedge in self.active_hedges.items():
             label = f"Remove {hedge['type'].replace('_', ' ').title()} | {hedge['symbol']} | Qty: {hedge['qty']}"
             keyboard.append(
                 [
                     InlineKeyboardButton(
-                        label, callback_data=f"hedge|remove_hedge_confirm|{i-1}"
+                        label, callback_data=f"hedge|remove_hedge_confirm|{hedge_id}"
                     )
                 ]
             )
@@ -4498,8 +4560,11 @@ class SpotHedgerBot:
             [InlineKeyboardButton("⬅️ Back", callback_data="hedge|view_hedges|{}")]
         )
         text = "🗑️ *Remove Hedge*\n\nSelect a hedge to remove:"
-        await query.edit_message_text(
-            text, reply_markup=InlineKeyboardMarkup(keyboard), parse_mode="Markdown"
+        await self._safe_edit(
+            query,
+            text,
+            reply_markup=InlineKeyboardMarkup(keyboard),
+            parse_mode="Markdown",
         )
 
     async def remove_hedge_confirm(
@@ -4508,8 +4573,9 @@ class SpotHedgerBot:
         """Remove the selected hedge from active_hedges and portfolio positions."""
         query = update.callback_query
         idx = data.get("idx") if isinstance(data, dict) else data
-        if idx is not None and 0 <= idx < len(self.active_hedges):
-            removed = self.active_hedges.pop(idx)
+        removed = self.active_hedges.pop(idx, None)
+        if removed is not None:
+            self._active_hedge_keys.discard(self._hedge_key(removed))
             # Remove the corresponding position from the portfolio
             symbol = removed.get("symbol")
             qty = removed.get("qty")
@@ -4607,8 +4673,8 @@ class SpotHedgerBot:
             )
         else:
             text = "❌ Invalid hedge selection."
-        await query.edit_message_text(
-            text, reply_markup=get_back_button(), parse_mode="Markdown"
+        await self._safe_edit(
+            query, text, reply_markup=get_back_button(), parse_mode="Markdown"
         )
 
     async def confirm_hedge_action(
@@ -4619,7 +4685,8 @@ class SpotHedgerBot:
 
         hedge = context.user_data.get("pending_hedge")
         if not hedge:
-            await query.edit_message_text(
+            await self._safe_edit(
+                query,
                 "No pending hedge found.",
                 reply_markup=get_back_button(),
                 parse_mode="Markdown",
@@ -4631,15 +4698,8 @@ class SpotHedgerBot:
         qty = hedge.get("qty")
         price = hedge.get("price")
         # Only add to active_hedges if not a duplicate
-        if not any(
-            h
-            for h in self.active_hedges
-            if h["type"] == hedge_type
-            and h["symbol"] == symbol
-            and h["qty"] == qty
-            and h["price"] == price
-            and h["exchange"] == hedge.get("exchange")
-        ):
+        key = self._hedge_key(hedge)
+        if key not in self._active_hedge_keys:
             hedge_entry = {
                 "type": hedge_type,
                 "symbol": symbol,
@@ -4648,7 +4708,7 @@ class SpotHedgerBot:
                 "instrument_type": hedge.get("instrument_type"),
                 "exchange": hedge.get("exchange"),
                 "target_delta": hedge.get("target_delta"),
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "timestamp": datetime.now().isoformat(sep=" ", timespec="seconds"),
             }
 
             # Add strategy-specific data
@@ -4661,7 +4721,9 @@ class SpotHedgerBot:
             elif hedge_type == "collar" and "collar_data" in hedge:
                 hedge_entry["collar_data"] = hedge["collar_data"]
 
-            self.active_hedges.append(hedge_entry)
+            self.active_hedges[self._next_hedge_id] = hedge_entry
+            self._next_hedge_id += 1
+            self._active_hedge_keys.add(key)
 
         if hedge_type == "perp_delta_neutral":
             # Execute the hedge
@@ -4782,8 +4844,8 @@ class SpotHedgerBot:
         # Clear pending hedge
         context.user_data.pop("pending_hedge", None)
 
-        await query.edit_message_text(
-            text, reply_markup=get_back_button(), parse_mode="Markdown"
+        await self._safe_edit(
+            query, text, reply_markup=get_back_button(), parse_mode="Markdown"
         )
 
     async def handle_risk_config_callback(
@@ -4794,33 +4856,23 @@ class SpotHedgerBot:
         if step == "edit":
             metric = data if isinstance(data, str) else data.get("metric")
             # Ask for new value
-            if metric == "delta":
-                prompt = "Enter new *absolute delta* threshold (BTC):"
-            elif metric == "var":
-                prompt = "Enter new *95% VaR* threshold (USD):"
-            elif metric == "drawdown":
-                prompt = "Enter new *max drawdown* (as decimal, e.g. 0.15 for 15%):"
-            else:
-                prompt = "Unknown metric."
-            await query.edit_message_text(prompt, parse_mode="Markdown")
+            prompt = _RISK_CONFIG_PROMPTS.get(metric, "Unknown metric.")
+            await self._safe_edit(query, prompt, parse_mode="Markdown")
             context.user_data["risk_config_edit"] = metric
             context.user_data["awaiting_risk_value"] = True
         elif step == "confirm":
             metric = context.user_data.get("risk_config_edit")
             value = context.user_data.get("risk_config_new_value")
-            # Update config
-            if metric == "delta":
-                self.risk_config["abs_delta"] = float(value)
-            elif metric == "var":
-                self.risk_config["var_95"] = float(value)
-            elif metric == "drawdown":
-                self.risk_config["max_drawdown"] = float(value)
-            await query.edit_message_text(f"✅ Updated {metric} threshold to {value}.")
+            # Update config; handle_message already parsed the value
+            key = _RISK_CONFIG_KEYS.get(metric)
+            if key and value is not None:
+                self.risk_config[key] = value
+            await self._safe_edit(query, f"✅ Updated {metric} threshold to {value}.")
             await self.show_risk_config(update, context)
         elif step == "cancel":
             await self.show_risk_config(update, context)
         else:
-            await query.edit_message_text("Unknown risk config action.")
+            await self._safe_edit(query, "Unknown risk config action.")
 
     async def handle_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle text messages (for wizard input)."""
@@ -4863,8 +4915,6 @@ class SpotHedgerBot:
             await self.handle_future_quantity(update, context, text)
 
     def _get_risk_confirm_keyboard(self):
-        from telegram import InlineKeyboardMarkup, InlineKeyboardButton
-
         return InlineKeyboardMarkup(
             [
                 [
@@ -4890,8 +4940,8 @@ class SpotHedgerBot:
                 await update.message.reply_text("❌ Quantity must be positive.")
                 return
 
-            # Get current price from market data
-            current_price = await self.get_current_price("BTC-USDT-SPOT")
+            # Get current price, reusing the quote fetched at wizard start
+            current_price = await self._wizard_price(context.user_data["wizard"])
 
             # Calculate costs using costing service
             costs = costing_service.calculate_total_cost(
@@ -4907,18 +4957,18 @@ class SpotHedgerBot:
                 f"Quantity: {quantity:+.4f} BTC\n"
                 f"Price: ${current_price:.2f}\n"
                 f"Delta Impact: {delta_impact:+.4f} BTC\n\n"
-                f"{costing_service.get_cost_summary(quantity, current_price, 'OKX', 'spot')}"
+                f"{costing_service.format_cost_summary(costs)}"
             )
 
             # Store trade data
-            context.user_data["pending_trade"] = {
-                "action_type": "add",
-                "symbol": "BTC-USDT-SPOT",
-                "qty": quantity,
-                "price": current_price,
-                "instrument_type": "spot",
-                "exchange": "OKX",
-            }
+            context.user_data["pending_trade"] = PendingTrade(
+                action_type="add",
+                symbol="BTC-USDT-SPOT",
+                qty=quantity,
+                price=current_price,
+                instrument_type="spot",
+                exchange="OKX",
+            )
 
             await update.message.reply_text(
                 text,
@@ -4951,8 +5001,8 @@ class SpotHedgerBot:
             if direction == "short":
                 quantity = -quantity
 
-            # Get current price from market data
-            current_price = await self.get_current_price("BTC-USDT-PERP")
+            # Get current price, reusing the quote fetched at wizard start
+            current_price = await self._wizard_price(wizard)
 
             # Calculate costs using costing service
             costs = costing_service.calculate_total_cost(
@@ -4969,18 +5019,18 @@ class SpotHedgerBot:
                 f"Quantity: {abs(quantity):.4f} BTC\n"
                 f"Price: ${current_price:.2f}\n"
                 f"Delta Impact: {delta_impact:+.4f} BTC\n\n"
-                f"{costing_service.get_cost_summary(quantity, current_price, 'OKX', 'perpetual')}"
+                f"{costing_service.format_cost_summary(costs)}"
             )
 
             # Store trade data
-            context.user_data["pending_trade"] = {
-                "action_type": "add",
-                "symbol": "BTC-USDT-PERP",
-                "qty": quantity,
-                "price": current_price,
-                "instrument_type": "perpetual",
-                "exchange": "OKX",
-            }
+            context.user_data["pending_trade"] = PendingTrade(
+                action_type="add",
+                symbol="BTC-USDT-PERP",
+                qty=quantity,
+                price=current_price,
+                instrument_type="perpetual",
+                exchange="OKX",
+            )
 
             await update.message.reply_text(
                 text,
@@ -5007,6 +5057,7 @@ class SpotHedgerBot:
         if "wizard" in context.user_data:
             context.user_data["wizard"]["data"]["direction"] = direction
             context.user_data["wizard"]["step"] = "quantity"
+            self._prefetch_wizard_price(context.user_data["wizard"])
 
         text = (
             f"➕ *Add Future Position*\n\n"
@@ -5016,111 +5067,61 @@ class SpotHedgerBot:
             f"Example: `5.0` for 5 BTC"
         )
 
-        await query.edit_message_text(
-            text, reply_markup=get_back_button(), parse_mode="Markdown"
+        await self._safe_edit(
+            query, text, reply_markup=get_back_button(), parse_mode="Markdown"
         )
 
-    async def handle_remove_spot(
+    async def handle_remove_position(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE, data: dict
     ):
-        """Handle remove spot position."""
+        """Handle removing a spot or future position."""
         query = update.callback_query
         symbol = data.get("symbol")
 
         if not symbol:
-            await query.edit_message_text(
-                "❌ No symbol specified.", reply_markup=get_back_button()
+            await self._safe_edit(
+                query, "❌ No symbol specified.", reply_markup=get_back_button()
             )
             return
 
         position = self.portfolio.get_position(symbol)
         if not position:
-            await query.edit_message_text(
-                f"❌ Position {symbol} not found.", reply_markup=get_back_button()
+            await self._safe_edit(
+                query,
+                f"❌ Position {symbol} not found.",
+                reply_markup=get_back_button(),
             )
             return
 
         # Get current price
         current_price = await self.get_current_price(symbol)
 
-        # Calculate costs
+        # Calculate costs once; the summary shows the same estimate
         costs = costing_service.calculate_total_cost(
             -position.qty, current_price, position.exchange, position.instrument_type
         )
 
         text = (
             f"📋 *Remove Position Preview*\n\n"
-            f"Symbol: {symbol}\n"
+            f"Symbol: {_escape_markdown(symbol)}\n"
             f"Current Position: {position.qty:+.4f} @ ${position.avg_px:.2f}\n"
             f"Current Price: ${current_price:.2f}\n"
             f"P&L: ${(current_price - position.avg_px) * position.qty:+.2f}\n\n"
-            f"{costing_service.get_cost_summary(-position.qty, current_price, position.exchange, position.instrument_type)}"
+            f"{costing_service.format_cost_summary(costs)}"
         )
 
         # Store pending trade
-        context.user_data["pending_trade"] = {
-            "action_type": "remove",
-            "symbol": symbol,
-            "qty": -position.qty,
-            "price": current_price,
-            "instrument_type": position.instrument_type,
-            "exchange": position.exchange,
-        }
-
-        await query.edit_message_text(
-            text,
-            reply_markup=get_confirmation_buttons("portfolio"),
-            parse_mode="Markdown",
-        )
-
-    async def handle_remove_future(
-        self, update: Update, context: ContextTypes.DEFAULT_TYPE, data: dict
-    ):
-        """Handle remove future position."""
-        query = update.callback_query
-        symbol = data.get("symbol")
-
-        if not symbol:
-            await query.edit_message_text(
-                "❌ No symbol specified.", reply_markup=get_back_button()
-            )
-            return
-
-        position = self.portfolio.get_position(symbol)
-        if not position:
-            await query.edit_message_text(
-                f"❌ Position {symbol} not found.", reply_markup=get_back_button()
-            )
-            return
-
-        # Get current price
-        current_price = await self.get_current_price(symbol)
-
-        # Calculate costs
-        costs = costing_service.calculate_total_cost(
-            -position.qty, current_price, position.exchange, position.instrument_type
-        )
-
-        text = (
-            f"📋 *Remove Position Preview*\n\n"
-            f"Symbol: {symbol}\n"
-            f"Current Position: {position.qty:+.4f} @ ${position.avg_px:.2f}\n"
-            f"Current Price: ${current_price:.2f}\n"
-            f"P&L: ${(current_price - position.avg_px) * position.qty:+.2f}\n\n"
-            f"{costing_service.get_cost_summary(-position.qty, current_price, position.exchange, position.instrument_type)}"
+        context.user_data["pending_trade"] = PendingTrade(
+            action_type="remove",
+            symbol=symbol,
+            qty=-position.qty,
+            price=current_price,
+            instrument_type=position.instrument_type,
+            exchange=position.exchange,
         )
 
-        # Store pending trade
-        context.user_data["pending_trade"] = {
-            "action_type": "remove",
-            "symbol": symbol,
-            "qty": -position.qty,
-            "price": current_price,
-            "instrument_type": position.instrument_type,
-            "exchange": position.exchange,
-        }
-
-        await query.edit_message_text(
+        await self._safe_edit(
+            query,
             text,
             reply_markup=get_confirmation_buttons("portfolio"),
             parse_mode="Markdown",
@@ -5131,21 +5132,16 @@ class SpotHedgerBot:
     ):
         """Show detailed performance attribution and hedging effectiveness."""
         query = update.callback_query
-        from telegram import InlineKeyboardMarkup, InlineKeyboardButton
 
         # Gather realized/unrealized P&L, delta, VaR, drawdown
         current_prices = {}
         for position in self.portfolio.positions.values():
             try:
                 if position.instrument_type == "option":
-                    from ..exchanges.deribit_options import deribit_options
-
-                    async with deribit_options as options:
-                        ticker = await options.get_option_ticker(position.symbol)
-                        if ticker and ticker.last_price > 0:
-                            current_prices[position.symbol] = ticker.last_price
-                        else:
-                            current_prices[position.symbol] = position.avg_px
+                    option_price = await self._get_option_price(position.symbol)
+                    current_prices[position.symbol] = (
+                        option_price if option_price is not None else position.avg_px
+                    )
                 else:
                     current_prices[position.symbol] = await self.get_current_price(
                         position.symbol
@@ -5168,7 +5164,7 @@ class SpotHedgerBot:
         hedge_pnl = 0.0
         hedge_cost = 0.0
         hedge_count = 0
-        for hedge in getattr(self, "active_hedges", []):
+        for hedge in self.active_hedges.values():
             hedge_pnl += hedge.get("pnl", 0.0)
             hedge_cost += hedge.get("cost", 0.0)
             hedge_count += 1
@@ -5192,8 +5188,11 @@ class SpotHedgerBot:
         )
 
         keyboard = [[InlineKeyboardButton("⬅️ Back", callback_data="analytics")]]
-        await query.edit_message_text(
-            text, reply_markup=InlineKeyboardMarkup(keyboard), parse_mode="Markdown"
+        await self._safe_edit(
+            query,
+            text,
+            reply_markup=InlineKeyboardMarkup(keyboard),
+            parse_mode="Markdown",
         )
 
     async def show_cost_benefit_analysis(
@@ -5201,13 +5200,12 @@ class SpotHedgerBot:
     ):
         """Show cost-benefit analysis of hedging strategies."""
         query = update.callback_query
-        from telegram import InlineKeyboardMarkup, InlineKeyboardButton
 
         # Aggregate costs and benefits from transactions and hedges
         total_cost = 0.0
         total_benefit = 0.0
         total_hedge_pnl = 0.0
-        for hedge in getattr(self, "active_hedges", []):
+        for hedge in self.active_hedges.values():
             total_cost += hedge.get("cost", 0.0)
             total_hedge_pnl += hedge.get("pnl", 0.0)
         # Benefit: reduction in drawdown or VaR, or P&L improvement
@@ -5227,8 +5225,11 @@ class SpotHedgerBot:
             f"• Unrealized P&L: `${pnl_unrealized:,.2f}`\n"
         )
         keyboard = [[InlineKeyboardButton("⬅️ Back", callback_data="analytics")]]
-        await query.edit_message_text(
-            text, reply_markup=InlineKeyboardMarkup(keyboard), parse_mode="Markdown"
+        await self._safe_edit(
+            query,
+            text,
+            reply_markup=InlineKeyboardMarkup(keyboard),
+            parse_mode="Markdown",
         )
 
     async def show_correlation_analysis(
@@ -5236,7 +5237,6 @@ class SpotHedgerBot:
     ):
         """Show correlation analysis between portfolio positions and hedges."""
         query = update.callback_query
-        from telegram import InlineKeyboardMarkup, InlineKeyboardButton
         from ..analytics.correlation import correlation_analyzer
 
         try:
@@ -5246,7 +5246,8 @@ class SpotHedgerBot:
                 portfolio_symbols.append(position.symbol)
 
             if not portfolio_symbols:
-                await query.edit_message_text(
+                await self._safe_edit(
+                    query,
                     "❌ No portfolio positions found for correlation analysis.",
                     reply_markup=InlineKeyboardMarkup(
                         [[InlineKeyboardButton("⬅️ Back", callback_data="analytics")]]
@@ -5257,13 +5258,14 @@ class SpotHedgerBot:
 
             # Get hedge symbols
             hedge_symbols = []
-            for hedge in getattr(self, "active_hedges", []):
+            for hedge in self.active_hedges.values():
                 symbol = hedge.get("symbol", "")
                 if symbol:
                     hedge_symbols.append(symbol)
 
             # Show loading message
-            await query.edit_message_text(
+            await self._safe_edit(
+                query,
                 "🔄 Calculating correlation matrix...",
                 reply_markup=InlineKeyboardMarkup(
                     [[InlineKeyboardButton("⬅️ Back", callback_data="analytics")]]
@@ -5287,7 +5289,8 @@ class SpotHedgerBot:
                         for symbol in all_symbols
                     ]
                 )
-                await query.edit_message_text(
+                await self._safe_edit(
+                    query,
                     f"❌ Unable to calculate correlation matrix. Insufficient data for the following symbols:\n\n{missing_text}\n\nAt least 10 data points are required per symbol.",
                     reply_markup=InlineKeyboardMarkup(
                         [[InlineKeyboardButton("⬅️ Back", callback_data="analytics")]]
@@ -5324,7 +5327,8 @@ class SpotHedgerBot:
                 [InlineKeyboardButton("⬅️ Back", callback_data="analytics")],
             ]
 
-            await query.edit_message_text(
+            await self._safe_edit(
+                query,
                 full_text,
                 reply_markup=InlineKeyboardMarkup(keyboard),
                 parse_mode="Markdown",
@@ -5332,7 +5336,8 @@ class SpotHedgerBot:
 
         except Exception as e:
             logger.error(f"Error in correlation analysis: {e}")
-            await query.edit_message_text(
+            await self._safe_edit(
+                query,
                 "❌ Error calculating correlation analysis. Please try again.",
                 reply_markup=InlineKeyboardMarkup(
                     [[InlineKeyboardButton("⬅️ Back", callback_data="analytics")]]
@@ -5345,7 +5350,6 @@ class SpotHedgerBot:
     ):
         """Show correlation matrix as a heatmap chart."""
         query = update.callback_query
-        from telegram import InlineKeyboardMarkup, InlineKeyboardButton
         from ..analytics.correlation import correlation_analyzer
         from ..analytics.charts import ChartGenerator
 
@@ -5356,7 +5360,8 @@ class SpotHedgerBot:
                 portfolio_symbols.append(position.symbol)
 
             if not portfolio_symbols:
-                await query.edit_message_text(
+                await self._safe_edit(
+                    query,
                     "❌ No portfolio positions found for correlation chart.",
                     reply_markup=InlineKeyboardMarkup(
                         [[InlineKeyboardButton("⬅️ Back", callback_data="analytics")]]
@@ -5367,13 +5372,14 @@ class SpotHedgerBot:
 
             # Get hedge symbols
             hedge_symbols = []
-            for hedge in getattr(self, "active_hedges", []):
+            for hedge in self.active_hedges.values():
                 symbol = hedge.get("symbol", "")
                 if symbol:
                     hedge_symbols.append(symbol)
 
             # Show loading message
-            await query.edit_message_text(
+            await self._safe_edit(
+                query,
                 "🔄 Generating correlation chart...",
                 reply_markup=InlineKeyboardMarkup(
                     [[InlineKeyboardButton("⬅️ Back", callback_data="analytics")]]
@@ -5389,7 +5395,8 @@ class SpotHedgerBot:
             )
 
             if correlation_matrix.empty:
-                await query.edit_message_text(
+                await self._safe_edit(
+                    query,
                     "❌ Unable to generate correlation chart. Insufficient data.",
                     reply_markup=InlineKeyboardMarkup(
                         [[InlineKeyboardButton("⬅️ Back", callback_data="analytics")]]
@@ -5422,12 +5429,11 @@ class SpotHedgerBot:
                     )
 
                 # Clean up the temporary file
-                import os
-
                 os.remove(chart_path)
 
                 # Edit the original message to show success
-                await query.edit_message_text(
+                await self._safe_edit(
+                    query,
                     "✅ Correlation chart generated successfully!",
                     reply_markup=InlineKeyboardMarkup(
                         [
@@ -5440,7 +5446,8 @@ class SpotHedgerBot:
                     ),
                 )
             else:
-                await query.edit_message_text(
+                await self._safe_edit(
+                    query,
                     "❌ Failed to generate correlation chart.",
                     reply_markup=InlineKeyboardMarkup(
                         [
@@ -5456,7 +5463,8 @@ class SpotHedgerBot:
 
         except Exception as e:
             logger.error(f"Error generating correlation chart: {e}")
-            await query.edit_message_text(
+            await self._safe_edit(
+                query,
                 "❌ Error generating correlation chart. Please try again.",
                 reply_markup=InlineKeyboardMarkup(
                     [
@@ -5475,7 +5483,6 @@ class SpotHedgerBot:
     ):
         """Show stress testing scenario selection menu."""
         query = update.callback_query
-        from telegram import InlineKeyboardMarkup, InlineKeyboardButton
         from ..analytics.stress_testing import stress_testing
 
         try:
@@ -5502,13 +5509,17 @@ class SpotHedgerBot:
 
             keyboard.append([InlineKeyboardButton("⬅️ Back", callback_data="analytics")])
 
-            await query.edit_message_text(
-                text, reply_markup=InlineKeyboardMarkup(keyboard), parse_mode="Markdown"
+            await self._safe_edit(
+                query,
+                text,
+                reply_markup=InlineKeyboardMarkup(keyboard),
+                parse_mode="Markdown",
             )
 
         except Exception as e:
             logger.error(f"Error in stress testing menu: {e}")
-            await query.edit_message_text(
+            await self._safe_edit(
+                query,
                 "❌ Error loading stress testing scenarios.",
                 reply_markup=InlineKeyboardMarkup(
                     [[InlineKeyboardButton("⬅️ Back", callback_data="analytics")]]
@@ -5521,12 +5532,12 @@ class SpotHedgerBot:
     ):
         """Run a specific stress test scenario."""
         query = update.callback_query
-        from telegram import InlineKeyboardMarkup, InlineKeyboardButton
         from ..analytics.stress_testing import stress_testing
 
         try:
             # Show loading message
-            await query.edit_message_text(
+            await self._safe_edit(
+                query,
                 "🔄 Running stress test...",
                 reply_markup=InlineKeyboardMarkup(
                     [
@@ -5550,7 +5561,7 @@ class SpotHedgerBot:
                 }
 
             # Get hedge positions
-            hedge_positions = getattr(self, "active_hedges", [])
+            hedge_positions = list(self.active_hedges.values())
 
             # Run stress test
             results = await stress_testing.run_stress_test(
@@ -5560,7 +5571,8 @@ class SpotHedgerBot:
             )
 
             if not results:
-                await query.edit_message_text(
+                await self._safe_edit(
+                    query,
                     "❌ Failed to run stress test. Please try again.",
                     reply_markup=InlineKeyboardMarkup(
                         [
@@ -5597,7 +5609,8 @@ class SpotHedgerBot:
                 [InlineKeyboardButton("⬅️ Back", callback_data="analytics")],
             ]
 
-            await query.edit_message_text(
+            await self._safe_edit(
+                query,
                 results_text,
                 reply_markup=InlineKeyboardMarkup(keyboard),
                 parse_mode="Markdown",
@@ -5605,7 +5618,8 @@ class SpotHedgerBot:
 
         except Exception as e:
             logger.error(f"Error running stress test: {e}")
-            await query.edit_message_text(
+            await self._safe_edit(
+                query,
                 "❌ Error running stress test. Please try again.",
                 reply_markup=InlineKeyboardMarkup(
                     [
@@ -5624,13 +5638,13 @@ class SpotHedgerBot:
     ):
         """Show stress test chart for a specific scenario."""
         query = update.callback_query
-        from telegram import InlineKeyboardMarkup, InlineKeyboardButton
         from ..analytics.stress_testing import stress_testing
         from ..analytics.charts import chart_generator
 
         try:
             # Show loading message
-            await query.edit_message_text(
+            await self._safe_edit(
+                query,
                 "🔄 Generating stress test chart...",
                 reply_markup=InlineKeyboardMarkup(
                     [
@@ -5654,7 +5668,7 @@ class SpotHedgerBot:
                 }
 
             # Get hedge positions
-            hedge_positions = getattr(self, "active_hedges", [])
+            hedge_positions = list(self.active_hedges.values())
 
             # Run stress test to get results
             results = await stress_testing.run_stress_test(
@@ -5664,7 +5678,8 @@ class SpotHedgerBot:
             )
 
             if not results:
-                await query.edit_message_text(
+                await self._safe_edit(
+                    query,
                     "❌ Failed to generate stress test chart. Please try again.",
                     reply_markup=InlineKeyboardMarkup(
                         [
@@ -5696,14 +5711,14 @@ class SpotHedgerBot:
             )
 
             # Debug logging
-            logger.info(f"Generating chart for scenario: {scenario_name_str}")
-            logger.info(f"P&L impact: {pnl_impact}")
+            logger.info("Generating chart for scenario: {}", scenario_name_str)
+            logger.info("P&L impact: {}", pnl_impact)
 
             chart_path = await chart_generator.generate_stress_test_chart(
                 stress_results={scenario_name_str: pnl_impact}
             )
 
-            logger.info(f"Chart path: {chart_path}")
+            logger.info("Chart path: {}", chart_path)
 
             if chart_path and os.path.exists(chart_path):
                 # Send the chart image
@@ -5731,7 +5746,8 @@ class SpotHedgerBot:
                 os.remove(chart_path)
 
                 # Edit the original message to show success
-                await query.edit_message_text(
+                await self._safe_edit(
+                    query,
                     "✅ Stress test chart generated successfully!",
                     reply_markup=InlineKeyboardMarkup(
                         [
@@ -5749,7 +5765,8 @@ class SpotHedgerBot:
                     ),
                 )
             else:
-                await query.edit_message_text(
+                await self._safe_edit(
+                    query,
                     "❌ Failed to generate stress test chart.",
                     reply_markup=InlineKeyboardMarkup(
                         [
@@ -5769,8 +5786,9 @@ class SpotHedgerBot:
                 )
 
         except Exception as e:
-            logger.error(f"Error generating stress test chart: {e}")
-            await query.edit_message_text(
+            logger.error("Error generating stress test chart: {}", e)
+            await self._safe_edit(
+                query,
                 "❌ Error generating stress test chart. Please try again.",
                 reply_markup=InlineKeyboardMarkup(
                     [
@@ -5797,15 +5815,27 @@ async def main():
         logger.error("Environment validation failed")
         return
 
+    logger.info("Running on event loop {}", type(asyncio.get_running_loop()).__name__)
+
     # Create and start bot
     bot = SpotHedgerBot()
 
+    # Sleep until SIGINT/SIGTERM instead of waking up periodically
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except NotImplementedError:
+            # Windows: SIGINT still arrives as KeyboardInterrupt
+            pass
+
     try:
         await bot.start()
 
         # Keep the bot running
-        while True:
-            await asyncio.sleep(1)
+        await stop_event.wait()
+        logger.info("Shutting down bot...")
 
     except KeyboardInterrupt:
         logger.info("Shutting down bot...")
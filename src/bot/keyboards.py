@@ -1,4 +1,5 @@
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+from functools import lru_cache
 from typing import List, Dict, Any
 import json
 
@@ -14,15 +15,29 @@ def encode_callback_data(flow: str, step: str, data: Dict[str, Any] = None) -> s
     Returns:
         Encoded callback data string
     """
-    if data is None:
-        data = {}
+    if not data:
+        return f"{flow}|{step}|{{}}"
 
-    json_data = json.dumps(data)
+    # Compact separators keep payloads well under Telegram's 64-byte limit
+    json_data = json.dumps(data, separators=(",", ":"))
     return f"{flow}|{step}|{json_data}"
 
 
 def decode_callback_data(callback_data: str) -> tuple[str, str, dict]:
-    """Decode callback data from the form FLOW|STEP|JSON or compact delimited format."""
+    """Decode callback data from the form FLOW|STEP|JSON or compact delimited format.
+
+    Menu buttons repeat the same callback strings, so parsing is cached.
+    Dict and list payloads are shallow-copied so handlers can modify them.
+    """
+    flow, step, data = _parse_callback_data(callback_data)
+    if isinstance(data, (dict, list)):
+        data = data.copy()
+    return flow, step, data
+
+
+@lru_cache(maxsize=1024)
+def _parse_callback_data(callback_data: str) -> tuple[str, str, Any]:
+    """Parse callback data; results are shared, see decode_callback_data."""
     try:
         parts = callback_data.split("|", 3)
         if len(parts) == 4:
@@ -31,10 +46,13 @@ def decode_callback_data(callback_data: str) -> tuple[str, str, dict]:
             data = f"{part1}|{part2}"
         elif len(parts) == 3:
             flow, step, json_data = parts
-            try:
-                data = json.loads(json_data)
-            except Exception:
-                data = json_data
+            if json_data == "{}":
+                data = {}
+            else:
+                try:
+                    data = json.loads(json_data)
+                except Exception:
+                    data = json_data
         elif len(parts) == 2:
             flow, step = parts
             data = {}
@@ -46,9 +64,12 @@ def decode_callback_data(callback_data: str) -> tuple[str, str, dict]:
         return callback_data, "", {}
 
 
+@lru_cache(maxsize=None)
 def get_main_menu() -> InlineKeyboardMarkup:
     """Get the main menu keyboard.
 
+    Static menus are built once and shared; PTB markups are immutable.
+
     Returns:
         InlineKeyboardMarkup with main menu options
     """
@@ -69,6 +90,7 @@ def get_main_menu() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(keyboard)
 
 
+@lru_cache(maxsize=None)
 def get_back_button() -> InlineKeyboardMarkup:
     """Get a keyboard with just a back button.
 
@@ -80,6 +102,7 @@ def get_back_button() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(keyboard)
 
 
+@lru_cache(maxsize=None)
 def get_portfolio_menu() -> InlineKeyboardMarkup:
     """Get the portfolio menu keyboard.
 
@@ -118,6 +141,7 @@ def get_portfolio_menu() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(keyboard)
 
 
+@lru_cache(maxsize=None)
 def get_hedge_menu() -> InlineKeyboardMarkup:
     """Get the hedge menu keyboard.
 
@@ -182,6 +206,7 @@ def get_hedge_menu() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(keyboard)
 
 
+@lru_cache(maxsize=None)
 def get_analytics_menu() -> InlineKeyboardMarkup:
     """Get the analytics menu keyboard.
 
@@ -220,6 +245,7 @@ def get_analytics_menu() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(keyboard)
 
 
+@lru_cache(maxsize=None)
 def get_risk_config_menu() -> InlineKeyboardMarkup:
     """Get the risk configuration menu keyboard.
 
@@ -249,6 +275,7 @@ def get_risk_config_menu() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(keyboard)
 
 
+@lru_cache(maxsize=None)
 def get_confirmation_buttons(flow: str) -> InlineKeyboardMarkup:
     """Get confirmation buttons for an action.
 
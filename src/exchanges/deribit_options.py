@@ -1,10 +1,14 @@
 import asyncio
+import time
+from functools import cached_property
+from operator import attrgetter
 import aiohttp
 from datetime import datetime, timedelta
-from typing import AsyncGenerator, Optional, List
+from typing import AsyncGenerator, Dict, Optional, List, Tuple
 from dataclasses import dataclass
 from loguru import logger
 
+from ..services.options_pricing import options_pricing_service
 from .types import Instrument, Ticker
 
 
@@ -33,29 +37,111 @@ class OptionContract:
         """Return the mid price (average of bid and ask)."""
         return (self.bid + self.ask) / 2
 
+    @cached_property
+    def greeks_text(self) -> str:
+        """Return the Greeks as a bulleted block for hedge summaries."""
+        return (
+            f"• Delta: {self.delta:.4f}\n"
+            f"• Gamma: {self.gamma:.6f}\n"
+            f"• Theta: {self.theta:.4f}\n"
+            f"• Vega: {self.vega:.4f}\n"
+            f"• IV: {self.implied_volatility:.1%}\n"
+        )
+
+
+@dataclass(frozen=True)
+class ParsedOption:
+    """Options instrument with its symbol parsed once."""
+
+    symbol: str
+    expiry: str  # e.g. "11JUL25"
+    strike: float
+    kind: str  # "P" or "C"
+
 
 class DeribitOptionsExchange:
     """Deribit options exchange client."""
 
     BASE_URL = "https://www.deribit.com"
+    INSTRUMENTS_TTL = 300.0  # seconds; listings change a few times a day
+    BOOK_SUMMARY_TTL = 2.0  # seconds; prices move slowly enough for the UI
+    TICKER_TTL = 3.0  # seconds
+    TICKER_FALLBACK_CONCURRENCY = 8  # per-symbol requests in flight at once
+    DEFAULT_UNDERLYING_PRICE = 107000.0  # TODO: Get from spot price
+    DEFAULT_VOLATILITY = 0.5  # TODO: Calculate from market
 
     def __init__(self):
         self.session: aiohttp.ClientSession | None = None
+        self._session_users = 0
         self.instruments = {}
+        # (currency, option_type) -> options, e.g. ("BTC", "P")
+        self._index: Dict[Tuple[str, str], List[ParsedOption]] = {}
+        # (currency, option_type) -> expiry -> options sorted by strike
+        self._by_expiry: Dict[Tuple[str, str], Dict[str, List[ParsedOption]]] = {}
+        # (currency, option_type, expiry, strike) -> symbol
+        self._symbol_index: Dict[Tuple[str, str, str, float], str] = {}
+        self._instruments_cache: Optional[Tuple[float, List[Instrument]]] = None
+        self._instruments_refresh: Optional[asyncio.Task] = None
+        self._ticker_cache: Dict[str, Tuple[float, OptionContract]] = {}
+        self._ticker_requests: Dict[str, asyncio.Task] = {}
+        self._book_summary_cache: Dict[
+            Tuple[str, str], Tuple[float, Dict[str, dict]]
+        ] = {}
 
     async def __aenter__(self):
-        """Async context manager entry."""
-        self.session = aiohttp.ClientSession()
+        """Async context manager entry.
+
+        Nested and concurrent entries share one pooled keep-alive session,
+        which is closed when the last of them exits.
+        """
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=20, keepalive_timeout=60)
+            )
+        self._session_users += 1
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self.session:
+        self._session_users -= 1
+        if self._session_users == 0 and self.session:
             await self.session.close()
 
     async def get_instruments(self) -> List[Instrument]:
         """Get available options instruments.
 
+        The list is cached for ``INSTRUMENTS_TTL`` seconds and concurrent
+        callers share a single in-flight refresh.
+
+        Returns:
+            List of available options instruments
+        """
+        cached = self._instruments_cache
+        if cached and time.monotonic() - cached[0] < self.INSTRUMENTS_TTL:
+            return cached[1]
+
+        if self._instruments_refresh is None:
+            self._instruments_refresh = asyncio.create_task(self._refresh_instruments())
+        # Shield the shared refresh from cancellation of any single caller
+        return await asyncio.shield(self._instruments_refresh)
+
+    async def _refresh_instruments(self) -> List[Instrument]:
+        """Fetch instruments and update the cache.
+
+        Returns:
+            List of available options instruments
+        """
+        try:
+            instruments = await self._fetch_instruments()
+            if instruments:
+                self._instruments_cache = (time.monotonic(), instruments)
+            return instruments
+        finally:
+            self._instruments_refresh = None
+
+    async def _fetch_instruments(self) -> List[Instrument]:
+        """Fetch options instruments from Deribit and rebuild the index.
+
         Returns:
             List of available options instruments
         """
@@ -78,6 +164,9 @@ class DeribitOptionsExchange:
                     return []
 
                 instruments = []
+                index: Dict[Tuple[str, str], List[ParsedOption]] = {}
+                by_expiry: Dict[Tuple[str, str], Dict[str, List[ParsedOption]]] = {}
+                symbol_index: Dict[Tuple[str, str, str, float], str] = {}
                 for item in data["result"]:
                     instrument = Instrument(
                         symbol=item["instrument_name"],
@@ -92,12 +181,101 @@ class DeribitOptionsExchange:
                     instruments.append(instrument)
                     self.instruments[item["instrument_name"]] = instrument
 
+                    # Format: BTC-30JUN23-50000-C
+                    currency, _, rest = instrument.symbol.partition("-")
+                    expiry, _, rest = rest.partition("-")
+                    strike, _, kind = rest.partition("-")
+                    if kind and "-" not in kind:
+                        key = (currency, kind)
+                        option = ParsedOption(
+                            symbol=instrument.symbol,
+                            expiry=expiry,
+                            strike=float(strike),
+                            kind=kind,
+                        )
+                        index.setdefault(key, []).append(option)
+                        chain = by_expiry.setdefault(key, {})
+                        chain.setdefault(option.expiry, []).append(option)
+                        symbol_index[(*key, option.expiry, option.strike)] = (
+                            option.symbol
+                        )
+
+                for chains in by_expiry.values():
+                    for options in chains.values():
+                        options.sort(key=attrgetter("strike"))
+
+                self._index = index
+                self._by_expiry = by_expiry
+                self._symbol_index = symbol_index
                 return instruments
 
         except Exception as e:
             logger.error(f"Error fetching Deribit instruments: {e}")
             return []
 
+    async def get_options(self, currency: str, option_type: str) -> List[ParsedOption]:
+        """Get options for a currency and option type.
+
+        Args:
+            currency: Underlying currency (e.g., 'BTC')
+            option_type: 'P' for puts or 'C' for calls
+
+        Returns:
+            List of matching options
+        """
+        await self.get_instruments()
+        return self._index.get((currency, option_type), [])
+
+    async def get_options_in_range(
+        self, currency: str, option_type: str, min_strike: float, max_strike: float
+    ) -> List[ParsedOption]:
+        """Get options for a currency and option type within a strike range.
+
+        Args:
+            currency: Underlying currency (e.g., 'BTC')
+            option_type: 'P' for puts or 'C' for calls
+            min_strike: Lowest strike to include
+            max_strike: Highest strike to include
+
+        Returns:
+            List of matching options
+        """
+        options = await self.get_options(currency, option_type)
+        return [o for o in options if min_strike <= o.strike <= max_strike]
+
+    async def get_options_by_expiry(
+        self, currency: str, option_type: str, expiry: str
+    ) -> List[ParsedOption]:
+        """Get options for a currency, option type and expiry.
+
+        Args:
+            currency: Underlying currency (e.g., 'BTC')
+            option_type: 'P' for puts or 'C' for calls
+            expiry: Expiry date string (e.g., '11JUL25')
+
+        Returns:
+            List of matching options, sorted by strike
+        """
+        await self.get_instruments()
+        return self._by_expiry.get((currency, option_type), {}).get(expiry, [])
+
+    async def find_option_symbol(
+        self, currency: str, option_type: str, expiry: str, strike: float
+    ) -> Optional[str]:
+        """Find the symbol of an option by its contract terms.
+
+        Args:
+            currency: Underlying currency (e.g., 'BTC')
+            option_type: 'P' for puts or 'C' for calls
+            expiry: Expiry date string (e.g., '11JUL25')
+            strike: Strike price
+
+        Returns:
+            Options symbol or None if no such option is listed
+        """
+        await self.get_instruments()
+        return self._symbol_index.get((currency, option_type, expiry, strike))
+
     async def get_instruments_by_expiry(self, expiry: str) -> List[Instrument]:
         """Get instruments filtered by expiry date.
 
@@ -107,54 +285,72 @@ class DeribitOptionsExchange:
         Returns:
             List of instruments for the specified expiry
         """
-        if not self.session:
-            logger.error("Session not initialized")
-            return []
+        # Served from the parsed index instead of re-fetching and scanning
+        # every symbol string
+        await self.get_instruments()
+
+        instruments = []
+        for chains in self._by_expiry.values():
+            for option in chains.get(expiry, []):
+                instrument = Instrument(
+                    symbol=option.symbol,
+                    exchange="Deribit",
+                    instrument_type="option",
+                    base_asset="BTC",
+                    quote_asset="USD",
+                    min_size=0.001,
+                    tick_size=0.5,
+                    price_precision=1,
+                )
+                # Add strike and option type for easier filtering
+                instrument.strike = option.strike
+                instrument.option_type = option.kind.lower()
+                instruments.append(instrument)
 
-        try:
-            url = f"{self.BASE_URL}/api/v2/public/get_instruments"
-            params = {"currency": "BTC", "kind": "option"}
+        return instruments
 
-            async with self.session.get(url, params=params) as response:
-                if response.status != 200:
-                    logger.error(f"Deribit API error: {response.status}")
-                    return []
+    async def get_option_ticker(self, symbol: str) -> Optional[OptionContract]:
+        """Get options ticker data.
 
-                data = await response.json()
-                if data.get("error"):
-                    logger.error(f"Deribit API error: {data['error']}")
-                    return []
+        Tickers are cached for ``TICKER_TTL`` seconds and concurrent callers
+        asking for the same symbol share a single in-flight request.
 
-                instruments = []
-                for item in data["result"]:
-                    # Check if this instrument matches the expiry
-                    instrument_name = item["instrument_name"]
-                    if expiry in instrument_name:
-                        instrument = Instrument(
-                            symbol=item["instrument_name"],
-                            exchange="Deribit",
-                            instrument_type="option",
-                            base_asset="BTC",
-                            quote_asset="USD",
-                            min_size=0.001,
-                            tick_size=0.5,
-                            price_precision=1,
-                        )
-                        # Add strike and option type for easier filtering
-                        parts = instrument_name.split("-")
-                        if len(parts) >= 4:
-                            instrument.strike = float(parts[2])
-                            instrument.option_type = parts[3].lower()
-                        instruments.append(instrument)
+        Args:
+            symbol: Options symbol (e.g., 'BTC-30JUN23-50000-C')
 
-                return instruments
+        Returns:
+            OptionContract object or None if failed
+        """
+        cached = self._ticker_cache.get(symbol)
+        if cached and time.monotonic() - cached[0] < self.TICKER_TTL:
+            return cached[1]
 
-        except Exception as e:
-            logger.error(f"Error fetching Deribit instruments by expiry: {e}")
-            return []
+        request = self._ticker_requests.get(symbol)
+        if request is None:
+            request = asyncio.create_task(self._refresh_option_ticker(symbol))
+            self._ticker_requests[symbol] = request
+        # Shield the shared request from cancellation of any single caller
+        return await asyncio.shield(request)
 
-    async def get_option_ticker(self, symbol: str) -> Optional[OptionContract]:
-        """Get options ticker data.
+    async def _refresh_option_ticker(self, symbol: str) -> Optional[OptionContract]:
+        """Fetch an options ticker and update the cache.
+
+        Args:
+            symbol: Options symbol (e.g., 'BTC-30JUN23-50000-C')
+
+        Returns:
+            OptionContract object or None if failed
+        """
+        try:
+            contract = await self._fetch_option_ticker(symbol)
+            if contract:
+                self._ticker_cache[symbol] = (time.monotonic(), contract)
+            return contract
+        finally:
+            del self._ticker_requests[symbol]
+
+    async def _fetch_option_ticker(self, symbol: str) -> Optional[OptionContract]:
+        """Fetch options ticker data from Deribit.
 
         Args:
             symbol: Options symbol (e.g., 'BTC-30JUN23-50000-C')
@@ -181,71 +377,12 @@ class DeribitOptionsExchange:
                     return None
 
                 ticker_data = data["result"]
-
-                # Parse option details from symbol
-                # Format: BTC-30JUN23-50000-C
-                parts = symbol.split("-")
-                if len(parts) != 4:
-                    logger.error(f"Invalid option symbol format: {symbol}")
-                    return None
-
-                underlying = parts[0]
-                expiry_str = parts[1]
-                strike = float(parts[2])
-                option_type = parts[3].lower()
-
-                # Parse expiry date
-                expiry = datetime.strptime(expiry_str, "%d%b%y")
-
-                # Calculate Greeks (simplified)
-                current_price = float(ticker_data["last_price"] or 0.0)
-                underlying_price = 107000  # TODO: Get from spot price
-                time_to_expiry = (expiry - datetime.now()).days / 365
-
-                # If no last_price, use a fallback based on strike
-                if current_price <= 0:
-                    if option_type == "put":
-                        current_price = strike * 0.05  # 5% of strike for puts
-                    else:
-                        current_price = strike * 0.03  # 3% of strike for calls
-
-                # Simplified Black-Scholes Greeks
-                delta = self._calculate_delta(
-                    option_type, underlying_price, strike, time_to_expiry, 0.5
-                )
-                gamma = self._calculate_gamma(
-                    underlying_price, strike, time_to_expiry, 0.5
-                )
-                theta = self._calculate_theta(
-                    option_type, underlying_price, strike, time_to_expiry, 0.5
-                )
-                vega = self._calculate_vega(
-                    underlying_price, strike, time_to_expiry, 0.5
-                )
-
-                # Handle None for bid/ask/volume
-                bid = ticker_data.get("best_bid_price")
-                ask = ticker_data.get("best_ask_price")
-                bid = float(bid) if bid is not None else 0.0
-                ask = float(ask) if ask is not None else 0.0
                 volume_24h = ticker_data.get("stats", {}).get("volume")
-                volume_24h = float(volume_24h) if volume_24h is not None else 0.0
-
-                return OptionContract(
-                    symbol=symbol,
-                    strike=strike,
-                    expiry=expiry,
-                    option_type=option_type,
-                    underlying=underlying,
-                    exchange="Deribit",
-                    delta=delta,
-                    gamma=gamma,
-                    theta=theta,
-                    vega=vega,
-                    implied_volatility=0.5,  # TODO: Calculate from market
-                    last_price=current_price,
-                    bid=bid,
-                    ask=ask,
+                return self._build_option_contract(
+                    symbol,
+                    last_price=ticker_data["last_price"],
+                    bid=ticker_data.get("best_bid_price"),
+                    ask=ticker_data.get("best_ask_price"),
                     volume_24h=volume_24h,
                 )
 
@@ -253,28 +390,226 @@ class DeribitOptionsExchange:
             logger.error(f"Error fetching Deribit option ticker for {symbol}: {e}")
             return None
 
-    def _calculate_delta(
-        self, option_type: str, S: float, K: float, T: float, sigma: float
-    ) -> float:
-        """Calculate option delta (simplified)."""
-        if option_type == "call":
-            return 0.6 if S > K else 0.4  # Simplified
-        else:  # put
-            return -0.4 if S > K else -0.6  # Simplified
-
-    def _calculate_gamma(self, S: float, K: float, T: float, sigma: float) -> float:
-        """Calculate option gamma (simplified)."""
-        return 0.01  # Simplified
-
-    def _calculate_theta(
-        self, option_type: str, S: float, K: float, T: float, sigma: float
-    ) -> float:
-        """Calculate option theta (simplified)."""
-        return -0.1 if option_type == "call" else -0.08  # Simplified
-
-    def _calculate_vega(self, S: float, K: float, T: float, sigma: float) -> float:
-        """Calculate option vega (simplified)."""
-        return 0.5  # Simplified
+    async def get_book_summary_by_currency(
+        self, currency: str = "BTC", kind: str = "option"
+    ) -> Dict[str, dict]:
+        """Get the book summary of every instrument for a currency in one call.
+
+        The result is cached for ``BOOK_SUMMARY_TTL`` seconds so that flows
+        pricing several options share a single request.
+
+        Args:
+            currency: Underlying currency (e.g., 'BTC')
+            kind: Instrument kind (e.g., 'option')
+
+        Returns:
+            Mapping of instrument name to its book summary entry
+        """
+        key = (currency, kind)
+        cached = self._book_summary_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.BOOK_SUMMARY_TTL:
+            return cached[1]
+
+        if not self.session:
+            logger.error("Session not initialized")
+            return {}
+
+        try:
+            url = f"{self.BASE_URL}/api/v2/public/get_book_summary_by_currency"
+            params = {"currency": currency, "kind": kind}
+
+            async with self.session.get(url, params=params) as response:
+                if response.status != 200:
+                    logger.error(f"Deribit API error: {response.status}")
+                    return {}
+
+                data = await response.json()
+                if data.get("error"):
+                    logger.error(f"Deribit API error: {data['error']}")
+                    return {}
+
+                summary = {item["instrument_name"]: item for item in data["result"]}
+                self._book_summary_cache[key] = (time.monotonic(), summary)
+                return summary
+
+        except Exception as e:
+            logger.error(f"Error fetching Deribit book summary for {currency}: {e}")
+            return {}
+
+    async def get_option_tickers(
+        self, symbols: List[str], timeout: Optional[float] = None
+    ) -> List[OptionContract]:
+        """Get options ticker data for several symbols from the book summary.
+
+        Symbols missing from the summary, or every symbol when the summary
+        request fails, fall back to concurrent ``get_option_ticker`` calls
+        bounded by ``TICKER_FALLBACK_CONCURRENCY``.
+
+        Args:
+            symbols: Options symbols of the same underlying
+            timeout: Seconds allowed for the summary request and for each
+                per-symbol fallback, or None to wait indefinitely
+
+        Returns:
+            List of OptionContract objects, in the order of ``symbols``
+
+        Raises:
+            asyncio.TimeoutError: If requests timed out and no symbol was priced
+        """
+        if not symbols:
+            return []
+
+        currency = symbols[0].split("-")[0]
+        try:
+            summary = await asyncio.wait_for(
+                self.get_book_summary_by_currency(currency), timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"Deribit book summary for {currency} timed out")
+            summary = {}
+
+        # Greeks for every summary-priced contract in one vectorised pass
+        greeks = self._option_greeks(
+            [symbol for symbol in symbols if symbol in summary]
+        )
+        limit = asyncio.Semaphore(self.TICKER_FALLBACK_CONCURRENCY)
+        timed_out = False
+
+        async def fetch(symbol: str) -> Optional[OptionContract]:
+            nonlocal timed_out
+            item = summary.get(symbol)
+            if item is not None:
+                return self._build_option_contract(
+                    symbol,
+                    last_price=item.get("last"),
+                    bid=item.get("bid_price"),
+                    ask=item.get("ask_price"),
+                    volume_24h=item.get("volume"),
+                    greeks=greeks.get(symbol),
+                )
+            async with limit:
+                try:
+                    return await asyncio.wait_for(
+                        self.get_option_ticker(symbol), timeout
+                    )
+                except asyncio.TimeoutError:
+                    logger.warning(f"Deribit option ticker for {symbol} timed out")
+                    timed_out = True
+                    return None
+
+        contracts = await asyncio.gather(*(fetch(symbol) for symbol in symbols))
+        contracts = [contract for contract in contracts if contract]
+        if timed_out and not contracts:
+            raise asyncio.TimeoutError(f"Timed out fetching {currency} option prices")
+        return contracts
+
+    def _build_option_contract(
+        self,
+        symbol: str,
+        last_price: Optional[float],
+        bid: Optional[float],
+        ask: Optional[float],
+        volume_24h: Optional[float],
+        greeks: Optional[Dict[str, float]] = None,
+    ) -> Optional[OptionContract]:
+        """Build an OptionContract from raw market data.
+
+        Args:
+            symbol: Options symbol (e.g., 'BTC-30JUN23-50000-C')
+            last_price: Last traded price, if any
+            bid: Best bid price, if any
+            ask: Best ask price, if any
+            volume_24h: 24h volume, if any
+            greeks: Precomputed Greeks from ``_option_greeks``; computed for
+                this symbol alone when omitted
+
+        Returns:
+            OptionContract object or None if the symbol is malformed
+        """
+        # Parse option details from symbol
+        # Format: BTC-30JUN23-50000-C
+        parts = symbol.split("-")
+        if len(parts) != 4:
+            logger.error(f"Invalid option symbol format: {symbol}")
+            return None
+
+        underlying = parts[0]
+        expiry_str = parts[1]
+        strike = float(parts[2])
+        option_type = parts[3].lower()
+
+        # Parse expiry date
+        expiry = datetime.strptime(expiry_str, "%d%b%y")
+
+        current_price = float(last_price or 0.0)
+
+        # If no last_price, use a fallback based on strike
+        if current_price <= 0:
+            if option_type == "put":
+                current_price = strike * 0.05  # 5% of strike for puts
+            else:
+                current_price = strike * 0.03  # 3% of strike for calls
+
+        if greeks is None:
+            greeks = self._option_greeks([symbol])[symbol]
+
+        # Handle None for bid/ask/volume
+        bid = float(bid) if bid is not None else 0.0
+        ask = float(ask) if ask is not None else 0.0
+        volume_24h = float(volume_24h) if volume_24h is not None else 0.0
+
+        return OptionContract(
+            symbol=symbol,
+            strike=strike,
+            expiry=expiry,
+            option_type=option_type,
+            underlying=underlying,
+            exchange="Deribit",
+            delta=greeks["delta"],
+            gamma=greeks["gamma"],
+            theta=greeks["theta"],
+            vega=greeks["vega"],
+            implied_volatility=self.DEFAULT_VOLATILITY,
+            last_price=current_price,
+            bid=bid,
+            ask=ask,
+            volume_24h=volume_24h,
+        )
+
+    def _option_greeks(self, symbols: List[str]) -> Dict[str, Dict[str, float]]:
+        """Calculate Black-Scholes Greeks for several options in one pass.
+
+        Args:
+            symbols: Options symbols (e.g., 'BTC-30JUN23-50000-C')
+
+        Returns:
+            Mapping of symbol to its delta, gamma, theta and vega; malformed
+            symbols are skipped
+        """
+        parsed = [parts for parts in (s.split("-") for s in symbols) if len(parts) == 4]
+        if not parsed:
+            return {}
+
+        now = datetime.now()
+        greeks = options_pricing_service.calculate_greeks_batch(
+            self.DEFAULT_UNDERLYING_PRICE,
+            [float(parts[2]) for parts in parsed],
+            # Listed contracts are still live, so expiry-day ones keep a day
+            [
+                max((datetime.strptime(parts[1], "%d%b%y") - now).days, 1) / 365
+                for parts in parsed
+            ],
+            options_pricing_service.risk_free_rate,
+            self.DEFAULT_VOLATILITY,
+            [parts[3].upper() == "C" for parts in parsed],
+        )
+        return {
+            "-".join(parts): {
+                name: float(greeks[name][i])
+                for name in ("delta", "gamma", "theta", "vega")
+            }
+            for i, parts in enumerate(parsed)
+        }
 
     async def get_option_chain(
         self, underlying: str = "BTC", expiry_days: int = 30
@@ -288,31 +623,30 @@ class DeribitOptionsExchange:
         Returns:
             List of option contracts
         """
-        instruments = await self.get_instruments()
+        await self.get_instruments()
 
         # Filter by underlying and expiry
         target_expiry = datetime.now() + timedelta(days=expiry_days)
 
-        option_chain = []
-        for instrument in instruments:
-            if not instrument.symbol.startswith(underlying):
-                continue
-
-            # Parse expiry from symbol
-            parts = instrument.symbol.split("-")
-            if len(parts) != 4:
+        # Parse each expiry once rather than once per instrument
+        expiry_ok: Dict[str, bool] = {}
+        symbols = []
+        for (currency, _), options in self._index.items():
+            if currency != underlying:
                 continue
-
-            try:
-                expiry = datetime.strptime(parts[1], "%d%b%y")
-                if expiry <= target_expiry:
-                    ticker = await self.get_option_ticker(instrument.symbol)
-                    if ticker:
-                        option_chain.append(ticker)
-            except ValueError:
-                continue
-
-        return option_chain
+            for option in options:
+                ok = expiry_ok.get(option.expiry)
+                if ok is None:
+                    try:
+                        expiry = datetime.strptime(option.expiry, "%d%b%y")
+                        ok = expiry <= target_expiry
+                    except ValueError:
+                        ok = False
+                    expiry_ok[option.expiry] = ok
+                if ok:
+                    symbols.append(option.symbol)
+
+        return await self.get_option_tickers(symbols)
 
     async def stream_options(
         self,
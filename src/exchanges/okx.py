@@ -1,7 +1,7 @@
 import asyncio
 import aiohttp
 from datetime import datetime
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Dict
 from loguru import logger
 
 from .types import Instrument, Ticker
@@ -36,6 +36,8 @@ class OKXExchange:
                 price_precision=1,
             ),
         }
+        # symbol -> in-flight ticker request shared by concurrent callers
+        self._ticker_requests: Dict[str, asyncio.Task] = {}
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -50,6 +52,25 @@ class OKXExchange:
     async def get_ticker(self, symbol: str) -> Ticker | None:
         """Get ticker data for a symbol.
 
+        Concurrent callers for the same symbol share a single request.
+
+        Args:
+            symbol: Trading symbol (e.g., 'BTC-USDT-SPOT')
+
+        Returns:
+            Ticker object or None if failed
+        """
+        request = self._ticker_requests.get(symbol)
+        if request is None:
+            request = asyncio.create_task(self._fetch_ticker(symbol))
+            self._ticker_requests[symbol] = request
+            request.add_done_callback(lambda _: self._ticker_requests.pop(symbol, None))
+        # Shield the shared request from cancellation of any single caller
+        return await asyncio.shield(request)
+
+    async def _fetch_ticker(self, symbol: str) -> Ticker | None:
+        """Fetch ticker data for a symbol from the OKX API.
+
         Args:
             symbol: Trading symbol (e.g., 'BTC-USDT-SPOT')
 
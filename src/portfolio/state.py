@@ -1,6 +1,7 @@
+import heapq
 from dataclasses import dataclass, asdict
 from datetime import datetime
-from typing import Dict, List, Optional, Literal
+from typing import Dict, List, Optional, Literal, Tuple
 from loguru import logger
 
 
@@ -62,6 +63,11 @@ class Portfolio:
         self.positions: Dict[str, Position] = {}
         self.transactions: List[Transaction] = []
         self.created_at = datetime.now()
+        # Bumped on every position change; price-independent metrics are
+        # memoized as (version, value) until the next change
+        self.version = 0
+        self._delta_cache: Optional[Tuple[int, float]] = None
+        self._var_cache: Optional[Tuple[int, float]] = None
 
     def add_position(self, position: Position) -> None:
         """Add or update a position.
@@ -70,6 +76,7 @@ class Portfolio:
             position: Position to add/update
         """
         self.positions[position.symbol] = position
+        self.version += 1
         logger.info(
             f"Added position: {position.symbol} {position.qty} @ {position.avg_px}"
         )
@@ -126,13 +133,9 @@ class Portfolio:
         Returns:
             List of transactions, sorted by timestamp (newest first)
         """
-        sorted_transactions = sorted(
-            self.transactions, key=lambda x: x.timestamp, reverse=True
-        )
-
         if limit:
-            return sorted_transactions[:limit]
-        return sorted_transactions
+            return heapq.nlargest(limit, self.transactions, key=lambda x: x.timestamp)
+        return sorted(self.transactions, key=lambda x: x.timestamp, reverse=True)
 
     def get_transaction_summary(self) -> dict:
         """Get transaction summary statistics.
@@ -189,6 +192,7 @@ class Portfolio:
         """
         position = self.positions.pop(symbol, None)
         if position:
+            self.version += 1
             logger.info(f"Removed position: {symbol}")
         return position
 
@@ -324,6 +328,11 @@ class Portfolio:
         Returns:
             Total delta (positive for net long, negative for net short)
         """
+        if not current_prices:
+            cached = self._delta_cache
+            if cached is not None and cached[0] == self.version:
+                return cached[1]
+
         total_delta = 0.0
 
         for position in self.positions.values():
@@ -338,6 +347,8 @@ class Portfolio:
                 option_delta = self._calculate_option_delta(position, current_prices)
                 total_delta += option_delta
 
+        if not current_prices:
+            self._delta_cache = (self.version, total_delta)
         return total_delta
 
     def _calculate_option_delta(
@@ -541,6 +552,11 @@ class Portfolio:
         Returns:
             95% VaR value
         """
+        if not current_prices:
+            cached = self._var_cache
+            if cached is not None and cached[0] == self.version:
+                return cached[1]
+
         total_notional = 0.0
 
         for position in self.positions.values():
@@ -554,7 +570,10 @@ class Portfolio:
             total_notional += notional
 
         # More realistic VaR: 2% of notional for crypto portfolio
-        return total_notional * 0.02
+        var_95 = total_notional * 0.02
+        if not current_prices:
+            self._var_cache = (self.version, var_95)
+        return var_95
 
     def get_max_drawdown(self) -> float:
         """Calculate maximum drawdown.
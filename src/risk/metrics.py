@@ -1,3 +1,4 @@
+import heapq
 from typing import Dict, List, Any
 from loguru import logger
 
@@ -141,8 +142,8 @@ def calculate_concentration_risk(
     if total_notional == 0:
         return {"largest_position_pct": 0.0, "top_3_concentration": 0.0}
 
-    # Sort by notional size
-    position_sizes.sort(key=lambda x: x[1], reverse=True)
+    # Only the 3 largest positions by notional size are needed
+    position_sizes = heapq.nlargest(3, position_sizes, key=lambda x: x[1])
 
     # Largest position percentage
     largest_position_pct = (
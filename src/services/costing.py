@@ -1,8 +1,34 @@
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Tuple
 from loguru import logger
 import numpy as np
 
 
+@lru_cache(maxsize=1024)
+def _impact_rates(
+    notional: float, instrument_type: str, order_book_depth: float
+) -> Tuple[float, float, float]:
+    """Deterministic slippage rates for a trade, see ``advanced_slippage``.
+
+    Previews of the same trade at a cached price repeat these inputs, so
+    the rates are memoized. The random component is drawn per call.
+
+    Returns:
+        Tuple of (VWAP impact, market impact, spread) rates
+    """
+    # VWAP: assume price impact increases with order size relative to depth
+    vwap_impact = min(0.001 + 0.01 * (notional / order_book_depth), 0.03)  # up to 3%
+    # Market impact: nonlinear for large orders
+    market_impact = 0.0005 * (notional / order_book_depth) ** 1.2
+    # Spread: higher for options, lower for spot
+    spread = (
+        0.0002
+        if instrument_type == "spot"
+        else (0.0005 if instrument_type == "perpetual" else 0.001)
+    )
+    return vwap_impact, market_impact, spread
+
+
 class CostingService:
     """Service for calculating trading costs."""
 
@@ -75,20 +101,11 @@ class CostingService:
     ) -> dict:
         """Advanced slippage model: VWAP, market impact, volatility/randomness."""
         notional = abs(qty * price)
-        # VWAP: assume price impact increases with order size relative to depth
-        vwap_impact = min(
-            0.001 + 0.01 * (notional / order_book_depth), 0.03
-        )  # up to 3%
-        # Market impact: nonlinear for large orders
-        market_impact = 0.0005 * (notional / order_book_depth) ** 1.2
+        vwap_impact, market_impact, spread = _impact_rates(
+            notional, instrument_type, order_book_depth
+        )
         # Volatility/randomness
         random_component = np.random.normal(0, volatility * 0.1)
-        # Spread: higher for options, lower for spot
-        spread = (
-            0.0002
-            if instrument_type == "spot"
-            else (0.0005 if instrument_type == "perpetual" else 0.001)
-        )
         # Total slippage rate
         slippage_rate = vwap_impact + market_impact + spread + random_component
         slippage_rate = max(slippage_rate, 0.0)
@@ -167,6 +184,17 @@ class CostingService:
         costs = self.calculate_total_cost(
             qty, price, exchange, instrument_type, volatility, order_book_depth
         )
+        return self.format_cost_summary(costs)
+
+    def format_cost_summary(self, costs: Dict[str, float]) -> str:
+        """Format costs from ``calculate_total_cost`` as a cost summary.
+
+        Args:
+            costs: Cost breakdown returned by ``calculate_total_cost``
+
+        Returns:
+            Human-readable cost summary
+        """
         slippage_pct = costs["slippage_rate"] * 100
         return (
             f"💰 *Cost Breakdown (Advanced)*\n\n"
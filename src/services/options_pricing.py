@@ -1,9 +1,12 @@
+import heapq
 import math
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 from loguru import logger
 
+import numpy as np
+
 
 @dataclass
 class OptionGreeks:
@@ -53,13 +56,8 @@ class OptionsPricingService:
         if T <= 0:
             return max(S - K, 0)
 
-        d1 = (math.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * math.sqrt(T))
-        d2 = d1 - sigma * math.sqrt(T)
-
-        call_price = S * self._normal_cdf(d1) - K * math.exp(-r * T) * self._normal_cdf(
-            d2
-        )
-        return call_price
+        _, _, nd1, nd2, _ = self._bs_precompute(S, K, T, r, sigma)
+        return S * nd1 - K * math.exp(-r * T) * nd2
 
     def black_scholes_put(
         self, S: float, K: float, T: float, r: float, sigma: float
@@ -79,13 +77,8 @@ class OptionsPricingService:
         if T <= 0:
             return max(K - S, 0)
 
-        d1 = (math.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * math.sqrt(T))
-        d2 = d1 - sigma * math.sqrt(T)
-
-        put_price = K * math.exp(-r * T) * self._normal_cdf(-d2) - S * self._normal_cdf(
-            -d1
-        )
-        return put_price
+        _, _, nd1, nd2, _ = self._bs_precompute(S, K, T, r, sigma)
+        return K * math.exp(-r * T) * (1 - nd2) - S * (1 - nd1)
 
     def calculate_greeks(
         self, S: float, K: float, T: float, r: float, sigma: float, option_type: str
@@ -118,44 +111,88 @@ class OptionsPricingService:
                 vega = 0.0
                 rho = 0.0
         else:
-            d1 = (math.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * math.sqrt(T))
-            d2 = d1 - sigma * math.sqrt(T)
-
-            # Delta
-            if option_type == "call":
-                delta = self._normal_cdf(d1)
-            else:  # put
-                delta = self._normal_cdf(d1) - 1
+            d1, d2, nd1, nd2, pdf_d1 = self._bs_precompute(S, K, T, r, sigma)
+            sqrt_t = math.sqrt(T)
+            discount = K * math.exp(-r * T)
+            # N(d2) for calls, -N(-d2) for puts
+            signed_nd2 = nd2 if option_type == "call" else nd2 - 1
+
+            delta = nd1 if option_type == "call" else nd1 - 1
+            # Gamma and vega are the same for calls and puts
+            gamma = pdf_d1 / (S * sigma * sqrt_t)
+            theta = (
+                -S * pdf_d1 * sigma / (2 * sqrt_t) - r * discount * signed_nd2
+            ) / 365
+            vega = S * sqrt_t * pdf_d1 / 100  # Per 1% vol change
+            rho = discount * T * signed_nd2 / 100  # Per 1% rate change
 
-            # Gamma (same for calls and puts)
-            gamma = self._normal_pdf(d1) / (S * sigma * math.sqrt(T))
+        return OptionGreeks(delta=delta, gamma=gamma, theta=theta, vega=vega, rho=rho)
 
-            # Theta
-            if option_type == "call":
-                theta = (
-                    -S * self._normal_pdf(d1) * sigma / (2 * math.sqrt(T))
-                    - r * K * math.exp(-r * T) * self._normal_cdf(d2)
-                ) / 365
-            else:  # put
-                theta = (
-                    -S * self._normal_pdf(d1) * sigma / (2 * math.sqrt(T))
-                    + r * K * math.exp(-r * T) * self._normal_cdf(-d2)
-                ) / 365
+    def calculate_greeks_batch(
+        self,
+        S,
+        K,
+        T,
+        r: float,
+        sigma,
+        is_call,
+    ) -> Dict[str, np.ndarray]:
+        """Calculate option Greeks for a whole chain in one vectorised pass.
 
-            # Vega (same for calls and puts)
-            vega = S * math.sqrt(T) * self._normal_pdf(d1) / 100  # Per 1% vol change
+        Uses the same conventions as ``calculate_greeks`` (theta per day,
+        vega and rho per 1% change) but evaluates every contract at once,
+        which avoids per-option Python overhead when scanning full chains.
 
-            # Rho
-            if option_type == "call":
-                rho = (
-                    K * T * math.exp(-r * T) * self._normal_cdf(d2) / 100
-                )  # Per 1% rate change
-            else:  # put
-                rho = (
-                    -K * T * math.exp(-r * T) * self._normal_cdf(-d2) / 100
-                )  # Per 1% rate change
+        Args:
+            S: Current underlying price(s)
+            K: Strike price(s)
+            T: Time(s) to expiry (years)
+            r: Risk-free rate
+            sigma: Volatility(ies)
+            is_call: True for calls, False for puts
 
-        return OptionGreeks(delta=delta, gamma=gamma, theta=theta, vega=vega, rho=rho)
+        Returns:
+            Mapping of Greek name to an array with one value per contract
+        """
+        # Deferred so scipy is only loaded when a chain is actually scanned
+        from scipy.special import ndtr
+
+        S, K, T, sigma, is_call = np.broadcast_arrays(
+            np.asarray(S, dtype=float),
+            np.asarray(K, dtype=float),
+            np.asarray(T, dtype=float),
+            np.asarray(sigma, dtype=float),
+            np.asarray(is_call, dtype=bool),
+        )
+        live = T > 0
+        sqrt_t = np.sqrt(np.where(live, T, 1.0))
+        vol = np.where(live, sigma, 1.0)
+
+        d1 = (np.log(S / K) + (r + 0.5 * vol**2) * T) / (vol * sqrt_t)
+        d2 = d1 - vol * sqrt_t
+        nd1 = ndtr(d1)
+        nd2 = ndtr(d2)
+        pdf_d1 = np.exp(-0.5 * d1**2) / math.sqrt(2 * math.pi)
+        discount = K * np.exp(-r * T)
+        # N(d2) for calls, -N(-d2) for puts
+        signed_nd2 = np.where(is_call, nd2, nd2 - 1)
+
+        delta = np.where(is_call, nd1, nd1 - 1)
+        gamma = pdf_d1 / (S * vol * sqrt_t)
+        theta = (-S * pdf_d1 * vol / (2 * sqrt_t) - r * discount * signed_nd2) / 365
+        vega = S * sqrt_t * pdf_d1 / 100
+        rho = discount * T * signed_nd2 / 100
+
+        # At expiry, Greeks are simplified
+        expired_delta = np.where(is_call, (S > K) * 1.0, -((S < K) * 1.0))
+        zero = np.zeros_like(delta)
+        return {
+            "delta": np.where(live, delta, expired_delta),
+            "gamma": np.where(live, gamma, zero),
+            "theta": np.where(live, theta, zero),
+            "vega": np.where(live, vega, zero),
+            "rho": np.where(live, rho, zero),
+        }
 
     def calculate_implied_volatility(
         self,
@@ -185,15 +222,19 @@ class OptionsPricingService:
         # Initial guess
         sigma = 0.5
 
+        sqrt_t = math.sqrt(T)
+        discount = K * math.exp(-r * T)
+
         for _ in range(100):  # Max 100 iterations
+            # Price and vega share the same d1/d2 terms
+            _, _, nd1, nd2, pdf_d1 = self._bs_precompute(S, K, T, r, sigma)
             if option_type == "call":
-                price = self.black_scholes_call(S, K, T, r, sigma)
+                price = S * nd1 - discount * nd2
             else:
-                price = self.black_scholes_put(S, K, T, r, sigma)
+                price = discount * (1 - nd2) - S * (1 - nd1)
 
-            # Calculate vega for Newton-Raphson
-            greeks = self.calculate_greeks(S, K, T, r, sigma, option_type)
-            vega = greeks.vega * 100  # Convert back to per 1 vol change
+            # Vega per 1 vol change for Newton-Raphson
+            vega = S * sqrt_t * pdf_d1
 
             if abs(vega) < 1e-10:
                 break
@@ -328,10 +369,23 @@ class OptionsPricingService:
                 }
             )
 
-        # Sort by effectiveness and cost
-        recommendations.sort(key=lambda x: (-x["effectiveness"], x["cost"]))
+        # Return top 5 recommendations by effectiveness and cost
+        return heapq.nsmallest(
+            5, recommendations, key=lambda x: (-x["effectiveness"], x["cost"])
+        )
+
+    def _bs_precompute(
+        self, S: float, K: float, T: float, r: float, sigma: float
+    ) -> Tuple[float, float, float, float, float]:
+        """Compute the Black-Scholes terms shared by the price and every Greek.
 
-        return recommendations[:5]  # Return top 5 recommendations
+        Returns:
+            Tuple of (d1, d2, N(d1), N(d2), pdf(d1))
+        """
+        sigma_sqrt_t = sigma * math.sqrt(T)
+        d1 = (math.log(S / K) + (r + 0.5 * sigma**2) * T) / sigma_sqrt_t
+        d2 = d1 - sigma_sqrt_t
+        return d1, d2, self._normal_cdf(d1), self._normal_cdf(d2), self._normal_pdf(d1)
 
     def _normal_cdf(self, x: float) -> float:
         """Calculate cumulative distribution function of standard normal."""
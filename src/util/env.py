@@ -37,6 +37,33 @@ def get_telegram_token() -> Optional[str]:
     return os.getenv("TELEGRAM_TOKEN")
 
 
+def get_webhook_url() -> Optional[str]:
+    """Get the public HTTPS URL Telegram should deliver updates to.
+
+    Returns:
+        The webhook URL or None to use long polling
+    """
+    return os.getenv("TELEGRAM_WEBHOOK_URL")
+
+
+def get_webhook_secret() -> Optional[str]:
+    """Get the secret Telegram sends in the X-Telegram-Bot-Api-Secret-Token header.
+
+    Returns:
+        The webhook secret token or None if not set
+    """
+    return os.getenv("TELEGRAM_WEBHOOK_SECRET")
+
+
+def get_webhook_port() -> int:
+    """Get the local port the webhook server listens on.
+
+    Returns:
+        The webhook port (defaults to 8443)
+    """
+    return int(os.getenv("TELEGRAM_WEBHOOK_PORT", "8443"))
+
+
 def validate_environment() -> bool:
     """Validate that all required environment variables are set.
 
@@ -8,6 +8,7 @@ from src.bot.keyboards import (
     decode_callback_data,
     get_main_menu,
     get_back_button,
+    get_confirmation_buttons,
 )
 
 
@@ -82,6 +83,15 @@ def test_back_button():
     assert back_button.callback_data == "back"
 
 
+def test_static_markups_are_reused():
+    """Test that static keyboards are built once and shared."""
+    assert get_back_button() is get_back_button()
+    assert get_confirmation_buttons("hedge") is get_confirmation_buttons("hedge")
+    assert get_confirmation_buttons("hedge") is not get_confirmation_buttons(
+        "portfolio"
+    )
+
+
 @pytest.mark.asyncio
 async def test_bot_start_command():
     """Test bot start command handler."""
@@ -0,0 +1,22 @@
+import numpy as np
+
+from src.services.costing import costing_service
+
+
+def test_cost_summary_formats_one_cost_calculation():
+    np.random.seed(7)
+    summary = costing_service.get_cost_summary(-2.0, 108000.0, "OKX", "spot")
+
+    np.random.seed(7)
+    costs = costing_service.calculate_total_cost(-2.0, 108000.0, "OKX", "spot")
+
+    assert summary == costing_service.format_cost_summary(costs)
+    assert f"Total Cost: ${costs['total_cost']:.2f}" in summary
+
+
+def test_costs_are_consistent():
+    costs = costing_service.calculate_total_cost(1.5, 107950.0, "OKX", "perpetual")
+
+    assert costs["notional"] == 1.5 * 107950.0
+    assert costs["fee"] == costs["notional"] * 0.0005
+    assert costs["total_cost"] == costs["fee"] + costs["slippage"]
@@ -0,0 +1,226 @@
+import asyncio
+
+import pytest
+
+from src.exchanges.deribit_options import DeribitOptionsExchange
+
+INSTRUMENTS = [
+    {"instrument_name": "BTC-11JUL25-110000-P"},
+    {"instrument_name": "BTC-11JUL25-100000-P"},
+    {"instrument_name": "BTC-11JUL25-110000-C"},
+    {"instrument_name": "BTC-25JUL25-120000-C"},
+]
+
+BOOK_SUMMARY = [
+    {
+        "instrument_name": "BTC-11JUL25-100000-P",
+        "last": 0.01,
+        "bid_price": 0.009,
+        "ask_price": 0.011,
+        "volume": 12.0,
+    },
+]
+
+TICKER = {
+    "last_price": 0.02,
+    "best_bid_price": 0.019,
+    "best_ask_price": 0.021,
+    "stats": {"volume": 3.0},
+}
+
+
+class FakeResponse:
+    status = 200
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    async def json(self):
+        return {"result": self.payload}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FailedResponse(FakeResponse):
+    status = 503
+
+
+class SlowResponse(FakeResponse):
+    async def json(self):
+        await asyncio.sleep(1)
+        return await super().json()
+
+
+class FakeSession:
+    def __init__(self, summary_status=200, ticker_response=FakeResponse):
+        self.calls = []
+        self.summary_status = summary_status
+        self.ticker_response = ticker_response
+
+    def get(self, url, params=None):
+        self.calls.append(url.rsplit("/", 1)[-1])
+        if url.endswith("get_instruments"):
+            return FakeResponse(INSTRUMENTS)
+        if url.endswith("ticker"):
+            return self.ticker_response(TICKER)
+        if self.summary_status != 200:
+            return FailedResponse(None)
+        return FakeResponse(BOOK_SUMMARY)
+
+
+def make_exchange(summary_status=200):
+    exchange = DeribitOptionsExchange()
+    exchange.session = FakeSession(summary_status)
+    return exchange
+
+
+def test_instruments_are_cached_and_indexed():
+    exchange = make_exchange()
+
+    async def run():
+        puts = await exchange.get_options("BTC", "P")
+        calls = await exchange.get_options("BTC", "C")
+        await exchange.get_instruments()
+        return puts, calls
+
+    puts, calls = asyncio.run(run())
+
+    assert [i.symbol for i in puts] == [
+        "BTC-11JUL25-110000-P",
+        "BTC-11JUL25-100000-P",
+    ]
+    assert len(calls) == 2
+    assert exchange.session.calls == ["get_instruments"]
+
+
+def test_concurrent_callers_share_one_fetch():
+    exchange = make_exchange()
+
+    async def run():
+        return await asyncio.gather(*(exchange.get_instruments() for _ in range(5)))
+
+    results = asyncio.run(run())
+
+    assert all(len(r) == len(INSTRUMENTS) for r in results)
+    assert exchange.session.calls == ["get_instruments"]
+
+
+def test_options_by_expiry_are_sorted_by_strike():
+    exchange = make_exchange()
+
+    puts = asyncio.run(exchange.get_options_by_expiry("BTC", "P", "11JUL25"))
+
+    assert [p.strike for p in puts] == [100000.0, 110000.0]
+    assert all(p.kind == "P" and p.expiry == "11JUL25" for p in puts)
+
+
+def test_find_option_symbol():
+    exchange = make_exchange()
+
+    async def run():
+        return (
+            await exchange.find_option_symbol("BTC", "C", "11JUL25", 110000.0),
+            await exchange.find_option_symbol("BTC", "P", "25JUL25", 120000.0),
+        )
+
+    assert asyncio.run(run()) == ("BTC-11JUL25-110000-C", None)
+
+
+def test_option_tickers_use_book_summary():
+    exchange = make_exchange()
+
+    contracts = asyncio.run(exchange.get_option_tickers(["BTC-11JUL25-100000-P"]))
+
+    assert len(contracts) == 1
+    assert contracts[0].strike == 100000.0
+    assert contracts[0].bid == 0.009
+    assert contracts[0].ask == 0.011
+    assert -1.0 < contracts[0].delta < 0.0
+    assert exchange.session.calls == ["get_book_summary_by_currency"]
+
+
+def test_batched_greeks_match_single_contract_greeks():
+    exchange = make_exchange()
+    symbols = ["BTC-11JUL25-100000-P", "BTC-11JUL25-110000-C"]
+
+    batched = exchange._option_greeks(symbols)
+
+    for symbol in symbols:
+        assert batched[symbol] == exchange._option_greeks([symbol])[symbol]
+    assert batched["BTC-11JUL25-110000-C"]["delta"] > 0
+    assert batched["BTC-11JUL25-100000-P"]["delta"] < 0
+
+
+def test_option_tickers_fall_back_when_summary_fails():
+    exchange = make_exchange(summary_status=503)
+    symbols = ["BTC-11JUL25-100000-P", "BTC-11JUL25-110000-C"]
+
+    contracts = asyncio.run(exchange.get_option_tickers(symbols))
+
+    assert [c.symbol for c in contracts] == symbols
+    assert all(c.last_price == 0.02 for c in contracts)
+    assert exchange.session.calls == ["get_book_summary_by_currency"] + ["ticker"] * 2
+
+
+def test_option_tickers_time_out_per_request():
+    exchange = make_exchange(summary_status=503)
+    exchange.session.ticker_response = SlowResponse
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(exchange.get_option_tickers(["BTC-11JUL25-100000-P"], timeout=0.01))
+
+
+def test_nested_contexts_share_one_session():
+    exchange = DeribitOptionsExchange()
+
+    async def run():
+        async with exchange:
+            session = exchange.session
+            async with exchange:
+                assert exchange.session is session
+            assert not session.closed
+        return session
+
+    assert asyncio.run(run()).closed
+
+
+def test_instruments_by_expiry_use_the_index():
+    exchange = make_exchange()
+
+    instruments = asyncio.run(exchange.get_instruments_by_expiry("11JUL25"))
+
+    assert sorted((i.option_type, i.strike) for i in instruments) == [
+        ("c", 110000.0),
+        ("p", 100000.0),
+        ("p", 110000.0),
+    ]
+    assert exchange.session.calls == ["get_instruments"]
+
+
+def test_option_ticker_is_cached_and_shared():
+    exchange = make_exchange()
+
+    async def run():
+        first = await asyncio.gather(
+            *(exchange.get_option_ticker("BTC-11JUL25-110000-C") for _ in range(3))
+        )
+        return first, await exchange.get_option_ticker("BTC-11JUL25-110000-C")
+
+    first, again = asyncio.run(run())
+
+    assert all(t is first[0] for t in first)
+    assert again is first[0]
+    assert first[0].last_price == 0.02
+    assert exchange.session.calls == ["ticker"]
+
+
+def test_options_in_range_filter_by_strike():
+    exchange = make_exchange()
+
+    puts = asyncio.run(exchange.get_options_in_range("BTC", "P", 105000.0, 115000.0))
+
+    assert [p.symbol for p in puts] == ["BTC-11JUL25-110000-P"]
@@ -0,0 +1,23 @@
+import math
+
+from src.services.options_pricing import options_pricing_service
+
+
+def test_batch_greeks_match_scalar_greeks():
+    S = 107000.0
+    strikes = [90000.0, 105000.0, 110000.0, 125000.0]
+    expiries = [30 / 365, 7 / 365, 0.0, 90 / 365]
+    kinds = [True, False, True, False]
+
+    batch = options_pricing_service.calculate_greeks_batch(
+        S, strikes, expiries, 0.05, 0.5, kinds
+    )
+
+    for i, (K, T, is_call) in enumerate(zip(strikes, expiries, kinds)):
+        greeks = options_pricing_service.calculate_greeks(
+            S, K, T, 0.05, 0.5, "call" if is_call else "put"
+        )
+        for name in ("delta", "gamma", "theta", "vega", "rho"):
+            assert math.isclose(
+                batch[name][i], getattr(greeks, name), rel_tol=1e-9, abs_tol=1e-12
+            ), (name, i)
@@ -0,0 +1,53 @@
+import asyncio
+
+from src.exchanges.okx import OKXExchange
+
+TICKER = {
+    "ts": "1752000000000",
+    "bidPx": "108000.1",
+    "askPx": "108000.2",
+    "last": "108000.15",
+    "vol24h": "1234.5",
+}
+
+
+class FakeResponse:
+    status = 200
+
+    async def json(self):
+        await asyncio.sleep(0)
+        return {"code": "0", "data": [TICKER]}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    def __init__(self):
+        self.calls = []
+
+    def get(self, url, params=None):
+        self.calls.append(params["instId"])
+        return FakeResponse()
+
+
+def test_concurrent_tickers_share_one_request():
+    exchange = OKXExchange()
+    exchange.session = FakeSession()
+
+    async def run():
+        first = await asyncio.gather(
+            *(exchange.get_ticker("BTC-USDT-PERP") for _ in range(4))
+        )
+        return first, await exchange.get_ticker("BTC-USDT-PERP")
+
+    first, again = asyncio.run(run())
+
+    assert all(t is first[0] for t in first)
+    assert first[0].last_price == 108000.15
+    assert again is not first[0]
+    assert exchange.session.calls == ["BTC-USDT-SWAP", "BTC-USDT-SWAP"]
+    assert exchange._ticker_requests == {}
@@ -0,0 +1,27 @@
+from src.bot import _pick_strikes
+
+STRIKES = [float(k) for k in range(90000, 131000, 1000)]
+
+
+def test_picks_nearest_strikes_inside_band():
+    """Test that put strikes are centred on the current price."""
+    assert _pick_strikes(STRIKES, 108400.0, -3000, 3000) == [
+        106000.0,
+        107000.0,
+        108000.0,
+        109000.0,
+        110000.0,
+    ]
+
+
+def test_tops_up_with_nearest_strikes_outside_band():
+    """Test that a sparse OTM band is filled with the nearest strikes."""
+    strikes = [100000.0, 105000.0, 108000.0, 112000.0, 120000.0, 130000.0]
+
+    assert _pick_strikes(strikes, 108000.0, 1000, 5000) == [
+        100000.0,
+        105000.0,
+        108000.0,
+        112000.0,
+        120000.0,
+    ]
@@ -77,6 +77,23 @@ def test_position_update_fill():
     assert portfolio.get_total_delta() == 0.0
 
 
+def test_metrics_are_recomputed_after_fills():
+    """Test that memoized delta and VaR follow position changes."""
+    portfolio = Portfolio()
+    portfolio.update_fill("BTC-USDT-SPOT", 2.0, 100000.0, "spot", "OKX")
+    assert portfolio.get_total_delta() == 2.0
+    assert portfolio.get_var_95() == 4000.0
+
+    portfolio.update_fill("BTC-USDT-PERP", -0.5, 100000.0, "perpetual", "OKX")
+    assert portfolio.get_total_delta() == 1.5
+    assert portfolio.get_var_95() == 5000.0
+
+    portfolio.update_fill("BTC-USDT-PERP", 0.5, 100000.0, "perpetual", "OKX")
+    assert portfolio.get_total_delta() == 2.0
+    assert portfolio.get_var_95({"BTC-USDT-SPOT": 50000.0}) == 2000.0
+    assert portfolio.get_var_95() == 4000.0
+
+
 def test_portfolio_summary():
     """Test portfolio summary formatting."""
     portfolio = create_test_portfolio()
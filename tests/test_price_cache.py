@@ -0,0 +1,61 @@
+import asyncio
+import os
+from types import SimpleNamespace
+
+os.environ.setdefault("TELEGRAM_TOKEN", "test_token")
+
+from src.bot import SpotHedgerBot
+
+
+class FakeOKX:
+    def __init__(self):
+        self.calls = []
+
+    async def get_ticker(self, symbol):
+        self.calls.append(symbol)
+        await asyncio.sleep(0)
+        return SimpleNamespace(last_price=100.0 + len(self.calls))
+
+
+def make_bot():
+    bot = SpotHedgerBot()
+    bot.okx_fetcher = FakeOKX()
+    return bot
+
+
+def test_concurrent_misses_share_one_fetch():
+    bot = make_bot()
+
+    async def run():
+        return await asyncio.gather(
+            *(bot.get_current_price("BTC-USDT-SPOT") for _ in range(5))
+        )
+
+    prices = asyncio.run(run())
+
+    assert prices == [101.0] * 5
+    assert bot.okx_fetcher.calls == ["BTC-USDT-SPOT"]
+
+
+def test_prices_expire_after_ttl():
+    bot = make_bot()
+
+    async def run():
+        first = await bot.get_current_price("BTC-USDT-PERP")
+        cached = await bot.get_current_price("BTC-USDT-PERP")
+        bot.price_cache_ttl = 0.0
+        return first, cached, await bot.get_current_price("BTC-USDT-PERP")
+
+    assert asyncio.run(run()) == (101.0, 101.0, 102.0)
+    assert len(bot.okx_fetcher.calls) == 2
+
+
+def test_batched_prices_fetch_each_symbol_once():
+    bot = make_bot()
+
+    prices = asyncio.run(
+        bot.get_current_prices(["BTC-USDT-SPOT", "BTC-USDT-PERP", "BTC-USDT-SPOT"])
+    )
+
+    assert set(prices) == {"BTC-USDT-SPOT", "BTC-USDT-PERP"}
+    assert sorted(bot.okx_fetcher.calls) == ["BTC-USDT-PERP", "BTC-USDT-SPOT"]
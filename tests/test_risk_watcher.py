@@ -1,4 +1,5 @@
 import asyncio
+import os
 import types
 
 # Import the SpotHedgerBot class from your bot module
@@ -6,6 +7,8 @@ from src.bot.__init__ import SpotHedgerBot
 
 
 class DummyPortfolio:
+    positions = {"BTC-USDT-SPOT": None}
+
     def get_total_delta(self):
         return 2.0  # Breach delta threshold
 
@@ -43,5 +46,17 @@ async def test_risk_watcher():
     await bot.check_risk_metrics_and_alert()
 
 
+def test_risk_watcher_interval_adapts():
+    os.environ.setdefault("TELEGRAM_TOKEN", "test_token")
+    bot = SpotHedgerBot()
+    assert bot._next_risk_interval() == bot.risk_watcher_idle_interval
+
+    bot.portfolio = DummyPortfolio()
+    assert bot._next_risk_interval() == bot.risk_watcher_interval
+
+    bot.risk_alert_state["var_95"] = True
+    assert bot._next_risk_interval() == bot.risk_watcher_alert_interval
+
+
 if __name__ == "__main__":
     asyncio.run(test_risk_watcher())